@@ -122,12 +122,17 @@ _COLOR_RE = re.compile(
     re.IGNORECASE,
 )
 
+_WHITESPACE_RE = re.compile(r'\s+')
+_TRAILING_PUNCT_RE = re.compile(r'[,.:;]+$')
+_DECIMAL_RE = re.compile(r'\d+[,\.]\d+')
+
+
 def _normalize(name: str) -> str:
     """Deduplication için: boyut spec, renk varyantı ve set suffix kaldır, büyük harfe çevir."""
     result = _COLOR_RE.sub('', name)
     result = _SPEC_RE.sub('', result).upper()
-    result = re.sub(r'\s+', ' ', result).strip()
-    result = re.sub(r'[,.:;]+$', '', result).strip()
+    result = _WHITESPACE_RE.sub(' ', result).strip()
+    result = _TRAILING_PUNCT_RE.sub('', result).strip()
     return result
 
 
@@ -153,7 +158,7 @@ def _score(line: str) -> float:
         score = min(score + 0.05, 0.95)
 
     # Fiyat kalıbı var ama keyword yok → zayıf aday
-    if score == 0.0 and re.search(r'\d+[,\.]\d+', line):
+    if score == 0.0 and _DECIMAL_RE.search(line):
         score = 0.50
 
     # Uzunluk cezası
@@ -192,7 +197,7 @@ def _is_section_header(line: str) -> bool:
     if not alpha:
         return False
     upper_ratio = sum(1 for c in alpha if c.isupper()) / len(alpha)
-    has_price   = bool(re.search(r'\d+[,\.]\d+', s))
+    has_price   = bool(_DECIMAL_RE.search(s))
     digit_ratio = sum(1 for c in s if c.isdigit()) / len(s)
     return upper_ratio > 0.55 and not has_price and digit_ratio < 0.25
 
@@ -1,34 +1,150 @@
 """Proje yapılandırma ayarları."""
 
 import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-# SCRAPING
-REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', 10))
-DOWNLOAD_TIMEOUT = int(os.getenv('DOWNLOAD_TIMEOUT', 30))
-MAX_RETRIES = int(os.getenv('MAX_RETRIES', 1))
-USER_AGENT = os.getenv(
-    'USER_AGENT',
-    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
-    '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-)
-REQUEST_DELAY = float(os.getenv('REQUEST_DELAY', 1.0))
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import List, Tuple
+
+# .env süreç başına bir kez okunur; worker alt süreçleri ortamı miras aldığı
+# için dosyayı tekrar parse etmez.
+if not os.environ.get('_DOTENV_LOADED'):
+    from dotenv import load_dotenv
+    load_dotenv()
+    os.environ['_DOTENV_LOADED'] = '1'
+
+# TİPLİ AYARLAR
+@dataclass(frozen=True)
+class Settings:
+    """Ortam değişkenlerinden import sırasında bir kez okunan tipli ayarlar."""
+    # Scraping
+    request_timeout: int = 10
+    download_timeout: int = 30
+    max_retries: int = 1
+    user_agent: str = (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    )
+    request_delay: float = 1.0
+    # Toplu modda paralel işlenen firma sayısı (her worker kendi scraper'ı)
+    scrape_workers: int = 4
+    # Bir sitenin alt sayfalarından aynı anda çekilen sayfa sayısı
+    crawl_workers: int = 4
+    # Bir firmanın katalog dosyalarından aynı anda indirilen dosya sayısı
+    download_workers: int = 4
+    # Bu kadar katalog bulununca alt sayfa taraması durur (0 = sınırsız)
+    max_catalogs_per_site: int = 20
+    # Strateji sayfa isteklerini ETag/Last-Modified ile diskte önbellekle
+    http_cache: bool = True
+    # 404/410 dönen tahmini yollar bu kadar gün tekrar denenmez (0 = kapalı)
+    missing_url_ttl_days: int = 7
+    # Strateji isteklerinde robots.txt kurallarına uy
+    respect_robots: bool = True
+    # Host başına saniyedeki en fazla strateji isteği (0 = sınırsız)
+    host_rate_limit: float = 8.0
+    # Selenium
+    use_selenium: bool = True
+    selenium_page_timeout: int = 15
+    selenium_implicit_wait: int = 5
+    selenium_js_wait: float = 2.0
+    selenium_headless: bool = True
+    # PDF boyut sınırları (byte)
+    pdf_min_size: int = 10000
+    pdf_max_size: int = 100000000
+
+    @classmethod
+    def _from_env(cls) -> 'Settings':
+        """_SCHEMA'daki değişkenleri tek döngüde okuyup tipine çevirir."""
+        values = {}
+        for env_name, cast in _SCHEMA.items():
+            raw = os.environ.get(env_name)
+            if raw is None:
+                continue
+            try:
+                values[env_name.lower()] = cast(raw)
+            except ValueError:
+                raise ValueError(
+                    f"Geçersiz ortam değişkeni {env_name}={raw!r} "
+                    f"({cast.__name__} bekleniyordu)"
+                ) from None
+        return cls(**values)
+
+
+def _env_bool(raw: str) -> bool:
+    return raw.lower() == 'true'
+
+# Ortam değişkeni -> dönüştürücü. Alan adı değişken adının küçük harflisidir;
+# tanımlı olmayan değişkenler Settings'teki varsayılanı kullanır.
+_SCHEMA = {
+    'REQUEST_TIMEOUT': int,
+    'DOWNLOAD_TIMEOUT': int,
+    'MAX_RETRIES': int,
+    'USER_AGENT': str,
+    'REQUEST_DELAY': float,
+    'SCRAPE_WORKERS': int,
+    'CRAWL_WORKERS': int,
+    'DOWNLOAD_WORKERS': int,
+    'MAX_CATALOGS_PER_SITE': int,
+    'HTTP_CACHE': _env_bool,
+    'MISSING_URL_TTL_DAYS': int,
+    'RESPECT_ROBOTS': _env_bool,
+    'HOST_RATE_LIMIT': float,
+    'USE_SELENIUM': _env_bool,
+    'SELENIUM_PAGE_TIMEOUT': int,
+    'SELENIUM_IMPLICIT_WAIT': int,
+    'SELENIUM_JS_WAIT': float,
+    'SELENIUM_HEADLESS': _env_bool,
+    'PDF_MIN_SIZE': int,
+    'PDF_MAX_SIZE': int,
+}
+
+CFG = Settings._from_env()
+
+# SCRAPING (geriye uyumlu modül sabitleri)
+REQUEST_TIMEOUT = CFG.request_timeout
+DOWNLOAD_TIMEOUT = CFG.download_timeout
+MAX_RETRIES = CFG.max_retries
+USER_AGENT = CFG.user_agent
+REQUEST_DELAY = CFG.request_delay
+SCRAPE_WORKERS = CFG.scrape_workers
+CRAWL_WORKERS = CFG.crawl_workers
+DOWNLOAD_WORKERS = CFG.download_workers
+MAX_CATALOGS_PER_SITE = CFG.max_catalogs_per_site
+HTTP_CACHE = CFG.http_cache
+MISSING_URL_TTL_DAYS = CFG.missing_url_ttl_days
+RESPECT_ROBOTS = CFG.respect_robots
+HOST_RATE_LIMIT = CFG.host_rate_limit
 
 # SELENIUM
-USE_SELENIUM = os.getenv('USE_SELENIUM', 'true').lower() == 'true'
-SELENIUM_PAGE_TIMEOUT = int(os.getenv('SELENIUM_PAGE_TIMEOUT', 15))
-SELENIUM_IMPLICIT_WAIT = int(os.getenv('SELENIUM_IMPLICIT_WAIT', 5))
-SELENIUM_JS_WAIT = float(os.getenv('SELENIUM_JS_WAIT', 2.0))
-SELENIUM_HEADLESS = os.getenv('SELENIUM_HEADLESS', 'true').lower() == 'true'
+USE_SELENIUM = CFG.use_selenium
+SELENIUM_PAGE_TIMEOUT = CFG.selenium_page_timeout
+SELENIUM_IMPLICIT_WAIT = CFG.selenium_implicit_wait
+SELENIUM_JS_WAIT = CFG.selenium_js_wait
+SELENIUM_HEADLESS = CFG.selenium_headless
+
+# Selenium sadece DOM/link/metin okumak için kullanılıyor — görseller ve web
+# fontları hiç indirilmez. CSS engellenmez: lazy-load scroll'u ve
+# IntersectionObserver tabanlı yükleyiciler sayfa yerleşimine ihtiyaç duyar.
+SELENIUM_CHROME_PREFS = {
+    'profile.managed_default_content_settings.images': 2,
+}
+SELENIUM_BLOCKED_URLS = ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot']
 
 # DİZİNLER
 OUTPUT_DIR = r'D:\Sanayi Marketi Output'
-CATALOGS_DIR = os.path.join(OUTPUT_DIR, 'catalogs')
-LOGS_DIR = os.path.join(OUTPUT_DIR, 'logs')
-TESTS_DIR = os.path.join(OUTPUT_DIR, 'tests')
-EXCEL_FILE = os.path.join(OUTPUT_DIR, 'company_data.xlsx')
+OUTPUT_PATH = Path(OUTPUT_DIR)
+CATALOGS_PATH = OUTPUT_PATH / 'catalogs'
+LOGS_PATH = OUTPUT_PATH / 'logs'
+
+# Geriye uyumlu string sabitler
+CATALOGS_DIR = str(CATALOGS_PATH)
+LOGS_DIR = str(LOGS_PATH)
+TESTS_DIR = str(OUTPUT_PATH / 'tests')
+EXCEL_FILE = str(OUTPUT_PATH / 'company_data.xlsx')
+HTTP_CACHE_FILE = str(OUTPUT_PATH / 'http_cache.sqlite')
 
 # JS-HEAVY DOMAINS (requests yetersiz kalıyor, direkt Selenium kullan)
 # Test sırasında yeni JS-heavy site tespit edilince buraya ekle
@@ -41,35 +157,99 @@ JS_HEAVY_DOMAINS = [
 ]
 
 
+def _mkdir_quiet(path: str) -> None:
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        pass
+
+
+def prepare_company_dirs(base_dir: str, names: List[str]) -> List[str]:
+    """
+    Firma klasörlerini toplu olarak oluşturur ve yollarını döndürür.
+
+    Önce üst dizin bir kez `os.makedirs` ile hazırlanır, ardından her firma
+    için tek bir `os.mkdir` çağrısı yapılır. mkdir süresi neredeyse tamamen
+    syscall gecikmesi olduğu (GIL bırakılır) için çağrılar thread havuzunda
+    paralel yürütülür.
+
+    Args:
+        base_dir: Firma klasörlerinin oluşturulacağı dizin
+        names: Dosya sistemi için güvenli hale getirilmiş firma adları
+    """
+    os.makedirs(base_dir, exist_ok=True)
+    paths = [os.path.join(base_dir, name) for name in dict.fromkeys(names)]
+    if len(paths) <= 1:
+        for path in paths:
+            _mkdir_quiet(path)
+        return paths
+    with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+        # list() ile tüketilir ki olası hatalar (izin vb.) yutulmasın
+        list(executor.map(_mkdir_quiet, paths))
+    return paths
+
+
 class RunSession:
-    """Tarih bazlı oturum yönetimi."""
+    """
+    Tarih bazlı oturum yönetimi.
+
+    Thread-safe singleton: `RunSession()` / `get_instance()` her zaman aynı
+    oturumu döndürür; paralel çalışan scraper thread'leri yarışa girip iki
+    ayrı katalog dizini / Excel dosyası oluşturamaz. Yeni oturum sadece
+    `create_new()` ile açılır.
+    """
     _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, timestamp: str = None):
+        # Double-checked locking: kilit sadece ilk oluşturmada alınır
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
+        return cls._instance
 
     def __init__(self, timestamp: str = None):
-        from datetime import datetime
+        if getattr(self, '_initialized', False):
+            return
+        with self._lock:
+            if getattr(self, '_initialized', False):
+                return
+            self._setup(timestamp)
+
+    def _setup(self, timestamp: str = None) -> None:
+        """Oturum dizinlerini hazırlar (çağıran `_lock`'u tutmalıdır)."""
         self.timestamp = timestamp or datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-        self.catalogs_dir = os.path.join(CATALOGS_DIR, self.timestamp)
-        self.excel_file = os.path.join(OUTPUT_DIR, f'company_data_{self.timestamp}.xlsx')
+        self.catalogs_dir = str(CATALOGS_PATH / self.timestamp)
+        self.excel_file = str(OUTPUT_PATH / f'company_data_{self.timestamp}.xlsx')
         os.makedirs(self.catalogs_dir, exist_ok=True)
-        os.makedirs(LOGS_DIR, exist_ok=True)
+        os.makedirs(LOGS_PATH, exist_ok=True)
+        self._initialized = True
 
     @classmethod
     def get_instance(cls) -> 'RunSession':
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        return cls()
 
     @classmethod
-    def create_new(cls) -> 'RunSession':
-        cls._instance = cls()
-        return cls._instance
+    def create_new(cls, timestamp: str = None) -> 'RunSession':
+        """Mevcut oturumu bırakıp yeni bir oturum açar (batch başlangıcında)."""
+        # Yeni örnek kilit tutulurken kurulur; arada çağrılan `RunSession()`
+        # varsayılan zaman damgalı ayrı bir oturum oluşturamaz
+        with cls._lock:
+            instance = super().__new__(cls)
+            instance._setup(timestamp)
+            cls._instance = instance
+        return instance
 
     def __str__(self) -> str:
         return f"RunSession({self.timestamp})"
 
 
 # KATALOG AYARLARI
-VALID_EXTENSIONS = ['.pdf', '.doc', '.docx', '.xls', '.xlsx']
+# Sadece üyelik/iterasyon için kullanılan sabitler frozenset (O(1) `in`)
+VALID_EXTENSIONS = frozenset({'.pdf', '.doc', '.docx', '.xls', '.xlsx'})
+# str.endswith tuple kabul eder — tüm uzantılar tek çağrıda kontrol edilir
+VALID_EXTENSIONS_TUPLE = tuple(sorted(VALID_EXTENSIONS))
 
 CATALOG_KEYWORDS = [
     'katalog', 'catalog', 'catalogue', 'urun', 'ürün', 'product', 'products',
@@ -84,6 +264,11 @@ CATALOG_PAGE_KEYWORDS = [
     'literatur', 'literature', 'kaynaklar', 'resources'
 ]
 
+# Eşleştirme için hazır (küçük harfli, değişmez) kopyalar — çağıranlar her
+# link/sayfa için listeyi tekrar küçültmek veya tuple'a çevirmek zorunda kalmaz
+CATALOG_KEYWORDS_LOWER = tuple(k.lower() for k in CATALOG_KEYWORDS)
+CATALOG_PAGE_KEYWORDS_LOWER = tuple(k.lower() for k in CATALOG_PAGE_KEYWORDS)
+
 # PDF FİLTRELEME
 PDF_POSITIVE_KEYWORDS = [
     'katalog', 'katalogu', 'brosur', 'broşür', 'fiyat-listesi', 'fiyat_listesi',
@@ -150,8 +335,89 @@ PDF_NEGATIVE_KEYWORDS = [
     'internet_sitesi',                          # web sitesi teknik rehber belgesi
 ]
 
-PDF_MIN_SIZE = int(os.getenv('PDF_MIN_SIZE', 10000))
-PDF_MAX_SIZE = int(os.getenv('PDF_MAX_SIZE', 100000000))
+
+
+def _trie_pattern(node: dict) -> str:
+    """Prefix ağacını (char -> alt düğüm, '' = kelime sonu) regex'e çevirir."""
+    alternatives = [re.escape(ch) + _trie_pattern(child)
+                    for ch, child in sorted(node.items()) if ch]
+    if not alternatives:
+        return ''
+    is_word_end = '' in node
+    if len(alternatives) == 1 and not is_word_end:
+        return alternatives[0]
+    group = '(?:' + '|'.join(alternatives) + ')'
+    # Kelime burada bitebiliyorsa devamı opsiyonel (greedy: en uzun kelime)
+    return group + '?' if is_word_end else group
+
+
+def keyword_re(words) -> 're.Pattern':
+    """
+    Anahtar kelime listesini tek bir derlenmiş regex'e çevirir.
+
+    Kelimeler prefix ağacı (trie) şeklinde gruplanır: düz `a|b|c|...`
+    alternation'da `re` her pozisyonda tüm kelimeleri tek tek dener,
+    trie biçiminde ise ilk karakter eşleşmeyen pozisyon tek karşılaştırmayla
+    elenir. Böylece keyword içermeyen (çoğunluk) URL'ler hızlı geçer.
+    Aynı pozisyonda birden fazla kelime eşleşirse en uzunu döner.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word.lower():
+            node = node.setdefault(ch, {})
+        node[''] = {}
+    return re.compile(_trie_pattern(trie))
+
+
+# Türkçe karakter katlama tablosu — eşleştirilen metin de aynı şekilde
+# normalize edildiği için keyword'ler de build sırasında katlanır.
+_NORM_TABLE = str.maketrans({
+    'İ': 'i', 'I': 'i', 'ı': 'i',
+    'Ğ': 'g', 'ğ': 'g',
+    'Ü': 'u', 'ü': 'u',
+    'Ş': 's', 'ş': 's',
+    'Ö': 'o', 'ö': 'o',
+    'Ç': 'c', 'ç': 'c',
+})
+
+
+def norm(text: str) -> str:
+    """
+    Metni keyword eşleştirme formuna getirir (Türkçe katlama + lowercase).
+
+    Türkçe İ/i ve I/ı harfleri Python'ın standart lower() fonksiyonu ile
+    düzgün dönüşmez; tablo modül yüklenirken bir kez kurulur.
+    """
+    return text.translate(_NORM_TABLE).lower()
+
+
+def _canonical_keywords(words) -> frozenset:
+    """
+    Substring eşleşmesi için minimal keyword kümesini üretir.
+
+    Diakritik varyantları ('şart'/'sart') katlandıktan sonra tekilleşir;
+    başka bir keyword'ü zaten içeren keyword'ler ('politikasi' ⊃ 'politika',
+    'ohsas_18001' ⊃ 'ohsas') any() sonucunu değiştirmediği için atılır.
+    '-'/'_' ayraçları bilerek korunur: 'pec_' → 'pec' gibi bir kısaltma
+    'spec' içeren katalogları da reddederdi.
+    """
+    folded = {norm(w) for w in words}
+    return frozenset(w for w in folded
+                     if not any(other != w and other in w for other in folded))
+
+
+# Negatif keyword eşleştirici: PDF_NEGATIVE_RE.search(text) -> Match | None
+# Aranan metin norm() ile normalize edilmiş olmalı.
+_NEG_CANON = _canonical_keywords(PDF_NEGATIVE_KEYWORDS)
+PDF_NEGATIVE_RE = keyword_re(_NEG_CANON)
+
+# Pozitif keyword eşleştirici (aynı normalize edilmiş metin üzerinde)
+_POS_CANON = _canonical_keywords(PDF_POSITIVE_KEYWORDS)
+PDF_POSITIVE_RE = keyword_re(_POS_CANON)
+
+PDF_MIN_SIZE = CFG.pdf_min_size
+PDF_MAX_SIZE = CFG.pdf_max_size
 
 # SERTİFİKA KURULUŞU DOSYA ADI FİLTRELERİ
 # should_download_url() içinde from_catalog_page'den önce kontrol edilir —
@@ -180,19 +446,24 @@ CERT_FILENAME_PATTERNS = [
     '-certs-', '_certs_', '-certs.',           # Genel sertifika adlandırma pattern'i
 ]
 
+# Dosya başına tek kontrol: prefix'ler str.startswith(tuple), pattern'ler tek regex
+CERT_BODY_FILENAME_PREFIXES_TUPLE = tuple(CERT_BODY_FILENAME_PREFIXES)
+CERT_FILENAME_RE = keyword_re(CERT_FILENAME_PATTERNS)
+
 # İLETİŞİM
 CONTACT_KEYWORDS = [
     'iletisim', 'iletişim', 'contact', 'contactus', 'contact-us',
     'hakkimizda', 'hakkımızda', 'about', 'aboutus', 'about-us',
     'kurumsal', 'corporate', 'bize-ulasin', 'bizeulasin', 'ulasim', 'ulaşım'
 ]
+CONTACT_KEYWORDS_LOWER = tuple(k.lower() for k in CONTACT_KEYWORDS)
 
 PHONE_LABELS = [
     'tel', 'telefon', 'gsm', 'cep', 'mobil', 'sabit', 'santral',
     'phone', 'mobile', 'cell', 'call', 'handy', 't:', 'p:'
 ]
 
-FAX_LABELS = ['fax', 'faks', 'belgegecer', 'belgegeçer', 'f:']
+FAX_LABELS = frozenset({'fax', 'faks', 'belgegecer', 'belgegeçer', 'f:'})
 
 EMAIL_LABELS = [
     'email', 'e-mail', 'e-posta', 'eposta', 'mail', 'iletisim',
@@ -205,8 +476,9 @@ ADDRESS_LABELS = [
     'headquarters', 'hq', 'office', 'branch', 'konum', 'yer'
 ]
 
-EMAIL_EXCLUDE_DOMAINS = ['example.com', 'test.com', 'domain.com', 'email.com', 'yoursite.com']
-EMAIL_EXCLUDE_EXTENSIONS = ['.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp']
+EMAIL_EXCLUDE_DOMAINS = frozenset({'example.com', 'test.com', 'domain.com', 'email.com', 'yoursite.com'})
+EMAIL_EXCLUDE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp'})
+EMAIL_EXCLUDE_EXTENSIONS_TUPLE = tuple(sorted(EMAIL_EXCLUDE_EXTENSIONS))
 
 # REGEX
 PHONE_PATTERN = r'(?:(?:\+90|0090|90|0)[\s\.\-\/]?)?(?:\(?\d{3}\)?[\s\.\-\/]?)\d{3}[\s\.\-\/]?\d{2}[\s\.\-\/]?\d{2}'
@@ -221,14 +493,58 @@ PHONE_PATTERNS = [
     r'\b0[1-5]\d{9}\b',
 ]
 
-EMAIL_PATTERN = r'[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}'
-
-INVALID_PHONE_STARTS = [
+# Local-part / domain uzunlukları RFC 5321 sınırlarıyla (64 / 253) kısıtlı:
+# '@' içermeyen uzun base64/minified JS bloklarında sınırsız `+` her başlangıç
+# pozisyonundan satır sonuna kadar tarayıp O(n²) backtracking'e düşüyordu.
+EMAIL_PATTERN = r'[a-zA-Z0-9._%+\-]{1,64}@[a-zA-Z0-9.\-]{1,253}\.[a-zA-Z]{2,}'
+
+# Derlenmiş regex'ler — çağıranlar re.findall(PATTERN, ...) yerine bunları kullanmalı
+PHONE_RE = re.compile(PHONE_PATTERN)
+PHONE_RES = tuple(re.compile(p) for p in PHONE_PATTERNS)
+# Serbest metin taraması için sol sınır: eşleşme ancak local-part karakter
+# dizisinin başından başlayabilir. Lookbehind tek karakterlik kontrolle dizinin
+# ortasındaki her pozisyonu eler; aksi halde her pozisyon `{1,64}` kadar
+# ileri tarayıp '@' arardı. (EMAIL_PATTERN label pattern'larına gömüldüğü için
+# sınır sadece derlenmiş regex'e eklenir.)
+EMAIL_RE = re.compile(r'(?<![a-zA-Z0-9._%+\-])' + EMAIL_PATTERN)
+
+# Telefon taraması sırası: önce spesifik PHONE_PATTERNS, en son genel PHONE_PATTERN
+_PHONE_SCAN_RES = PHONE_RES + (PHONE_RE,)
+
+# Tüm telefon pattern'ları sadece rakam, boşluk ve `+ ( ) . / -` karakterlerinden
+# oluşan, '+', '(' veya rakamla başlayan ve en az 10 rakam içeren parçaları
+# eşler. Bu bölge regex'i metni tek geçişte tarar; pattern'lar sadece bulunan
+# aday bölgelerde çalışır.
+_PHONE_REGION_RE = re.compile(r'[+(\d](?:[\d+()./\s-]*\d)?')
+_PHONE_MIN_REGION = 10
+
+
+def scan_phones(text: str) -> List[Tuple[int, int]]:
+    """
+    Metindeki telefon adaylarının (start, end) aralıklarını döndürür.
+
+    Sonuç, her pattern'ı tüm metinde ayrı ayrı çalıştırmakla birebir aynıdır
+    (önce pattern sırası, sonra metin içi konum) ama metnin tamamı sadece bir
+    kez taranır. Pattern'lar aday bölgeler üzerinde `pos/endpos` ile çalışır;
+    bölgenin sonuna bir karakter eklenir ki `\b` ve opsiyonel son ayraç
+    gerçek metne göre değerlendirilsin.
+    """
+    regions = [(m.start(), m.end() + 1) for m in _PHONE_REGION_RE.finditer(text)
+               if m.end() - m.start() >= _PHONE_MIN_REGION]
+    return [m.span()
+            for rx in _PHONE_SCAN_RES
+            for start, end in regions
+            for m in rx.finditer(text, start, end)]
+
+
+INVALID_PHONE_STARTS = frozenset({
     '0000', '1111', '2222', '3333', '4444', '5555', '6666', '7777', '8888', '9999',
     '1234', '0123', '9876', '0900', '0800',
-]
+})
+# str.startswith(tuple) için
+INVALID_PHONE_STARTS_TUPLE = tuple(sorted(INVALID_PHONE_STARTS))
 
-VALID_AREA_CODES = [
+VALID_AREA_CODES = frozenset({
     '212', '216', '312', '232', '224', '242', '322', '342', '262', '324',
     '352', '222', '258', '236', '264', '362', '462', '412', '414', '422',
     '442', '274', '252', '284', '266', '372', '332', '226', '288', '286',
@@ -237,13 +553,13 @@ VALID_AREA_CODES = [
     '540', '541', '542', '543', '544', '545', '546', '547', '548', '549',
     '550', '551', '552', '553', '554', '555', '556', '557', '558', '559',
     '501', '505', '506', '507',
-]
+})
 
 # EXCEL
-EXCEL_COLUMNS = [
+EXCEL_COLUMNS = (
     'company_name', 'website', 'sectors', 'phone', 'email',
     'address', 'catalog_count', 'catalog_files', 'status', 'scrape_date'
-]
+)
 
 EXCEL_HEADERS = {
     'company_name': 'Firma Adı', 'website': 'Web Sitesi', 'sectors': 'Sektörler',
@@ -252,6 +568,9 @@ EXCEL_HEADERS = {
     'status': 'Durum', 'scrape_date': 'Tarih'
 }
 
+# EXCEL_COLUMNS sırasıyla Türkçe başlık satırı
+EXCEL_HEADER_ROW = tuple(EXCEL_HEADERS[col] for col in EXCEL_COLUMNS)
+
 # STATUS
 STATUS_SUCCESS = 'SUCCESS'
 STATUS_PARTIAL = 'PARTIAL'
@@ -12,6 +12,9 @@ Kullanım:
 import os
 import sys
 import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Windows terminal'de UTF-8 karakterlerin doğru yazılması için
 if sys.stdout.encoding and sys.stdout.encoding.lower() not in ('utf-8', 'utf8'):
@@ -34,7 +37,9 @@ from config.settings import (
     STATUS_PARTIAL,
     STATUS_FAILED,
     STATUS_ERROR,
-    RunSession
+    SCRAPE_WORKERS,
+    RunSession,
+    prepare_company_dirs
 )
 from scrapers import GenericScraper
 from utils import ExcelWriter, JSONWriter, get_logger
@@ -47,6 +52,12 @@ from utils.logger import (
 )
 from utils.validators import validate_company_data
 
+# orjson opsiyonel: varsa firma listesi C parser ile okunur
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Logger'ı başlat
 logger = get_logger('main')
 
@@ -63,8 +74,13 @@ def load_companies(json_path: str = 'config/companies.json') -> List[Dict[str, s
         logger.error(f"Firma listesi bulunamadı: {json_path}")
         raise FileNotFoundError(f"Dosya bulunamadı: {json_path}")
 
-    with open(json_path, 'r', encoding='utf-8') as f:
-        companies = json.load(f)
+    if orjson is not None:
+        # orjson.JSONDecodeError, json.JSONDecodeError'ın alt sınıfı
+        with open(json_path, 'rb') as f:
+            companies = orjson.loads(f.read())
+    else:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            companies = json.load(f)
 
     if not companies:
         logger.warning("Firma listesi boş!")
@@ -94,11 +110,28 @@ def print_banner() -> None:
     print(banner)
 
 
+# Progress bar yeniden çizimleri arası minimum süre (saniye)
+PROGRESS_MIN_INTERVAL = 0.05
+_progress_last_draw = 0.0
+
+
 def print_progress_bar(current: int, total: int, width: int = 40) -> None:
-    """Console'da progress bar gösterir."""
+    """
+    Console'da progress bar gösterir.
+
+    Ardışık çağrılar PROGRESS_MIN_INTERVAL içinde gelirse çizim atlanır;
+    ilk ve son durum her zaman yazılır.
+    """
+    global _progress_last_draw
+
     if total == 0:
         return
 
+    now = time.monotonic()
+    if 0 < current < total and now - _progress_last_draw < PROGRESS_MIN_INTERVAL:
+        return
+    _progress_last_draw = now
+
     percentage = current / total
     filled = int(width * percentage)
     bar = '█' * filled + '░' * (width - filled)
@@ -262,35 +295,68 @@ def process_batch(companies: List[Dict[str, str]]) -> None:
 
     tracker = ProgressTracker(total_companies)
     excel_writer = ExcelWriter(file_path=session.excel_file)
-    results: List[Dict[str, Any]] = []
-
-    with GenericScraper(catalogs_dir=session.catalogs_dir) as scraper:
-        for i, company in enumerate(companies, 1):
-            company_name = company.get('company_name', 'Bilinmeyen')
-
-            # Progress göstergesi
-            print_progress_bar(i, total_companies)
-            log_company_start(logger, company_name, i, total_companies)
-
-            # Firmayı işle
-            result = process_company(scraper, company)
-            results.append(result)
+    results: List[Optional[Dict[str, Any]]] = [None] * total_companies
+
+    # Firmalar ağ I/O'su ağırlıklı — worker thread'lerde paralel işlenir.
+    # Selenium driver'ı ve requests session'ı thread-safe olmadığı için her
+    # worker kendi GenericScraper'ını kullanır.
+    worker_count = max(1, min(SCRAPE_WORKERS, total_companies))
+    local = threading.local()
+    scrapers: List[GenericScraper] = []
+    state_lock = threading.Lock()
+    started = 0
+
+    def get_scraper() -> GenericScraper:
+        scraper = getattr(local, 'scraper', None)
+        if scraper is None:
+            scraper = GenericScraper(catalogs_dir=session.catalogs_dir)
+            local.scraper = scraper
+            with state_lock:
+                scrapers.append(scraper)
+        return scraper
+
+    def run_company(company: Dict[str, str]) -> Dict[str, Any]:
+        nonlocal started
+        with state_lock:
+            started += 1
+            log_company_start(logger, company.get('company_name', 'Bilinmeyen'),
+                              started, total_companies)
+        return process_company(get_scraper(), company)
+
+    logger.info(f"{worker_count} worker ile işleniyor")
+    print_progress_bar(0, total_companies)
 
-            # Sonucu logla
-            log_company_result(
-                logger,
-                company_name,
-                result['status'],
-                result.get('catalog_count', 0),
-                bool(result.get('phone') or result.get('email'))
-            )
-
-            # Tracker güncelle
-            tracker.increment(result['status'])
-
-            # Excel'e ekle (sadece geçerli olanlar)
-            if validate_company_data(result):
-                excel_writer.append_company(result)
+    try:
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            futures = {
+                executor.submit(run_company, company): i
+                for i, company in enumerate(companies)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                result = future.result()
+                results[index] = result
+
+                # Sonucu logla
+                log_company_result(
+                    logger,
+                    companies[index].get('company_name', 'Bilinmeyen'),
+                    result['status'],
+                    result.get('catalog_count', 0),
+                    bool(result.get('phone') or result.get('email'))
+                )
+
+                # Tracker ve progress güncelle (sadece bu thread yazar)
+                tracker.increment(result['status'])
+                print_progress_bar(tracker.current, total_companies)
+    finally:
+        for scraper in scrapers:
+            scraper.close()
+
+    # Excel'e ekle (sadece geçerli olanlar) — girdi sırası korunur
+    for result in results:
+        if result is not None and validate_company_data(result):
+            excel_writer.append_company(result)
 
     print("\n")
 
@@ -406,6 +472,13 @@ def process_test_run(test_num: int, companies: List[Dict[str, str]]) -> None:
 
     results: List[Dict[str, Any]] = []
 
+    # Test modunda her firmanın klasörü olur — hepsini baştan tek seferde aç
+    from utils.validators import sanitize_filename
+    prepare_company_dirs(
+        test_dir,
+        [sanitize_filename(c.get('company_name', 'Bilinmeyen')) for c in companies]
+    )
+
     with GenericScraper(catalogs_dir=test_dir) as scraper:
         for i, company in enumerate(companies, 1):
             company_name = company.get('company_name', 'Bilinmeyen')
@@ -426,9 +499,7 @@ def process_test_run(test_num: int, companies: List[Dict[str, str]]) -> None:
             print(f"  → {status} | katalog: {catalog_count} | tel: {'✓' if phone else '✗'} | email: {'✓' if email else '✗'} | lokasyon: {location_str} | logo: {logo} | açıklama: {desc}")
 
             # JSON kaydet
-            from utils.validators import sanitize_filename
             company_dir = os.path.join(test_dir, sanitize_filename(company_name))
-            os.makedirs(company_dir, exist_ok=True)
             if status in [STATUS_SUCCESS, STATUS_PARTIAL]:
                 JSONWriter.save_company(result, company_dir)
 
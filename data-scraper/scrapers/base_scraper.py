@@ -1,16 +1,21 @@
 """Tüm scraper'lar için abstract base class."""
 
+import re
 import time
 import warnings
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # BeautifulSoup XML uyarılarını bastır
 warnings.filterwarnings('ignore', category=UserWarning, module='bs4')
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Sequence, Set
 from urllib.parse import urljoin, urlparse
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 # Selenium imports
 from selenium import webdriver
@@ -27,27 +32,112 @@ try:
         MAX_RETRIES,
         USER_AGENT,
         REQUEST_DELAY,
+        CRAWL_WORKERS,
+        DOWNLOAD_WORKERS,
         USE_SELENIUM,
         SELENIUM_PAGE_TIMEOUT,
         SELENIUM_IMPLICIT_WAIT,
         SELENIUM_JS_WAIT,
-        SELENIUM_HEADLESS
+        SELENIUM_HEADLESS,
+        SELENIUM_CHROME_PREFS,
+        SELENIUM_BLOCKED_URLS,
+        keyword_re
     )
 except ImportError:
     REQUEST_TIMEOUT = 10
     MAX_RETRIES = 3
     USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
     REQUEST_DELAY = 1.0
+    CRAWL_WORKERS = 4
+    DOWNLOAD_WORKERS = 4
     USE_SELENIUM = True
     SELENIUM_PAGE_TIMEOUT = 15
     SELENIUM_IMPLICIT_WAIT = 5
     SELENIUM_JS_WAIT = 2.0
     SELENIUM_HEADLESS = True
+    SELENIUM_CHROME_PREFS = {'profile.managed_default_content_settings.images': 2}
+    SELENIUM_BLOCKED_URLS = []
+
+    def keyword_re(words):
+        return re.compile('|'.join(re.escape(w.lower()) for w in words))
 
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Satır sonu, tab ve ardışık boşluk grupları (clean_text)
+_WS_RE = re.compile(r'\s+')
+
+# <meta charset="..."> / <meta http-equiv=... content="...; charset=...">
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.I)
+
+
+@lru_cache(maxsize=32)
+def _keywords_re(keywords: tuple, token_start: bool = False) -> 're.Pattern':
+    """
+    Keyword listesi için derlenmiş regex (aynı liste tekrar derlenmez).
+
+    token_start=True ise keyword ancak bir URL parçasının (token) başında
+    eşleşir: önündeki karakter harf/rakam olamaz (`/`, `-`, `_`, `.`, `?`
+    vb. ayırıcılar serbest). Böylece `/kataloglar` ve `/e-katalog` yakalanır,
+    `stilistik` içindeki `liste` veya `inspection` içindeki `spec` yakalanmaz.
+    """
+    pattern = keyword_re(keywords)
+    if token_start:
+        # [^\W_] = Unicode harf veya rakam
+        pattern = re.compile(r'(?<![^\W_])' + pattern.pattern)
+    return pattern
+
+
+def _decode_html(response: requests.Response) -> str:
+    """
+    HTML yanıtını metne çevirir; charset tespiti için tüm gövdeyi taramaz.
+
+    Sıra: Content-Type charset'i → sayfa başındaki <meta charset> → UTF-8.
+    Bildirilen/varsayılan kodlama gövdeyi çözemezse (ör. bildirimsiz
+    windows-1254 sayfa) ancak o zaman apparent_encoding ile tespit yapılır.
+    """
+    if 'charset=' in response.headers.get('Content-Type', '').lower():
+        return response.text
+
+    content = response.content
+    match = _META_CHARSET_RE.search(content, 0, 4096)
+    encoding = match.group(1).decode('ascii') if match else 'utf-8'
+    try:
+        return content.decode(encoding)
+    except (UnicodeDecodeError, LookupError):
+        response.encoding = response.apparent_encoding or 'utf-8'
+        return response.text
+
+# Aynı sayfa/host için resolve_url ve get_base_url yüzlerce kez aynı
+# argümanlarla çağrılıyor (her <a> için) — saf fonksiyonlar, sonuçlar önbellekli.
+@lru_cache(maxsize=4096)
+def _base_url(url: str) -> str:
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+@lru_cache(maxsize=16384)
+def _resolve_url(base_url: str, relative_url: str) -> str:
+    # Wix CMS internal URL → CDN URL dönüşümü
+    # Örnek: wix:document://v1/ugd/1a45e3_HASH.pdf/DisplayName.pdf
+    # → https://static.wixstatic.com/ugd/1a45e3_HASH.pdf
+    if relative_url.startswith('wix:document://v1/ugd/'):
+        ugd_path = relative_url[len('wix:document://v1/ugd/'):]
+        file_hash = ugd_path.split('/')[0]  # e.g. "1a45e3_abc123.pdf"
+        if file_hash.lower().endswith('.pdf'):
+            return f"https://static.wixstatic.com/ugd/{file_hash}"
+        return ''
+
+    # Backslash-escaped path normalizasyonu (Wix/CMS JS çıktısından gelir)
+    # \/GUID\/hash-name.pdf → /GUID/hash-name.pdf
+    if '\\/' in relative_url:
+        relative_url = relative_url.replace('\\/', '/')
+
+    if relative_url.startswith(('http://', 'https://')):
+        return relative_url
+    return urljoin(base_url, relative_url)
+
 
 class BaseScraper(ABC):
     """Tüm scraper'lar için abstract base class."""
@@ -61,6 +151,26 @@ class BaseScraper(ABC):
         # Session oluştur (connection pooling için)
         self.session = requests.Session()
 
+        # Yeniden deneme urllib3 katmanında: bağlantı hatası, okuma zaman aşımı
+        # ve 5xx yanıtlarda tekrar istenir (ilk tekrar hemen, sonrakiler artan
+        # beklemeyle: 1s, 2s, ...).
+        # Havuz, fetch_pages'in eşzamanlı isteklerini ve (session'ı paylaşan)
+        # katalog indirmelerini karşılayacak boyutta.
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=0.5,
+            status_forcelist=list(range(500, 600)),
+            allowed_methods=['GET', 'HEAD'],
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=max(10, CRAWL_WORKERS, DOWNLOAD_WORKERS),
+            max_retries=retry
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
         # Default headers
         self.session.headers.update({
             'User-Agent': USER_AGENT,
@@ -74,6 +184,10 @@ class BaseScraper(ABC):
         # Selenium driver (lazy initialization)
         self._selenium_driver: Optional[webdriver.Chrome] = None
 
+        # Sunucunun 404/410 döndüğü URL'ler — JS render'ı bunları kurtaramaz,
+        # fetch_page_with_js bu URL'ler için tarayıcı açmaz
+        self._missing_urls: Set[str] = set()
+
     def _init_selenium_driver(self) -> Optional[webdriver.Chrome]:
         """Selenium WebDriver'ı başlatır."""
         if not USE_SELENIUM:
@@ -97,6 +211,9 @@ class BaseScraper(ABC):
             chrome_options.add_argument('--log-level=3')
             chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
 
+            # Görselleri yükleme (sadece DOM okunuyor)
+            chrome_options.add_experimental_option('prefs', SELENIUM_CHROME_PREFS)
+
             # Eager loading: DOM hazır olunca devam et (timeout azaltır)
             chrome_options.page_load_strategy = 'eager'
 
@@ -106,6 +223,14 @@ class BaseScraper(ABC):
             driver.set_page_load_timeout(SELENIUM_PAGE_TIMEOUT)
             driver.implicitly_wait(SELENIUM_IMPLICIT_WAIT)
 
+            # Web fontlarını ağ katmanında engelle (Chrome'da font pref'i yok)
+            if SELENIUM_BLOCKED_URLS:
+                try:
+                    driver.execute_cdp_cmd('Network.enable', {})
+                    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': SELENIUM_BLOCKED_URLS})
+                except Exception as e:
+                    logger.debug(f"Font engelleme uygulanamadı: {e}")
+
             logger.debug("Selenium driver başlatıldı")
             return driver
 
@@ -113,6 +238,29 @@ class BaseScraper(ABC):
             logger.debug(f"Selenium driver başlatılamadı: {e}")
             return None
 
+    def reset_browser_state(self) -> None:
+        """
+        Selenium driver'ını kapatmadan önceki siteden kalan durumu temizler.
+
+        Chrome'u her firma için yeniden başlatmak birkaç saniye sürer; bunun
+        yerine aynı driver tutulur, firmalar arasında çerezler (tüm domain'ler,
+        CDP ile) silinir ve sekme about:blank'e alınır. Driver yanıt vermiyorsa
+        kapatılır, bir sonraki fetch_page_with_js çağrısı yenisini başlatır.
+        """
+        if self._selenium_driver is None:
+            return
+
+        try:
+            self._selenium_driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            self._selenium_driver.get('about:blank')
+        except Exception as e:
+            logger.debug(f"Selenium driver sıfırlanamadı, yeniden başlatılacak: {e}")
+            try:
+                self._selenium_driver.quit()
+            except Exception:
+                pass
+            self._selenium_driver = None
+
     def fetch_page_with_js(self, url: str, wait_for_element: Optional[str] = None) -> Optional[BeautifulSoup]:
         """
         Selenium ile sayfa çeker (JavaScript rendering dahil).
@@ -124,6 +272,12 @@ class BaseScraper(ABC):
         Returns:
             BeautifulSoup: Parse edilmiş sayfa, hata durumunda None
         """
+        # Statik istek sayfanın olmadığını söylediyse Selenium (veya requests
+        # fallback'i) aynı sonucu saniyeler harcayarak tekrar üretir
+        if url in self._missing_urls:
+            logger.debug(f"Sayfa yok (404), Selenium atlandı: {url}")
+            return None
+
         if self._selenium_driver is None:
             self._selenium_driver = self._init_selenium_driver()
 
@@ -176,15 +330,19 @@ class BaseScraper(ABC):
             logger.debug(f"Beklenmeyen Selenium hatası: {url} - {e}")
             return self.fetch_page(url)  # Fallback to requests
 
-    def fetch_page(self, url: str, retry_count: int = 0) -> Optional[BeautifulSoup]:
+    def fetch_page(self, url: str,
+                   strainer: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
         """
         Belirtilen URL'den sayfa içeriğini çeker ve BeautifulSoup nesnesi döndürür.
 
-        Retry mekanizması ile hatalı istekleri yeniden dener.
+        Bağlantı hataları, zaman aşımları ve 5xx yanıtlar session'a bağlı
+        urllib3 Retry adapter'ı tarafından yeniden denenir (bkz. __init__).
 
         Args:
             url: Çekilecek sayfa URL'si
-            retry_count: Mevcut deneme sayısı (internal)
+            strainer: Verilirse sadece eşleşen etiketler parse edilir
+                (ör. yalnızca link taraması yapılacak sayfalar için).
+                İletişim bilgisi çıkarılacak sayfalarda verilmemelidir.
 
         Returns:
             BeautifulSoup: Parse edilmiş sayfa, hata durumunda None
@@ -196,8 +354,7 @@ class BaseScraper(ABC):
         """
         try:
             # Rate limiting
-            if retry_count == 0:
-                time.sleep(self.delay)
+            time.sleep(self.delay)
 
             logger.debug(f"Sayfa çekiliyor: {url}")
 
@@ -208,33 +365,22 @@ class BaseScraper(ABC):
             )
             response.raise_for_status()
 
-            # Encoding tespiti
-            response.encoding = response.apparent_encoding or 'utf-8'
-
-            # BeautifulSoup ile parse et
-            soup = BeautifulSoup(response.text, 'lxml')
+            # Encoding tespiti + BeautifulSoup ile parse et
+            soup = BeautifulSoup(_decode_html(response), 'lxml', parse_only=strainer)
 
             logger.debug(f"Sayfa başarıyla çekildi: {url}")
             return soup
 
         except requests.exceptions.Timeout:
             logger.debug(f"Zaman aşımı: {url}")
-            if retry_count < self.max_retries:
-                logger.debug(f"Yeniden deneniyor ({retry_count + 1}/{self.max_retries})...")
-                return self.fetch_page(url, retry_count + 1)
 
         except requests.exceptions.HTTPError as e:
             logger.debug(f"HTTP hatası ({e.response.status_code}): {url}")
-            if retry_count < self.max_retries and e.response.status_code >= 500:
-                logger.debug(f"Yeniden deneniyor ({retry_count + 1}/{self.max_retries})...")
-                return self.fetch_page(url, retry_count + 1)
+            if e.response.status_code in (404, 410):
+                self._missing_urls.add(url)
 
         except requests.exceptions.ConnectionError:
             logger.debug(f"Bağlantı hatası: {url}")
-            if retry_count < self.max_retries:
-                time.sleep(2)  # Bağlantı hatalarında biraz daha bekle
-                logger.debug(f"Yeniden deneniyor ({retry_count + 1}/{self.max_retries})...")
-                return self.fetch_page(url, retry_count + 1)
 
         except requests.exceptions.RequestException as e:
             logger.debug(f"İstek hatası: {url} - {str(e)}")
@@ -244,6 +390,29 @@ class BaseScraper(ABC):
 
         return None
 
+    def fetch_pages(self, urls: List[str],
+                    strainer: Optional[SoupStrainer] = None) -> Dict[str, Optional[BeautifulSoup]]:
+        """
+        Birden fazla sayfayı eşzamanlı çeker (sadece requests, Selenium yok).
+
+        Her istek yine `fetch_page` üzerinden geçer (delay + retry korunur);
+        ancak istekler CRAWL_WORKERS thread'e dağıtıldığı için bekleme ve
+        ağ gecikmeleri üst üste biner. requests.Session'ın connection
+        pool'u thread-safe olduğu için aynı session paylaşılır.
+
+        Args:
+            urls: Çekilecek sayfa URL'leri
+            strainer: fetch_page'e iletilen kısmi parse filtresi
+
+        Returns:
+            Dict[str, Optional[BeautifulSoup]]: URL -> parse edilmiş sayfa (hata durumunda None)
+        """
+        if len(urls) <= 1 or CRAWL_WORKERS <= 1:
+            return {url: self.fetch_page(url, strainer) for url in urls}
+
+        with ThreadPoolExecutor(max_workers=min(CRAWL_WORKERS, len(urls))) as executor:
+            return dict(zip(urls, executor.map(lambda url: self.fetch_page(url, strainer), urls)))
+
     def get_base_url(self, url: str) -> str:
         """
         URL'den base URL'yi çıkarır.
@@ -258,8 +427,7 @@ class BaseScraper(ABC):
             >>> scraper.get_base_url("https://example.com/page/subpage")
             'https://example.com'
         """
-        parsed = urlparse(url)
-        return f"{parsed.scheme}://{parsed.netloc}"
+        return _base_url(url)
 
     def resolve_url(self, base_url: str, relative_url: str) -> str:
         """
@@ -276,34 +444,17 @@ class BaseScraper(ABC):
             >>> scraper.resolve_url("https://example.com", "/page.html")
             'https://example.com/page.html'
         """
-        # Wix CMS internal URL → CDN URL dönüşümü
-        # Örnek: wix:document://v1/ugd/1a45e3_HASH.pdf/DisplayName.pdf
-        # → https://static.wixstatic.com/ugd/1a45e3_HASH.pdf
-        if relative_url.startswith('wix:document://v1/ugd/'):
-            ugd_path = relative_url[len('wix:document://v1/ugd/'):]
-            file_hash = ugd_path.split('/')[0]  # e.g. "1a45e3_abc123.pdf"
-            if file_hash.lower().endswith('.pdf'):
-                return f"https://static.wixstatic.com/ugd/{file_hash}"
-            return ''
-
-        # Backslash-escaped path normalizasyonu (Wix/CMS JS çıktısından gelir)
-        # \/GUID\/hash-name.pdf → /GUID/hash-name.pdf
-        if '\\/' in relative_url:
-            relative_url = relative_url.replace('\\/', '/')
-
-        if relative_url.startswith(('http://', 'https://')):
-            return relative_url
-        return urljoin(base_url, relative_url)
+        return _resolve_url(base_url, relative_url)
 
     def find_pages_by_keywords(self, soup: BeautifulSoup, base_url: str,
-                                keywords: List[str]) -> List[str]:
+                                keywords: Sequence[str]) -> List[str]:
         """
         Belirtilen anahtar kelimeleri içeren sayfa linklerini bulur.
 
         Args:
             soup: BeautifulSoup nesnesi
             base_url: Base URL
-            keywords: Aranacak anahtar kelimeler
+            keywords: Aranacak anahtar kelimeler (tercihen settings'teki *_LOWER tuple'ları)
 
         Returns:
             List[str]: Bulunan sayfa URL'leri
@@ -312,22 +463,30 @@ class BaseScraper(ABC):
             >>> pages = scraper.find_pages_by_keywords(soup, base_url, ['katalog', 'catalog'])
         """
         found_urls = []
+        seen = set()
+        if not keywords:
+            return found_urls
+
+        # Tüm keyword'ler tek regex'te — link başına tek tarama.
+        # href'te keyword bir path/query parçasının başında olmalı (rastgele
+        # alt dizeler yanlış pozitif üretiyor); link metninde alt dize yeterli.
+        if not isinstance(keywords, tuple):
+            keywords = tuple(keywords)
+        href_re = _keywords_re(keywords, token_start=True)
+        text_re = _keywords_re(keywords)
 
         # Tüm linkleri tara
         for link in soup.find_all('a', href=True):
             href = link['href'].lower()
-            link_text = link.get_text().lower()
 
             # Anahtar kelime kontrolü (href veya link text'te)
-            for keyword in keywords:
-                keyword_lower = keyword.lower()
-                if keyword_lower in href or keyword_lower in link_text:
-                    full_url = self.resolve_url(base_url, link['href'])
+            if href_re.search(href) or text_re.search(link.get_text().lower()):
+                full_url = self.resolve_url(base_url, link['href'])
 
-                    # Duplicate kontrolü
-                    if full_url not in found_urls:
-                        found_urls.append(full_url)
-                    break
+                # Duplicate kontrolü (sıra korunur, üyelik set'te O(1))
+                if full_url not in seen:
+                    seen.add(full_url)
+                    found_urls.append(full_url)
 
         return found_urls
 
@@ -348,14 +507,8 @@ class BaseScraper(ABC):
         if not text:
             return ''
 
-        # Satır sonlarını boşluğa çevir
-        text = text.replace('\n', ' ').replace('\r', ' ').replace('\t', ' ')
-
-        # Ardışık boşlukları tek boşluğa indir
-        while '  ' in text:
-            text = text.replace('  ', ' ')
-
-        return text.strip()
+        # Satır sonu/tab dahil tüm boşluk gruplarını tek geçişte tek boşluğa indir
+        return _WS_RE.sub(' ', text).strip()
 
     @abstractmethod
     def extract_catalog_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
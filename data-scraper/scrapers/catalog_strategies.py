@@ -11,15 +11,27 @@ Her strateji farklı bir yaklaşım kullanır:
 5. Deep Scan: Agresif link tarama
 """
 
+import os
 import re
 import time
+import queue
+import atexit
 import random
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Set, Tuple
-from urllib.parse import urljoin, urlparse, quote
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Deque, List, Optional, Dict, Set, Tuple
+from urllib.parse import urljoin, quote, unquote
+from urllib.robotparser import RobotFileParser
 
 from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 
 try:
     from selenium import webdriver
@@ -32,6 +44,16 @@ try:
 except ImportError:
     SELENIUM_AVAILABLE = False
 
+try:
+    import undetected_chromedriver as uc
+    UC_AVAILABLE = True
+except ImportError:
+    UC_AVAILABLE = False
+
+from config.settings import keyword_re
+from scrapers.base_scraper import _decode_html
+from utils.host_slots import _urlparse, host_slot
+from utils.http_cache import HttpCache, get_http_cache
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -56,6 +78,461 @@ USER_AGENTS = [
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15',
 ]
 
+# =============================================================================
+# DERLENMİŞ REGEX'LER
+# =============================================================================
+
+# Script/onclick metni içinde tırnaklı PDF yolları. Metinler '\n' ile birleştirilip
+# tek seferde tarandığından eşleşme satır sonu içeremez (bir metinden diğerine taşmaz).
+_PDF_IN_JS_RE = re.compile(r'["\']([^"\'\n]*\.pdf)["\']', re.IGNORECASE)
+
+# onclick içindeki JavaScript yönlendirmeleri (window.open, location.href vb.)
+_ONCLICK_URL_RE = re.compile(
+    r"(?:window\.open\(|location\.href\s*=\s*|window\.location\s*=\s*)"
+    r"['\"]([^'\"\n]+)['\"]"
+)
+
+# Katalog linki taşıyabilen data-* attribute'ları ve gömülü içerik tag'leri
+_STEALTH_DATA_ATTRS = ('data-href', 'data-url', 'data-file', 'data-pdf', 'data-src')
+_DEEP_DATA_ATTRS = ('data-href', 'data-url', 'data-file', 'data-pdf')
+_EMBED_TAGS = frozenset({'embed', 'object', 'iframe'})
+
+# =============================================================================
+# KATALOG URL YARDIMCILARI
+# =============================================================================
+
+# urljoin'in normalize ettiği (dot-segment, kontrol karakteri, ';' parametresi,
+# boş query/fragment) href'ler hızlı yoldan çözülmez
+_JOIN_SLOW_PATH_RE = re.compile(r'/\.|[\t\r\n;]|\?#|[?#]$')
+
+
+@lru_cache(maxsize=256)
+def _url_root(url: str) -> str:
+    """URL'nin scheme://netloc kısmı."""
+    parsed = _urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+def _join_url(base_url: str, href: str) -> str:
+    """
+    urljoin'in hızlı yolu.
+
+    Linklerin çoğu root-relative (`/...`) veya mutlak olduğundan bunlar
+    string birleştirmeyle çözülür; diğer durumlar (göreli path, `..`,
+    satır sonu içeren href) urljoin'e bırakılır.
+    """
+    if not href.startswith(('/', 'http://', 'https://')) or _JOIN_SLOW_PATH_RE.search(href):
+        return urljoin(base_url, href)
+    if href.startswith('/') and not href.startswith('//'):
+        return _url_root(base_url) + href
+    # Mutlak / protocol-relative: host harf veya rakamla başlamalı
+    netloc_start = href.find('//') + 2
+    if not href[netloc_start:netloc_start + 1].isalnum():
+        return urljoin(base_url, href)
+    if netloc_start == 2:
+        return f"{_urlparse(base_url).scheme}:{href}"
+    return href
+
+
+# Hash'li dosya adı (MD5/SHA1 gibi sadece hex karakterlerden oluşan)
+_HASH_NAME_RE = re.compile(r'^[a-f0-9]{20,}$')
+
+
+@lru_cache(maxsize=8192)
+def _resolve_href(base_url: str, href: str) -> str:
+    """CMS iç URL'lerini gerçek HTTP URL'lerine çevirir."""
+    if not href:
+        return ''
+    # Wix protokol URL → CDN URL dönüşümü
+    if href.startswith('wix:document://v1/ugd/'):
+        ugd_path = href[len('wix:document://v1/ugd/'):]
+        file_hash = ugd_path.split('/')[0]
+        if file_hash.lower().endswith('.pdf'):
+            return f"https://static.wixstatic.com/ugd/{file_hash}"
+        return ''
+    # Backslash-escaped path normalizasyonu (Wix JS çıktısı)
+    if '\\/' in href:
+        href = href.replace('\\/', '/')
+    return _join_url(base_url, href)
+
+
+@lru_cache(maxsize=8192)
+def _is_valid_catalog(url: str) -> bool:
+    """
+    URL'nin geçerli katalog olup olmadığını kontrol et.
+
+    Aynı URL'ler (menü/footer linkleri) her alt sayfada tekrar geçtiği için
+    sonuçlar önbelleğe alınır.
+    """
+    from config.settings import PDF_NEGATIVE_RE, norm
+
+    # URL decode + Türkçe normalize (should_download_url ile aynı mantık)
+    decoded_url = norm(unquote(url))
+
+    # Dosya adını da ayrıca çıkar ve kontrol et
+    filename = os.path.basename(_urlparse(url).path)
+    filename_normalized = norm(unquote(filename))
+
+    # Hash'li dosya adı kontrolü
+    # Örnek: 44e6837acccc042ae3d6cd8eac957784.pdf
+    # NOT: Sadece "buttons" dizinindeki hash'li dosyaları atla
+    # "files" dizinindeki hash'li dosyalar gerçek katalog olabilir (örn: Çemtaş)
+    name_without_ext = os.path.splitext(filename)[0]
+    if _HASH_NAME_RE.match(name_without_ext.lower()):
+        # Sadece buttons dizinindeyse atla, files dizinindeyse kabul et
+        url_lower = url.lower()
+        if '/buttons/' in url_lower or '/button/' in url_lower:
+            return False  # Hash'li dosyaları atla
+
+    # Her ikisini de kontrol et
+    combined = f"{decoded_url} {filename_normalized}"
+
+    # Negatif keyword kontrolü (tek geçişte tüm liste)
+    return PDF_NEGATIVE_RE.search(combined) is None
+
+
+def _redirected_to_root(requested_url: str, final_url: str) -> bool:
+    """Bir alt sayfa isteği sitenin köküne yönlendirildi mi (soft 404)."""
+    if _urlparse(requested_url).path.strip('/') == '':
+        return False
+    return _urlparse(final_url).path.strip('/') == ''
+
+
+def _parse_tree(html: str) -> Optional[lxml_html.HtmlElement]:
+    """HTML'i lxml ağacına parse eder; boş/bozuk belgede None döner."""
+    try:
+        # Encoding bildirimi içeren str'ler lxml'de hata verdiği için UTF-8 byte
+        return lxml_html.document_fromstring(
+            html.encode('utf-8', 'replace'),
+            parser=lxml_html.HTMLParser(encoding='utf-8')
+        )
+    except (etree.ParserError, ValueError):
+        return None
+
+
+# Alt sayfa ağaçları için derlenmiş XPath'ler. smart_strings=False: dönen
+# string'ler ağaca referans tutmaz (lru_cache anahtarı olunca ağaç bellekte kalmaz)
+_A_HREF_XPATH = etree.XPath('//a/@href', smart_strings=False)
+_DEEP_HREF_XPATH = etree.XPath(
+    '//a/@href | ' + ' | '.join(f'//@{attr}' for attr in _DEEP_DATA_ATTRS),
+    smart_strings=False
+)
+_ONCLICK_XPATH = etree.XPath('//@onclick', smart_strings=False)
+_SCRIPT_TEXT_XPATH = etree.XPath('//script/text()', smart_strings=False)
+# BeautifulSoup.get_text gibi script/style/template içeriği hariç metin düğümleri
+_VISIBLE_TEXT_XPATH = etree.XPath(
+    '//text()[not(ancestor::script) and not(ancestor::style) and not(ancestor::template)]',
+    smart_strings=False
+)
+
+
+def _tree_text_length(tree: lxml_html.HtmlElement) -> int:
+    """Ağaçtaki görünür metin uzunluğu."""
+    return sum(len(text) for text in _VISIBLE_TEXT_XPATH(tree))
+
+
+# Ham HTML bu eşikleri aşıyorsa sayfa zengin kabul edilir; içerik kontrolü
+# için DOM'dan metin/link sayımı yapılmaz
+_RICH_PAGE_MIN_CHARS = 8000
+_RICH_PAGE_MIN_LINKS = 20
+_ANCHOR_TAG_RE = re.compile(r'<a\s', re.I)
+
+
+def _is_rich_html(html: str) -> bool:
+    """Ham HTML uzun ve çok sayıda <a> etiketi içeriyor mu (eşik aşılınca sayım durur)."""
+    if len(html) <= _RICH_PAGE_MIN_CHARS:
+        return False
+    anchors = islice(_ANCHOR_TAG_RE.finditer(html), _RICH_PAGE_MIN_LINKS + 1)
+    return sum(1 for _ in anchors) > _RICH_PAGE_MIN_LINKS
+
+# =============================================================================
+# PAYLAŞILAN HTTP SESSION
+# =============================================================================
+
+def _build_session() -> requests.Session:
+    """
+    Tüm stratejilerin ortak kullandığı session'ı oluşturur.
+
+    Connection pool süreç geneli paylaşılır; StrategyManager her scraper
+    için yeniden kurulsa da aynı host'a tekrar TCP/TLS el sıkışması
+    yapılmaz. Strateji header'ları session'a yazılmaz, her istekte
+    `headers=` ile verilir.
+    """
+    from config.settings import CRAWL_WORKERS
+
+    session = requests.Session()
+    retry = Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=['GET', 'HEAD'],
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=max(10, CRAWL_WORKERS),
+        max_retries=retry
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+_SESSION = _build_session()
+
+
+# Sayfa gövdesi üst sınırı. Spekülatif path'ler (/pdf, /downloads ...) bazen
+# dosya veya devasa HTML döndürür; sınırdan sonrası indirilmez.
+_PAGE_MAX_BYTES = 2 * 1024 * 1024
+
+
+def _read_page_body(response: requests.Response) -> None:
+    """
+    Stream edilen yanıtın gövdesini sayfa sınırları içinde okur.
+
+    Hata yanıtlarının ve HTML/metin olmayan yanıtların gövdesi hiç indirilmez;
+    HTML olmayanlar hata olarak yükseltilir. Okunan gövde response.content
+    olarak kullanılabilir.
+    """
+    content_type = response.headers.get('Content-Type', '').lower()
+    if (response.ok and content_type and not content_type.startswith('text/')
+            and 'xhtml' not in content_type):
+        response.close()
+        raise requests.RequestException(f"HTML olmayan yanıt ({content_type}): {response.url}")
+
+    chunks = []
+    total = 0
+    if response.ok:
+        for chunk in response.iter_content(chunk_size=65536):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= _PAGE_MAX_BYTES:
+                logger.debug(f"Sayfa {_PAGE_MAX_BYTES} byte'ta kesildi: {response.url}")
+                break
+    response.close()
+    response._content = b''.join(chunks)
+
+
+def _build_http_cache() -> Optional[HttpCache]:
+    """HTTP_CACHE açıksa çalıştırmalar arası kalıcı sayfa önbelleğini döndürür."""
+    from config.settings import HTTP_CACHE
+
+    return get_http_cache() if HTTP_CACHE else None
+
+
+_HTTP_CACHE = _build_http_cache()
+
+# Host -> bir sonraki isteğin en erken başlayabileceği zaman (monotonic).
+# Her istek kendi zamanını ayırır; böylece thread'ler arasında host başına
+# saniyede en fazla HOST_RATE_LIMIT istek gider.
+_HOST_NEXT_REQUEST: Dict[str, float] = {}
+_HOST_NEXT_REQUEST_LOCK = threading.Lock()
+
+
+def _wait_host_rate(url: str) -> None:
+    """Host'un istek hızı sınırı dolmuşsa sıradaki boşluğa kadar bekler."""
+    from config.settings import HOST_RATE_LIMIT
+
+    if HOST_RATE_LIMIT <= 0:
+        return
+
+    netloc = _urlparse(url).netloc
+    with _HOST_NEXT_REQUEST_LOCK:
+        now = time.monotonic()
+        start = max(now, _HOST_NEXT_REQUEST.get(netloc, 0.0))
+        _HOST_NEXT_REQUEST[netloc] = start + 1.0 / HOST_RATE_LIMIT
+    if start > now:
+        time.sleep(start - now)
+
+
+# Site kökü -> robots.txt kuralları (None = kural yok, her şeye izin)
+_ROBOTS: Dict[str, Optional[RobotFileParser]] = {}
+_ROBOTS_FETCH_LOCKS: Dict[str, threading.Lock] = {}
+_ROBOTS_LOCK = threading.Lock()
+
+
+def _fetch_robots(root: str) -> Optional[RobotFileParser]:
+    """
+    Sitenin robots.txt dosyasını çekip parse eder.
+
+    Dosya yoksa, 4xx/5xx dönerse veya istek başarısız olursa kural
+    uygulanmaz (None).
+    """
+    from config.settings import REQUEST_TIMEOUT
+
+    try:
+        response = _SESSION.get(f"{root}/robots.txt", timeout=REQUEST_TIMEOUT,
+                                headers={'User-Agent': USER_AGENTS[0]})
+    except requests.RequestException as e:
+        logger.debug(f"robots.txt okunamadı ({root}): {e}")
+        return None
+
+    if response.status_code != 200:
+        return None
+
+    parser = RobotFileParser()
+    parser.parse(response.text.splitlines())
+    return parser
+
+
+def _robots_allowed(url: str) -> bool:
+    """
+    URL robots.txt'e göre taranabilir mi (RESPECT_ROBOTS kapalıysa her zaman True).
+
+    Kurallar site başına bir kez çekilir; aynı siteye paralel gelen
+    istekler ilk çekimi bekler.
+    """
+    from config.settings import RESPECT_ROBOTS
+
+    if not RESPECT_ROBOTS:
+        return True
+
+    root = _url_root(url)
+    with _ROBOTS_LOCK:
+        if root in _ROBOTS:
+            parser = _ROBOTS[root]
+            return parser is None or parser.can_fetch('*', url)
+        fetch_lock = _ROBOTS_FETCH_LOCKS.setdefault(root, threading.Lock())
+
+    with fetch_lock:
+        if root not in _ROBOTS:
+            _ROBOTS[root] = _fetch_robots(root)
+    parser = _ROBOTS[root]
+    return parser is None or parser.can_fetch('*', url)
+
+
+# =============================================================================
+# CHROME DRIVER HAVUZU
+# =============================================================================
+
+# navigator.webdriver vb. otomasyon izlerini gizler (düz Selenium için)
+_STEALTH_JS = '''
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5]
+    });
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['tr-TR', 'tr', 'en-US', 'en']
+    });
+'''
+
+
+def _create_driver() -> Optional[Any]:
+    """
+    Stealth ayarlı headless Chrome başlatır.
+
+    undetected-chromedriver kuruluysa o kullanılır (otomasyon izlerini
+    driver seviyesinde gizler); değilse düz Selenium'a anti-detection
+    argümanları ve CDP script'i eklenir. Stratejiler sadece DOM'u okuduğu
+    için görseller ve web fontları yüklenmez.
+    """
+    if not SELENIUM_AVAILABLE:
+        return None
+
+    from config.settings import SELENIUM_CHROME_PREFS, SELENIUM_BLOCKED_URLS
+
+    try:
+        options = uc.ChromeOptions() if UC_AVAILABLE else ChromeOptions()
+        options.add_argument('--headless=new')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-infobars')
+        options.add_argument('--disable-extensions')
+        options.add_argument('--disable-gpu')
+        options.add_argument('--window-size=1920,1080')
+        options.add_argument(f'--user-agent={random.choice(USER_AGENTS)}')
+        options.add_argument('--log-level=3')
+
+        # Görselleri yükleme (sadece DOM okunuyor)
+        options.add_experimental_option('prefs', SELENIUM_CHROME_PREFS)
+
+        # Eager loading: DOM hazır olunca devam et (timeout azaltır)
+        options.page_load_strategy = 'eager'
+
+        if UC_AVAILABLE:
+            driver = uc.Chrome(options=options)
+        else:
+            options.add_argument('--disable-blink-features=AutomationControlled')
+            options.add_experimental_option('excludeSwitches', ['enable-automation'])
+            options.add_experimental_option('useAutomationExtension', False)
+            driver = webdriver.Chrome(options=options)
+            driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': _STEALTH_JS})
+
+        # Web fontlarını ağ katmanında engelle
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': SELENIUM_BLOCKED_URLS})
+        except Exception:
+            pass
+        return driver
+    except Exception as e:
+        logger.debug(f"Chrome driver başlatılamadı: {e}")
+        return None
+
+
+# Boşta bekleyen driver'lar (tüm Selenium kullanan stratejiler ortak). Chrome'u
+# her site için yeniden başlatmak 1-3 sn sürdüğünden driver'lar süreç boyunca
+# tutulur, site bitince temizlenip havuza bırakılır ve süreç çıkışında kapatılır.
+_DRIVER_POOL: queue.Queue = queue.Queue()
+_ALL_DRIVERS: List[Any] = []
+_DRIVER_LOCK = threading.Lock()
+
+
+def _acquire_driver() -> Optional[Any]:
+    """Havuzdan boşta bir driver alır; yoksa yenisini başlatır."""
+    try:
+        return _DRIVER_POOL.get_nowait()
+    except queue.Empty:
+        pass
+
+    driver = _create_driver()
+    if driver is not None:
+        with _DRIVER_LOCK:
+            _ALL_DRIVERS.append(driver)
+    return driver
+
+
+def _release_driver(driver: Any) -> None:
+    """
+    Driver'ı önceki siteden kalan durumdan arındırıp havuza geri bırakır.
+
+    Çerezler tüm domain'ler için (CDP ile) silinir ve sekme about:blank'e
+    alınır. Driver yanıt vermiyorsa kapatılır ve havuzdan düşülür.
+    """
+    try:
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        driver.get('about:blank')
+    except Exception as e:
+        logger.debug(f"Driver sıfırlanamadı, kapatılıyor: {e}")
+        with _DRIVER_LOCK:
+            if driver in _ALL_DRIVERS:
+                _ALL_DRIVERS.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        return
+
+    _DRIVER_POOL.put(driver)
+
+
+def _shutdown_drivers() -> None:
+    """Süreç çıkışında havuzdaki tüm driver'ları kapatır."""
+    with _DRIVER_LOCK:
+        drivers = list(_ALL_DRIVERS)
+        _ALL_DRIVERS.clear()
+
+    for driver in drivers:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+atexit.register(_shutdown_drivers)
+
 # =============================================================================
 # BASE STRATEGY
 # =============================================================================
@@ -69,7 +546,32 @@ class CatalogStrategy(ABC):
     def __init__(self, timeout: int = 15, delay: float = 1.0):
         self.timeout = timeout
         self.delay = delay
-        self.session = requests.Session()
+        self.session = _SESSION
+        self.headers: Dict[str, str] = {}
+        self._driver = None
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Paylaşılan session ile GET isteği atar.
+
+        HTTP önbelleği açıksa istek koşullu gönderilir; değişmemiş sayfalar
+        (304) gövde indirilmeden önbellekten döner. Gövde stream edilerek
+        `_read_page_body` sınırlarıyla okunur.
+        """
+        from config.settings import CRAWL_WORKERS
+
+        kwargs.setdefault('headers', self.headers)
+        # Host başına eşzamanlı istek sınırı. Paralel alt sayfa taramaları ve
+        # aynı host'a düşen farklı firma worker'ları birlikte en fazla
+        # CRAWL_WORKERS bağlantı açar.
+        with host_slot(url, CRAWL_WORKERS, pool='crawl'):
+            _wait_host_rate(url)
+            if _HTTP_CACHE is not None:
+                return _HTTP_CACHE.get(self.session, url, on_response=_read_page_body,
+                                       stream=True, **kwargs)
+            response = self.session.get(url, stream=True, **kwargs)
+            _read_page_body(response)
+            return response
 
     @abstractmethod
     def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
@@ -90,26 +592,52 @@ class CatalogStrategy(ABC):
         """
         logger.debug(f"[{self.name}] Strateji başlatılıyor: {website}")
 
-        # Ana sayfayı çek
-        soup = self.fetch_page(website)
-        if not soup:
-            logger.debug(f"[{self.name}] Ana sayfa çekilemedi")
+        if not _robots_allowed(website):
+            logger.debug(f"[{self.name}] robots.txt ana sayfayı engelliyor: {website}")
             return [], None
 
-        # Base URL'yi al
-        parsed = urlparse(website)
-        base_url = f"{parsed.scheme}://{parsed.netloc}"
+        try:
+            # Ana sayfayı çek
+            soup = self.fetch_page(website)
+            if not soup:
+                logger.debug(f"[{self.name}] Ana sayfa çekilemedi")
+                return [], None
+
+            # Base URL'yi al
+            parsed = _urlparse(website)
+            base_url = f"{parsed.scheme}://{parsed.netloc}"
 
-        # Katalog linklerini bul
-        catalogs = self.find_catalog_links(soup, base_url)
+            # Katalog linklerini bul
+            catalogs = self.find_catalog_links(soup, base_url)
 
-        logger.debug(f"[{self.name}] {len(catalogs)} katalog bulundu")
-        return catalogs, soup
+            logger.debug(f"[{self.name}] {len(catalogs)} katalog bulundu")
+            return catalogs, soup
+        finally:
+            # Site bitti — driver bir sonraki site/scraper için havuza döner
+            self.release_driver()
+
+    def _browser(self) -> Optional[Any]:
+        """Site boyunca kullanılacak Chrome driver'ı (ilk çağrıda havuzdan alınır)."""
+        if self._driver is None:
+            self._driver = _acquire_driver()
+            if self._driver is not None:
+                try:
+                    self._driver.set_page_load_timeout(self.timeout)
+                except Exception as e:
+                    logger.debug(f"[{self.name}] Driver yanıt vermiyor: {e}")
+                    self.release_driver()
+        return self._driver
+
+    def release_driver(self) -> None:
+        """Tutulan Chrome driver'ı (varsa) havuza geri bırakır."""
+        driver = self._driver
+        if driver is not None:
+            self._driver = None
+            _release_driver(driver)
 
     def close(self):
-        """Kaynakları temizle."""
-        if hasattr(self, 'session'):
-            self.session.close()
+        """Kaynakları temizle (paylaşılan session ve driver havuzu süreç boyunca açık kalır)."""
+        self.release_driver()
 
 
 # =============================================================================
@@ -124,7 +652,7 @@ class DefaultStrategy(CatalogStrategy):
 
     def __init__(self, timeout: int = 15, delay: float = 1.0):
         super().__init__(timeout, delay)
-        self.session.headers.update({
+        self.headers.update({
             'User-Agent': USER_AGENTS[0],
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7',
@@ -135,24 +663,25 @@ class DefaultStrategy(CatalogStrategy):
     def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
         try:
             time.sleep(self.delay)
-            response = self.session.get(url, timeout=self.timeout, allow_redirects=True)
+            response = self._get(url, timeout=self.timeout, allow_redirects=True)
             response.raise_for_status()
-            response.encoding = response.apparent_encoding or 'utf-8'
-            return BeautifulSoup(response.text, 'lxml')
+            return BeautifulSoup(_decode_html(response), 'lxml')
         except Exception as e:
             logger.debug(f"[{self.name}] Fetch hatası: {e}")
             return None
 
     def find_catalog_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
         """Basit katalog link araması."""
-        from config.settings import VALID_EXTENSIONS
+        from config.settings import VALID_EXTENSIONS_TUPLE
 
-        catalogs = []
+        catalogs: List[str] = []
+        seen: Set[str] = set()  # O(1) üyelik kontrolü, liste sırayı korur
         for link in soup.find_all('a', href=True):
             href = link['href'].lower()
-            if any(href.endswith(ext) for ext in VALID_EXTENSIONS):
-                full_url = urljoin(base_url, link['href'])
-                if full_url not in catalogs:
+            if href.endswith(VALID_EXTENSIONS_TUPLE):
+                full_url = _join_url(base_url, link['href'])
+                if full_url not in seen:
+                    seen.add(full_url)
                     catalogs.append(full_url)
 
         return catalogs
@@ -174,7 +703,7 @@ class AlternativeHeadersStrategy(CatalogStrategy):
         # Rastgele User-Agent seç
         self.user_agent = random.choice(USER_AGENTS[1:])  # İlkini atla (default'ta kullanılıyor)
 
-        self.session.headers.update({
+        self.headers.update({
             'User-Agent': self.user_agent,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9,tr;q=0.8',
@@ -196,27 +725,27 @@ class AlternativeHeadersStrategy(CatalogStrategy):
             time.sleep(self.delay)
 
             # Referer ekle (ana domain)
-            parsed = urlparse(url)
+            parsed = _urlparse(url)
             referer = f"{parsed.scheme}://{parsed.netloc}/"
 
-            response = self.session.get(
+            response = self._get(
                 url,
                 timeout=self.timeout,
                 allow_redirects=True,
-                headers={'Referer': referer}
+                headers={**self.headers, 'Referer': referer}
             )
             response.raise_for_status()
-            response.encoding = response.apparent_encoding or 'utf-8'
-            return BeautifulSoup(response.text, 'lxml')
+            return BeautifulSoup(_decode_html(response), 'lxml')
         except Exception as e:
             logger.debug(f"[{self.name}] Fetch hatası: {e}")
             return None
 
     def find_catalog_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
         """Genişletilmiş katalog araması."""
-        from config.settings import VALID_EXTENSIONS, CATALOG_KEYWORDS
+        from config.settings import VALID_EXTENSIONS_TUPLE, CATALOG_KEYWORDS_LOWER
 
-        catalogs = []
+        catalogs: List[str] = []
+        seen: Set[str] = set()
 
         # 1. Doğrudan dosya linkleri
         for link in soup.find_all('a', href=True):
@@ -225,24 +754,27 @@ class AlternativeHeadersStrategy(CatalogStrategy):
             link_text = link.get_text().lower()
 
             # Dosya uzantısı kontrolü
-            if any(href_lower.endswith(ext) for ext in VALID_EXTENSIONS):
-                full_url = urljoin(base_url, href)
-                if full_url not in catalogs:
+            if href_lower.endswith(VALID_EXTENSIONS_TUPLE):
+                full_url = _join_url(base_url, href)
+                if full_url not in seen:
+                    seen.add(full_url)
                     catalogs.append(full_url)
 
             # Keyword kontrolü (dosya uzantısı olmasa bile)
-            elif any(kw in href_lower or kw in link_text for kw in CATALOG_KEYWORDS):
+            elif any(kw in href_lower or kw in link_text for kw in CATALOG_KEYWORDS_LOWER):
                 if any(ext in href_lower for ext in ['.pdf', '.doc', '.xls']):
-                    full_url = urljoin(base_url, href)
-                    if full_url not in catalogs:
+                    full_url = _join_url(base_url, href)
+                    if full_url not in seen:
+                        seen.add(full_url)
                         catalogs.append(full_url)
 
         # 2. data-* attribute'ları
         for elem in soup.find_all(attrs={'data-href': True}):
             href = elem.get('data-href', '')
-            if any(href.lower().endswith(ext) for ext in VALID_EXTENSIONS):
-                full_url = urljoin(base_url, href)
-                if full_url not in catalogs:
+            if href.lower().endswith(VALID_EXTENSIONS_TUPLE):
+                full_url = _join_url(base_url, href)
+                if full_url not in seen:
+                    seen.add(full_url)
                     catalogs.append(full_url)
 
         return catalogs
@@ -260,7 +792,7 @@ class GoogleCacheStrategy(CatalogStrategy):
 
     def __init__(self, timeout: int = 20, delay: float = 2.0):
         super().__init__(timeout, delay)
-        self.session.headers.update({
+        self.headers.update({
             'User-Agent': random.choice(USER_AGENTS),
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
@@ -277,15 +809,14 @@ class GoogleCacheStrategy(CatalogStrategy):
         try:
             time.sleep(self.delay)
 
-            response = self.session.get(
+            response = self._get(
                 cache_url,
                 timeout=self.timeout,
                 allow_redirects=True
             )
 
             if response.status_code == 200:
-                response.encoding = response.apparent_encoding or 'utf-8'
-                soup = BeautifulSoup(response.text, 'lxml')
+                soup = BeautifulSoup(_decode_html(response), 'lxml')
 
                 # Google cache wrapper'ını atla, gerçek içeriği al
                 # Google bazen içeriği bir div içine koyar
@@ -303,14 +834,15 @@ class GoogleCacheStrategy(CatalogStrategy):
 
     def find_catalog_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
         """Cache'den katalog linklerini çıkar."""
-        from config.settings import VALID_EXTENSIONS
+        from config.settings import VALID_EXTENSIONS_TUPLE
 
         # Orijinal URL'den base_url'i al
         if self._original_url:
-            parsed = urlparse(self._original_url)
+            parsed = _urlparse(self._original_url)
             base_url = f"{parsed.scheme}://{parsed.netloc}"
 
-        catalogs = []
+        catalogs: List[str] = []
+        seen: Set[str] = set()
         for link in soup.find_all('a', href=True):
             href = link['href']
             href_lower = href.lower()
@@ -321,16 +853,17 @@ class GoogleCacheStrategy(CatalogStrategy):
             if href.startswith('/search?'):
                 continue
 
-            if any(href_lower.endswith(ext) for ext in VALID_EXTENSIONS):
+            if href_lower.endswith(VALID_EXTENSIONS_TUPLE):
                 # Relative URL'leri düzelt
                 if href.startswith('/'):
-                    full_url = urljoin(base_url, href)
+                    full_url = _join_url(base_url, href)
                 elif href.startswith('http'):
                     full_url = href
                 else:
-                    full_url = urljoin(base_url, href)
+                    full_url = _join_url(base_url, href)
 
-                if full_url not in catalogs:
+                if full_url not in seen:
+                    seen.add(full_url)
                     catalogs.append(full_url)
 
         return catalogs
@@ -348,86 +881,27 @@ class StealthSeleniumStrategy(CatalogStrategy):
 
     def __init__(self, timeout: int = 20, delay: float = 2.0):
         super().__init__(timeout, delay)
-        self._driver = None
-
-    def _init_stealth_driver(self):
-        """Stealth mode Chrome driver başlat."""
-        if not SELENIUM_AVAILABLE:
-            return None
-
-        try:
-            options = ChromeOptions()
-
-            # Headless mode
-            options.add_argument('--headless=new')
-
-            # Anti-detection ayarları
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-blink-features=AutomationControlled')
-            options.add_argument('--disable-infobars')
-            options.add_argument('--disable-extensions')
-            options.add_argument('--disable-gpu')
-            options.add_argument('--window-size=1920,1080')
-            options.add_argument(f'--user-agent={random.choice(USER_AGENTS)}')
-
-            # Ek stealth ayarları
-            options.add_experimental_option('excludeSwitches', ['enable-automation'])
-            options.add_experimental_option('useAutomationExtension', False)
-
-            # Log seviyesi
-            options.add_argument('--log-level=3')
-
-            # Eager loading: DOM hazır olunca devam et (timeout azaltır)
-            options.page_load_strategy = 'eager'
-
-            driver = webdriver.Chrome(options=options)
-
-            # Navigator.webdriver'ı gizle
-            driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-                'source': '''
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined
-                    });
-                    Object.defineProperty(navigator, 'plugins', {
-                        get: () => [1, 2, 3, 4, 5]
-                    });
-                    Object.defineProperty(navigator, 'languages', {
-                        get: () => ['tr-TR', 'tr', 'en-US', 'en']
-                    });
-                '''
-            })
-
-            driver.set_page_load_timeout(self.timeout)
-
-            return driver
-
-        except Exception as e:
-            logger.debug(f"[{self.name}] Stealth driver başlatılamadı: {e}")
-            return None
 
     def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
-        if self._driver is None:
-            self._driver = self._init_stealth_driver()
-
-        if self._driver is None:
+        driver = self._browser()
+        if driver is None:
             return None
 
         try:
             time.sleep(self.delay)
 
-            self._driver.get(url)
+            driver.get(url)
 
             # Sayfanın yüklenmesini bekle
             time.sleep(3)
 
             # Scroll yap (lazy loading için)
-            self._driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
             time.sleep(1)
-            self._driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
             time.sleep(1)
 
-            page_source = self._driver.page_source
+            page_source = driver.page_source
             return BeautifulSoup(page_source, 'lxml')
 
         except Exception as e:
@@ -436,56 +910,52 @@ class StealthSeleniumStrategy(CatalogStrategy):
 
     def find_catalog_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
         """JavaScript ile yüklenen katalogları da bul."""
-        from config.settings import VALID_EXTENSIONS
+        from config.settings import VALID_EXTENSIONS_TUPLE
+
+        catalogs: List[str] = []
+        seen: Set[str] = set()
+        onclicks: List[str] = []
+
+        def add(href: str) -> None:
+            full_url = _join_url(base_url, href)
+            if full_url not in seen:
+                seen.add(full_url)
+                catalogs.append(full_url)
+
+        # Ağaç tek geçişte dolaşılır; her eleman ilgili tüm kontrollerden geçer
+        for elem in soup.find_all(True):
+            attrs = elem.attrs
+            if not attrs:
+                continue
 
-        catalogs = []
+            # 1. Standart linkler
+            if elem.name == 'a':
+                href = attrs.get('href')
+                if href is not None and href.lower().endswith(VALID_EXTENSIONS_TUPLE):
+                    add(href)
 
-        # 1. Standart linkler
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            if any(href.lower().endswith(ext) for ext in VALID_EXTENSIONS):
-                full_url = urljoin(base_url, href)
-                if full_url not in catalogs:
-                    catalogs.append(full_url)
+            # 2. data-* attributes
+            for attr in _STEALTH_DATA_ATTRS:
+                href = attrs.get(attr)
+                if href is not None and href.lower().endswith(VALID_EXTENSIONS_TUPLE):
+                    add(href)
 
-        # 2. data-* attributes
-        for attr in ['data-href', 'data-url', 'data-file', 'data-pdf', 'data-src']:
-            for elem in soup.find_all(attrs={attr: True}):
-                href = elem.get(attr, '')
-                if any(href.lower().endswith(ext) for ext in VALID_EXTENSIONS):
-                    full_url = urljoin(base_url, href)
-                    if full_url not in catalogs:
-                        catalogs.append(full_url)
+            # 3. onclick handlers (döngü sonunda toplu taranır)
+            onclick = attrs.get('onclick')
+            if onclick is not None:
+                onclicks.append(onclick)
 
-        # 3. onclick handlers
-        for elem in soup.find_all(attrs={'onclick': True}):
-            onclick = elem.get('onclick', '')
-            urls = re.findall(r'["\']([^"\']*\.pdf)["\']', onclick, re.IGNORECASE)
-            for url in urls:
-                full_url = urljoin(base_url, url)
-                if full_url not in catalogs:
-                    catalogs.append(full_url)
+            # 4. Embedded objects
+            if elem.name in _EMBED_TAGS:
+                src = attrs.get('src') or attrs.get('data')
+                if src and src.lower().endswith(VALID_EXTENSIONS_TUPLE):
+                    add(src)
 
-        # 4. Embedded objects
-        for tag in ['embed', 'object', 'iframe']:
-            for elem in soup.find_all(tag):
-                src = elem.get('src') or elem.get('data')
-                if src and any(src.lower().endswith(ext) for ext in VALID_EXTENSIONS):
-                    full_url = urljoin(base_url, src)
-                    if full_url not in catalogs:
-                        catalogs.append(full_url)
+        for url in _PDF_IN_JS_RE.findall('\n'.join(onclicks)):
+            add(url)
 
         return catalogs
 
-    def close(self):
-        super().close()
-        if self._driver:
-            try:
-                self._driver.quit()
-            except:
-                pass
-            self._driver = None
-
 
 # =============================================================================
 # STRATEGY 5: DEEP SCAN
@@ -497,43 +967,34 @@ class DeepScanStrategy(CatalogStrategy):
     name = "deep_scan"
     description = "Agresif derin tarama (Selenium + requests)"
 
+    # Potansiyel katalog sayfası path'leri
+    CATALOG_PAGE_PATTERNS = (
+        '/katalog', '/catalog', '/catalogue',
+        '/download', '/indir', '/yukle',
+        '/dokuman', '/document', '/docs',
+        '/pdf', '/media', '/files',
+        '/brosur', '/brochure',
+        '/urun', '/product',
+        '/fiyat', '/price',
+    )
+
+    # Link başına tek regex taraması: href'te path, link metninde '/'suz kelime
+    _PAGE_HREF_RE = keyword_re(CATALOG_PAGE_PATTERNS)
+    _PAGE_TEXT_RE = keyword_re(p.lstrip('/') for p in CATALOG_PAGE_PATTERNS)
+    # 2. seviye (alt sayfadaki) linkler için daha dar küme
+    _SUB_PAGE_HREF_RE = keyword_re(('/katalog', '/pdf', '/download'))
+
     def __init__(self, timeout: int = 15, delay: float = 0.5, max_pages: int = 30):
         super().__init__(timeout, delay)
         self.max_pages = max_pages
         self.visited_urls: Set[str] = set()
-        self._driver = None
 
-        self.session.headers.update({
+        self.headers.update({
             'User-Agent': random.choice(USER_AGENTS),
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'tr-TR,tr;q=0.9,en;q=0.8',
         })
 
-    def _init_selenium_driver(self):
-        """Selenium driver başlat."""
-        if not SELENIUM_AVAILABLE:
-            return None
-
-        try:
-            options = ChromeOptions()
-            options.add_argument('--headless=new')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-gpu')
-            options.add_argument('--window-size=1920,1080')
-            options.add_argument(f'--user-agent={random.choice(USER_AGENTS)}')
-            options.add_argument('--log-level=3')
-
-            # Eager loading: DOM hazır olunca devam et (timeout azaltır)
-            options.page_load_strategy = 'eager'
-
-            driver = webdriver.Chrome(options=options)
-            driver.set_page_load_timeout(self.timeout)
-            return driver
-        except Exception as e:
-            logger.debug(f"[{self.name}] Selenium başlatılamadı: {e}")
-            return None
-
     def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
         """Önce requests, yetersizse Selenium ile sayfa çek."""
         if url in self.visited_urls:
@@ -541,73 +1002,111 @@ class DeepScanStrategy(CatalogStrategy):
 
         self.visited_urls.add(url)
 
-        # 1. Önce requests ile dene (hızlı)
+        html, missing = self._fetch_html(url)
+        if html is not None:
+            soup = BeautifulSoup(html, 'lxml')
+            if _is_rich_html(html) or self._has_enough_content(
+                    url, len(soup.get_text()), len(soup.find_all('a', href=True))):
+                return soup
+
+        if missing:
+            return None
+
+        page_source = self._render_html(url)
+        return BeautifulSoup(page_source, 'lxml') if page_source is not None else None
+
+    def _fetch_tree(self, url: str) -> Tuple[Optional[lxml_html.HtmlElement], bool]:
+        """
+        Alt sayfayı requests ile çekip lxml ağacına parse eder (thread-safe, Selenium yok).
+
+        Alt sayfalardan sadece link/attribute string'leri okunduğu için
+        BeautifulSoup nesne modeli kurulmaz; lxml hem çok daha hızlı parse
+        eder hem de parse sırasında GIL'i bırakır.
+
+        Returns:
+            Tuple[Optional[HtmlElement], bool]: (ağaç, sayfa_yok). İçerik
+            yeterliyse ağaç; hata, boş sayfa veya SPA şüphesinde None
+            (sayfa_yok False ise Selenium denenmeli)
+        """
+        html, missing = self._fetch_html(url)
+        if html is None:
+            return None, missing
+
+        tree = _parse_tree(html)
+        if tree is not None and (_is_rich_html(html) or self._has_enough_content(
+                url, _tree_text_length(tree), len(tree.xpath('//a[@href]')))):
+            return tree, False
+        return None, False
+
+    def _fetch_html(self, url: str) -> Tuple[Optional[str], bool]:
+        """
+        Sayfa HTML'ini requests ile çeker.
+
+        Spekülatif path'lerin çoğu 404 döner veya ana sayfaya yönlendirilir;
+        bunlar "sayfa yok" olarak işaretlenir ki Selenium ile tekrar
+        denenmesin ve ana sayfa alt sayfa diye yeniden taranmasın.
+
+        Returns:
+            Tuple[Optional[str], bool]: (html, sayfa_yok). Hata durumunda html None
+        """
+        if not _robots_allowed(url):
+            logger.debug(f"[{self.name}] robots.txt engelliyor: {url}")
+            return None, True
+
         try:
             time.sleep(self.delay)
-            response = self.session.get(url, timeout=self.timeout, allow_redirects=True)
+            response = self._get(url, timeout=self.timeout, allow_redirects=True)
+            if response.status_code in (404, 410):
+                logger.debug(f"[{self.name}] Sayfa yok ({response.status_code}): {url}")
+                return None, True
             response.raise_for_status()
-            response.encoding = response.apparent_encoding or 'utf-8'
-            soup = BeautifulSoup(response.text, 'lxml')
-
-            # İçerik yeterliyse döndür — ama SPA shell kontrolü yap:
-            # 500+ karakter var ama <a> link sayısı < 5 → SPA olabilir → Selenium dene
-            if len(soup.get_text()) > 500:
-                link_count = len(soup.find_all('a', href=True))
-                if link_count >= 5:
-                    return soup
-                logger.debug(f"[{self.name}] Sayfa metni var ama link az ({link_count}), SPA olabilir: {url}")
-                # SPA şüphesi — Selenium ile dene (aşağıda)
-
+            if _redirected_to_root(url, response.url):
+                logger.debug(f"[{self.name}] Ana sayfaya yönlendirildi: {url}")
+                return None, True
+            return _decode_html(response), False
         except Exception as e:
             logger.debug(f"[{self.name}] Requests hatası ({url}): {e}")
+            return None, False
 
-        # 2. İçerik yetersiz/az link/hata - Selenium ile dene
-        if self._driver is None:
-            self._driver = self._init_selenium_driver()
+    def _has_enough_content(self, url: str, text_length: int, link_count: int) -> bool:
+        """
+        İçerik yeterli mi — SPA shell kontrolü ile.
 
-        if self._driver is None:
+        500+ karakter var ama <a> link sayısı < 5 → SPA olabilir → Selenium dene
+        """
+        if text_length <= 500:
+            return False
+        if link_count >= 5:
+            return True
+        logger.debug(f"[{self.name}] Sayfa metni var ama link az ({link_count}), SPA olabilir: {url}")
+        return False
+
+    def _render_html(self, url: str) -> Optional[str]:
+        """İçerik yetersiz/az link/hata - Selenium ile dene."""
+        driver = self._browser()
+        if driver is None:
             return None
 
         try:
-            self._driver.get(url)
+            driver.get(url)
             time.sleep(1.5)  # JS yüklenmesi için bekle
-            return BeautifulSoup(self._driver.page_source, 'lxml')
+            return driver.page_source
         except Exception as e:
             logger.debug(f"[{self.name}] Selenium hatası ({url}): {e}")
             return None
 
-    def close(self):
-        """Kaynakları temizle."""
-        super().close()
-        if self._driver:
-            try:
-                self._driver.quit()
-            except:
-                pass
-            self._driver = None
-
     def find_catalog_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
         """Derinlemesine katalog taraması."""
-        from config.settings import VALID_EXTENSIONS, CATALOG_PAGE_KEYWORDS
+        from config.settings import VALID_EXTENSIONS_TUPLE, CATALOG_PAGE_KEYWORDS, CRAWL_WORKERS
 
         all_catalogs: Set[str] = set()
         pages_to_scan: List[str] = []
+        queued: Set[str] = set()  # pages_to_scan üyelik kontrolü için
 
         # Ana sayfadan katalogları topla
         main_catalogs = self._extract_catalogs_from_soup(soup, base_url)
         all_catalogs.update(main_catalogs)
 
-        # Potansiyel katalog sayfalarını bul
-        catalog_page_patterns = [
-            r'/katalog', r'/catalog', r'/catalogue',
-            r'/download', r'/indir', r'/yukle',
-            r'/dokuman', r'/document', r'/docs',
-            r'/pdf', r'/media', r'/files',
-            r'/brosur', r'/brochure',
-            r'/urun', r'/product',
-            r'/fiyat', r'/price',
-        ]
-
         # Yaygın URL path'leri - /tr/ prefix'li olanlar önce (Türk siteleri için)
         common_paths = [
             # Öncelikli: /tr/ prefix'li (Türk siteleri)
@@ -636,6 +1135,7 @@ class DeepScanStrategy(CatalogStrategy):
             url = base_url.rstrip('/') + path
             if url not in self.visited_urls:
                 pages_to_scan.append(url)
+                queued.add(url)
 
         # Sayfadaki linkleri tara
         for link in soup.find_all('a', href=True):
@@ -643,147 +1143,129 @@ class DeepScanStrategy(CatalogStrategy):
             link_text = link.get_text().lower()
 
             # Katalog sayfası olabilecek linkleri bul
-            if any(pattern in href or pattern.replace('/', '') in link_text
-                   for pattern in catalog_page_patterns):
-                full_url = urljoin(base_url, link['href'])
-                if full_url not in self.visited_urls and full_url not in pages_to_scan:
+            if self._PAGE_HREF_RE.search(href) or self._PAGE_TEXT_RE.search(link_text):
+                full_url = _join_url(base_url, link['href'])
+                if full_url not in self.visited_urls and full_url not in queued:
                     pages_to_scan.append(full_url)
+                    queued.add(full_url)
 
-        # Alt sayfaları tara
+        # Alt sayfaları tara — requests istekleri CRAWL_WORKERS genişliğinde
+        # kayan bir pencereyle önden paralel atılır, sonuçlar yine liste
+        # sırasıyla işlenir (Selenium fallback'i sıralı, driver thread-safe değil)
         pages_scanned = 0
-        for page_url in pages_to_scan:
-            if pages_scanned >= self.max_pages:
-                break
-
-            logger.debug(f"[{self.name}] Alt sayfa taranıyor: {page_url}")
-            page_soup = self.fetch_page(page_url)
-
-            if page_soup:
-                pages_scanned += 1
-                page_catalogs = self._extract_catalogs_from_soup(page_soup, base_url)
-                all_catalogs.update(page_catalogs)
-
-                # 2. seviye linkler (daha az sayfa)
-                if pages_scanned < self.max_pages // 2:
-                    for link in page_soup.find_all('a', href=True):
-                        href = link['href'].lower()
-                        if any(p in href for p in ['/katalog', '/pdf', '/download']):
-                            sub_url = urljoin(base_url, link['href'])
-                            if sub_url not in self.visited_urls and sub_url not in pages_to_scan:
-                                pages_to_scan.append(sub_url)
+        index = 0
+        pending: Deque[Tuple[str, Future]] = deque()
+        executor = ThreadPoolExecutor(max_workers=max(1, CRAWL_WORKERS))
+        try:
+            while pages_scanned < self.max_pages:
+                # Pencereyi sıradaki ziyaret edilmemiş sayfalarla doldur
+                while index < len(pages_to_scan) and len(pending) < max(1, CRAWL_WORKERS):
+                    page_url = pages_to_scan[index]
+                    index += 1
+                    if page_url not in self.visited_urls:
+                        self.visited_urls.add(page_url)
+                        pending.append((page_url, executor.submit(self._fetch_tree, page_url)))
+
+                if not pending:
+                    break
+
+                page_url, future = pending.popleft()
+                logger.debug(f"[{self.name}] Alt sayfa taranıyor: {page_url}")
+                page_tree, missing = future.result()
+                if page_tree is None and not missing:
+                    page_source = self._render_html(page_url)
+                    if page_source is not None:
+                        page_tree = _parse_tree(page_source)
+
+                if page_tree is not None:
+                    pages_scanned += 1
+                    page_catalogs = self._extract_catalogs_from_tree(page_tree, base_url)
+                    all_catalogs.update(page_catalogs)
+
+                    # 2. seviye linkler (daha az sayfa)
+                    if pages_scanned < self.max_pages // 2:
+                        for raw_href in _A_HREF_XPATH(page_tree):
+                            href = raw_href.lower()
+                            if self._SUB_PAGE_HREF_RE.search(href):
+                                sub_url = _join_url(base_url, raw_href)
+                                if sub_url not in self.visited_urls and sub_url not in queued:
+                                    pages_to_scan.append(sub_url)
+                                    queued.add(sub_url)
+        finally:
+            # max_pages dolunca pencerede kalan istekler beklenmez
+            executor.shutdown(wait=False, cancel_futures=True)
 
         logger.info(f"[{self.name}] {pages_scanned} sayfa tarandı, {len(all_catalogs)} katalog bulundu")
         return list(all_catalogs)
 
     def _extract_catalogs_from_soup(self, soup: BeautifulSoup, base_url: str) -> Set[str]:
         """Soup'tan katalog linklerini çıkar - negatif keyword filtrelemesi ile."""
-        from config.settings import VALID_EXTENSIONS, PDF_NEGATIVE_KEYWORDS
-        from urllib.parse import unquote
+        hrefs: List[str] = []
+        onclicks: List[str] = []
+        scripts: List[str] = []
+
+        # Ağaç tek geçişte dolaşılır; her eleman ilgili tüm kontrollerden geçer
+        for elem in soup.find_all(True):
+            if elem.name == 'script':
+                scripts.append(elem.string or '')
+
+            attrs = elem.attrs
+            if not attrs:
+                continue
+
+            if elem.name == 'a' and 'href' in attrs:
+                hrefs.append(attrs['href'])
+            for attr in _DEEP_DATA_ATTRS:
+                if attr in attrs:
+                    hrefs.append(attrs[attr])
+            if 'onclick' in attrs:
+                onclicks.append(attrs['onclick'])
+
+        return self._collect_catalogs(base_url, hrefs, onclicks, scripts)
+
+    def _extract_catalogs_from_tree(self, tree: lxml_html.HtmlElement, base_url: str) -> Set[str]:
+        """lxml ağacından katalog linklerini çıkar (alt sayfalar için, XPath ile)."""
+        return self._collect_catalogs(
+            base_url,
+            _DEEP_HREF_XPATH(tree),
+            _ONCLICK_XPATH(tree),
+            _SCRIPT_TEXT_XPATH(tree),
+        )
+
+    def _collect_catalogs(self, base_url: str, hrefs: List[str], onclicks: List[str],
+                          scripts: List[str]) -> Set[str]:
+        """
+        Toplanmış attribute/script string'lerinden geçerli katalog URL'lerini seçer.
+
+        Args:
+            base_url: Relative URL'lerin çözüleceği adres
+            hrefs: <a href> ve data-* attribute değerleri
+            onclicks: onclick handler metinleri
+            scripts: <script> içerikleri
+        """
+        from config.settings import VALID_EXTENSIONS_TUPLE
 
         catalogs: Set[str] = set()
 
-        def resolve_href(href: str) -> str:
-            """CMS iç URL'lerini gerçek HTTP URL'lerine çevirir."""
-            if not href:
-                return ''
-            # Wix protokol URL → CDN URL dönüşümü
-            if href.startswith('wix:document://v1/ugd/'):
-                ugd_path = href[len('wix:document://v1/ugd/'):]
-                file_hash = ugd_path.split('/')[0]
-                if file_hash.lower().endswith('.pdf'):
-                    return f"https://static.wixstatic.com/ugd/{file_hash}"
-                return ''
-            # Backslash-escaped path normalizasyonu (Wix JS çıktısı)
-            if '\\/' in href:
-                href = href.replace('\\/', '/')
-            if href.startswith(('http://', 'https://')):
-                return href
-            return urljoin(base_url, href)
-
-        def normalize_turkish(text: str) -> str:
-            """Türkçe karakterleri normalize et."""
-            tr_map = str.maketrans({
-                'İ': 'i', 'I': 'i', 'ı': 'i',
-                'Ğ': 'g', 'ğ': 'g',
-                'Ü': 'u', 'ü': 'u',
-                'Ş': 's', 'ş': 's',
-                'Ö': 'o', 'ö': 'o',
-                'Ç': 'c', 'ç': 'c',
-            })
-            return text.translate(tr_map).lower()
-
-        def is_valid_catalog(url: str) -> bool:
-            """URL'nin geçerli katalog olup olmadığını kontrol et."""
-            import os
-            # URL decode + Türkçe normalize (should_download_url ile aynı mantık)
-            decoded_url = normalize_turkish(unquote(url))
-
-            # Dosya adını da ayrıca çıkar ve kontrol et
-            filename = os.path.basename(urlparse(url).path)
-            filename_normalized = normalize_turkish(unquote(filename))
-
-            # Hash'li dosya adı kontrolü (MD5/SHA1 gibi sadece hex karakterlerden oluşan)
-            # Örnek: 44e6837acccc042ae3d6cd8eac957784.pdf
-            # NOT: Sadece "buttons" dizinindeki hash'li dosyaları atla
-            # "files" dizinindeki hash'li dosyalar gerçek katalog olabilir (örn: Çemtaş)
-            name_without_ext = os.path.splitext(filename)[0]
-            if re.match(r'^[a-f0-9]{20,}$', name_without_ext.lower()):
-                # Sadece buttons dizinindeyse atla, files dizinindeyse kabul et
-                if '/buttons/' in url.lower() or '/button/' in url.lower():
-                    return False  # Hash'li dosyaları atla
-
-            # Her ikisini de kontrol et
-            combined = f"{decoded_url} {filename_normalized}"
-
-            # Negatif keyword kontrolü
-            for neg_kw in PDF_NEGATIVE_KEYWORDS:
-                if neg_kw in combined:
-                    return False
-            return True
+        def add(href: str) -> None:
+            full_url = _resolve_href(base_url, href)
+            if full_url and _is_valid_catalog(full_url):
+                catalogs.add(full_url)
 
-        # 1. <a> linkleri
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            if any(href.lower().endswith(ext) for ext in VALID_EXTENSIONS):
-                full_url = resolve_href(href)
-                if full_url and is_valid_catalog(full_url):
-                    catalogs.add(full_url)
-
-        # 2. data-* attributes
-        for attr in ['data-href', 'data-url', 'data-file', 'data-pdf']:
-            for elem in soup.find_all(attrs={attr: True}):
-                href = elem.get(attr, '')
-                if any(href.lower().endswith(ext) for ext in VALID_EXTENSIONS):
-                    full_url = resolve_href(href)
-                    if full_url and is_valid_catalog(full_url):
-                        catalogs.add(full_url)
+        # 1-2. <a> linkleri ve data-* attributes
+        for href in hrefs:
+            if href.lower().endswith(VALID_EXTENSIONS_TUPLE):
+                add(href)
 
         # 3. onclick eventleri (window.open, location.href vb.)
-        for elem in soup.find_all(attrs={'onclick': True}):
-            onclick = elem.get('onclick', '')
-            # JavaScript URL pattern'leri
-            patterns = [
-                r"window\.open\(['\"]([^'\"]+)['\"]",
-                r"location\.href\s*=\s*['\"]([^'\"]+)['\"]",
-                r"window\.location\s*=\s*['\"]([^'\"]+)['\"]",
-            ]
-            for pattern in patterns:
-                matches = re.findall(pattern, onclick)
-                for url in matches:
-                    if any(url.lower().endswith(ext) for ext in VALID_EXTENSIONS):
-                        full_url = resolve_href(url)
-                        if full_url and is_valid_catalog(full_url):
-                            catalogs.add(full_url)
+        for url in _ONCLICK_URL_RE.findall('\n'.join(onclicks)):
+            if url.lower().endswith(VALID_EXTENSIONS_TUPLE):
+                add(url)
 
         # 4. Script içindeki URL'ler
-        for script in soup.find_all('script'):
-            script_text = script.string or ''
-            urls = re.findall(r'["\']([^"\']*\.pdf)["\']', script_text, re.IGNORECASE)
-            for url in urls:
-                if len(url) > 5:
-                    full_url = resolve_href(url)
-                    if full_url and is_valid_catalog(full_url):
-                        catalogs.add(full_url)
+        for url in _PDF_IN_JS_RE.findall('\n'.join(scripts)):
+            if len(url) > 5:
+                add(url)
 
         return catalogs
 
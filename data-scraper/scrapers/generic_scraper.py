@@ -7,22 +7,33 @@ Her türlü firma web sitesinden katalog ve iletişim bilgisi
 çıkarmak için tasarlanmış esnek bir scraper.
 """
 
+import copy
 import re
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Set, Tuple
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 # Config'den ayarları al
 try:
     from config.settings import (
-        VALID_EXTENSIONS,
+        VALID_EXTENSIONS_TUPLE,
         CATALOG_KEYWORDS,
         CATALOG_PAGE_KEYWORDS,
+        CATALOG_PAGE_KEYWORDS_LOWER,
         CONTACT_KEYWORDS,
-        PHONE_PATTERN,
-        PHONE_PATTERNS,
-        INVALID_PHONE_STARTS,
+        CONTACT_KEYWORDS_LOWER,
+        EMAIL_RE,
+        scan_phones,
+        CRAWL_WORKERS,
+        DOWNLOAD_WORKERS,
+        MAX_CATALOGS_PER_SITE,
+        MISSING_URL_TTL_DAYS,
+        INVALID_PHONE_STARTS_TUPLE,
         VALID_AREA_CODES,
         EMAIL_PATTERN,
         STATUS_SUCCESS,
@@ -34,20 +45,27 @@ try:
         EMAIL_LABELS,
         ADDRESS_LABELS,
         EMAIL_EXCLUDE_DOMAINS,
-        EMAIL_EXCLUDE_EXTENSIONS,
+        EMAIL_EXCLUDE_EXTENSIONS_TUPLE,
         PDF_POSITIVE_KEYWORDS,
-        PDF_NEGATIVE_KEYWORDS
+        PDF_NEGATIVE_KEYWORDS,
+        keyword_re
     )
 except ImportError:
-    VALID_EXTENSIONS = ['.pdf', '.doc', '.docx', '.xls', '.xlsx']
+    VALID_EXTENSIONS_TUPLE = ('.doc', '.docx', '.pdf', '.xls', '.xlsx')
     CATALOG_KEYWORDS = ['katalog', 'catalog', 'urun', 'product', 'dokuman', 'document', 'brosur', 'brochure']
     CATALOG_PAGE_KEYWORDS = ['katalog', 'catalog', 'download', 'indir', 'dokuman', 'document']
     CONTACT_KEYWORDS = ['iletisim', 'contact', 'hakkimizda', 'about', 'kurumsal']
-    PHONE_PATTERN = r'(?:\+90|0)?[\s.-]?(?:\(?\d{3}\)?[\s.-]?)?\d{3}[\s.-]?\d{2}[\s.-]?\d{2}'
-    PHONE_PATTERNS = [PHONE_PATTERN]
-    INVALID_PHONE_STARTS = ['0000', '1111', '1234', '0900', '0800']
+    CATALOG_PAGE_KEYWORDS_LOWER = tuple(CATALOG_PAGE_KEYWORDS)
+    CONTACT_KEYWORDS_LOWER = tuple(CONTACT_KEYWORDS)
+    PHONE_RE = re.compile(r'(?:\+90|0)?[\s.-]?(?:\(?\d{3}\)?[\s.-]?)?\d{3}[\s.-]?\d{2}[\s.-]?\d{2}')
+    INVALID_PHONE_STARTS_TUPLE = ('0000', '0800', '0900', '1111', '1234')
     VALID_AREA_CODES = ['212', '216', '312', '232', '224', '530', '531', '532', '533', '534', '535']
     EMAIL_PATTERN = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+    EMAIL_RE = re.compile(EMAIL_PATTERN)
+    CRAWL_WORKERS = 4
+    DOWNLOAD_WORKERS = 4
+    MAX_CATALOGS_PER_SITE = 20
+    MISSING_URL_TTL_DAYS = 0
     STATUS_SUCCESS = 'SUCCESS'
     STATUS_PARTIAL = 'PARTIAL'
     STATUS_FAILED = 'FAILED'
@@ -57,19 +75,489 @@ except ImportError:
     EMAIL_LABELS = ['email', 'e-mail', 'e-posta', 'mail']
     ADDRESS_LABELS = ['adres', 'address', 'merkez', 'fabrika']
     EMAIL_EXCLUDE_DOMAINS = ['example.com', 'test.com']
-    EMAIL_EXCLUDE_EXTENSIONS = ['.png', '.jpg', '.jpeg', '.gif']
+    EMAIL_EXCLUDE_EXTENSIONS_TUPLE = ('.gif', '.jpeg', '.jpg', '.png')
     PDF_POSITIVE_KEYWORDS = ['katalog', 'catalog', 'product', 'urun']
     PDF_NEGATIVE_KEYWORDS = ['privacy', 'policy', 'terms', 'legal']
 
+    def scan_phones(text: str) -> List[Tuple[int, int]]:
+        return [m.span() for m in PHONE_RE.finditer(text)]
+
+    def keyword_re(words):
+        return re.compile('|'.join(re.escape(w.lower()) for w in words))
+
 from scrapers.base_scraper import BaseScraper
 from scrapers.catalog_strategies import StrategyManager
 from utils.logger import get_logger
 from utils.file_downloader import FileDownloader
+from utils.http_cache import get_http_cache
 from utils.validators import determine_status, has_contact_info
 from utils.location_extractor import extract_city_district
 
 logger = get_logger(__name__)
 
+# Katalog sayfası linkleri için genişletilmiş anahtar kelimeler (_find_all_catalogs)
+EXTENDED_PAGE_KEYWORDS = CATALOG_PAGE_KEYWORDS_LOWER + (
+    'urunler', 'ürünler', 'products', 'product',
+    'dosyalar', 'dosya', 'files', 'file',
+    'belgeler', 'belge', 'documents',
+    'medya', 'media', 'basin', 'press',
+    'teknik', 'technical', 'spec', 'specification',
+    'bilgi', 'info', 'kaynak', 'resource'
+)
+
+# Sitemap'te katalog sayfası olabilecek URL'ler (_check_sitemap_for_catalogs)
+_SITEMAP_CATALOG_URL_RE = keyword_re((
+    'katalog', 'catalog', 'download', 'indir',
+    'dokuman', 'document', 'pdf', 'brosur', 'brochure'
+))
+
+# URL'si bu kelimelerden birini içeren alt sayfa katalog sayfası sayılır (_find_all_catalogs)
+_CATALOG_PAGE_URL_RE = keyword_re((
+    'katalog', 'catalog', 'download', 'indir',
+    'urunler', 'urun', 'products', 'dosya', 'brosur', 'brochure'
+))
+
+# <a> etiketlerinde dosya URL'si taşıyabilen data-* attribute'ları (extract_catalog_links)
+_LINK_DATA_ATTRS = ('data-href', 'data-url', 'data-file', 'data-download', 'data-src')
+
+# =============================================================================
+# DERLENMİŞ REGEX'LER
+# =============================================================================
+# Sayfa başına onlarca kez çağrılan yardımcılar pattern'leri her seferinde
+# re modülünün önbelleğinden aramasın diye import sırasında derlenir.
+
+# onclick içindeki JavaScript yönlendirmeleri (extract_catalog_links)
+_ONCLICK_URL_RES = (
+    re.compile(r"window\.open\(['\"]([^'\"]+)['\"]"),
+    re.compile(r"location\.href\s*=\s*['\"]([^'\"]+)['\"]"),
+    re.compile(r"window\.location\s*=\s*['\"]([^'\"]+)['\"]"),
+    re.compile(r"download\(['\"]([^'\"]+)['\"]"),
+)
+
+# Script içindeki PDF URL'leri (extract_catalog_links). Her pattern ancak
+# katlanmış script metninde ilk elemandaki parça geçiyorsa eşleşebilir;
+# geçmiyorsa tarama atlanır (hepsi '.pdf' gerektirir).
+_SCRIPT_PDF_RES = (
+    ('.pdf', re.compile(r'["\']([^"\']*\.pdf)["\']', re.IGNORECASE)),
+    ('url:', re.compile(r'url:\s*["\']([^"\']*\.pdf)["\']', re.IGNORECASE)),
+    ('href:', re.compile(r'href:\s*["\']([^"\']*\.pdf)["\']', re.IGNORECASE)),
+    ('file:', re.compile(r'file:\s*["\']([^"\']*\.pdf)["\']', re.IGNORECASE)),
+)
+
+_MAILTO_HREF_RE = re.compile(r'^mailto:', re.IGNORECASE)
+_TEL_HREF_RE = re.compile(r'^tel:', re.IGNORECASE)
+
+# Semantik iletişim alanları (_extract_from_semantic_elements) — öncelik sırasıyla.
+# DOM birleşik selector ile tek kez gezilir; her selector'ın eşleşmeleri sonra
+# bu aday listesi üzerinden ayrılır.
+_SEMANTIC_CONTACT_SELECTORS = (
+    'address',
+    '[class*="contact"]',
+    '[class*="iletisim"]',
+    '[id*="contact"]',
+    '[id*="iletisim"]',
+    'footer [class*="info"]',
+    '[class*="footer"] [class*="contact"]',
+    '[itemtype*="Organization"]',
+    '[itemtype*="LocalBusiness"]',
+)
+_SEMANTIC_CONTACT_ANY = sv.compile(', '.join(_SEMANTIC_CONTACT_SELECTORS))
+_SEMANTIC_CONTACT_PATTERNS = tuple(sv.compile(sel) for sel in _SEMANTIC_CONTACT_SELECTORS)
+
+# Açıklama paragrafı aranırken yok sayılan gürültülü alanlar ve tercih
+# sırasına göre içerik bölgeleri (_extract_first_meaningful_paragraph)
+_DESCRIPTION_NOISE_TAGS = ('nav', 'header', 'footer', 'script',
+                           'style', 'noscript', 'aside')
+_DESCRIPTION_CONTAINER_SELECTORS = tuple(sv.compile(sel) for sel in (
+    'main', 'article', '[class*="about"]', '[class*="hakkimizda"]',
+    '[class*="kurumsal"]', '[class*="content"]', '[id*="about"]',
+    '[id*="content"]', 'section', '.container', 'body',
+))
+
+
+def _fold_label_text(text: str) -> str:
+    """
+    Literal ön kontrolleri (label, script PDF parçaları) için küçük harfe indirir.
+
+    re.IGNORECASE 'i' ile 'ı'/'İ' ve 's' ile 'ſ'yi de eşler; str.lower()
+    bunları eşlemediği için ayrıca katlanır. Böylece label katlanmış metinde
+    geçmiyorsa label'lı pattern'in eşleşemeyeceği kesindir.
+    """
+    return text.lower().replace('ı', 'i').replace('\u0307', '').replace('ſ', 's')
+
+
+def _label_spans(label_re: 're.Pattern', text: str) -> Tuple[List[int], List[int]]:
+    """Label'ın metindeki tüm (çakışanlar dahil) başlangıç ve bitiş konumlarını döndürür."""
+    starts = []
+    ends = []
+    label_match = label_re.search(text)
+    while label_match is not None:
+        starts.append(label_match.start())
+        ends.append(label_match.end())
+        label_match = label_re.search(text, label_match.start() + 1)
+    return starts, ends
+
+
+def _iter_labeled(label_re: 're.Pattern', value_re: 're.Pattern', text: str,
+                  spans: Optional[Tuple[List[int], List[int]]] = None):
+    """
+    `(?:label)value` pattern'inin eşleşmelerini (value match'leri) üretir.
+
+    Label düz metin olduğu için önce label aranır; pahalı value kısmı
+    yalnızca label'ın bittiği noktada denenir. Sonuç, birleşik pattern'in
+    findall/search sonucuyla aynıdır (eşleşme yoksa bir sonraki karakterden,
+    varsa eşleşmenin sonundan devam edilir).
+
+    Aynı label birden fazla value pattern'iyle taranacaksa `_label_spans`
+    sonucu `spans` olarak verilir; metin label için tekrar taranmaz.
+    """
+    if spans is None:
+        pos = 0
+        while True:
+            label_match = label_re.search(text, pos)
+            if label_match is None:
+                return
+            value_match = value_re.match(text, label_match.end())
+            if value_match is None:
+                pos = label_match.start() + 1
+            else:
+                yield value_match
+                pos = value_match.end()
+
+    starts, ends = spans
+    index = 0
+    while index < len(starts):
+        value_match = value_re.match(text, ends[index])
+        if value_match is None:
+            index += 1
+        else:
+            yield value_match
+            # Eşleşmenin içinde kalan label konumları atlanır
+            index = bisect_left(starts, value_match.end(), index + 1)
+
+
+# Etiketli pattern'ler (_extract_from_labeled_patterns) — label sırası korunur.
+# Her kayıt (katlanmış label, label regex'i, value regex'i): label sayfada
+# yoksa tarama atlanır.
+_EXTENDED_PHONE_LABELS = list(PHONE_LABELS) + [
+    'tel.', 'tel:', 'telefon:', 'phone:', 'gsm:', 'cep:', 'mobil:',
+    'santral', 'pbx'
+]
+# Label'dan sonra gelen 10-25 karakterlik numara bölgesi (esnek ayraç)
+_PHONE_LABEL_VALUE_RES = (
+    re.compile(r'[\s:]*([+\d\s\-\(\)\/\.]{10,25})'),
+    re.compile(r'\s*[:=]?\s*([+\d\s\-\(\)\/\.]{10,25})'),
+)
+_PHONE_LABEL_RES = tuple(
+    (_fold_label_text(label), re.compile(re.escape(label), re.IGNORECASE), _PHONE_LABEL_VALUE_RES)
+    for label in _EXTENDED_PHONE_LABELS
+)
+
+# '@' tek başına çok geniş olduğu için label listesinde yer almaz
+_EXTENDED_EMAIL_LABELS = list(EMAIL_LABELS) + [
+    'e-mail:', 'email:', 'e-posta:', 'mail:', 'iletişim:',
+    'contact:', 'adres:', 'electronic mail'
+]
+_EMAIL_LABEL_VALUE_RE = re.compile(rf'[\s:]*({EMAIL_PATTERN})', re.IGNORECASE)
+_EMAIL_LABEL_RES = tuple(
+    (_fold_label_text(label), re.compile(re.escape(label), re.IGNORECASE), _EMAIL_LABEL_VALUE_RE)
+    for label in _EXTENDED_EMAIL_LABELS
+)
+
+_EXTENDED_ADDRESS_LABELS = list(ADDRESS_LABELS) + [
+    'adres:', 'address:', 'merkez:', 'fabrika:', 'lokasyon:',
+    'konum:', 'location:', 'genel müdürlük:', 'headquarters:'
+]
+_ADDRESS_LABEL_VALUE_RE = re.compile(r'[\s:]*([^\n]{20,250})', re.IGNORECASE)
+_ADDRESS_LABEL_RES = tuple(
+    (_fold_label_text(label), re.compile(re.escape(label), re.IGNORECASE), _ADDRESS_LABEL_VALUE_RE)
+    for label in _EXTENDED_ADDRESS_LABELS
+)
+
+# Email varyantları (_find_emails_in_text). Her pattern ancak metinde ilk
+# elemandaki ayırıcı geçiyorsa eşleşebilir; ayırıcı yoksa tarama atlanır.
+_EXTRA_EMAIL_RES = (
+    ('@', re.compile(r'[\w.+-]+\s*@\s*[\w.-]+\.\w{2,}', re.IGNORECASE)),  # Boşluklu format
+    ('[at]', re.compile(r'[\w.+-]+\s*\[at\]\s*[\w.-]+\.\w{2,}', re.IGNORECASE)),  # [at] formatı
+    ('(at)', re.compile(r'[\w.+-]+\s*\(at\)\s*[\w.-]+\.\w{2,}', re.IGNORECASE)),  # (at) formatı
+)
+_AT_WORD_RE = re.compile(r'\s*\[at\]\s*|\s*\(at\)\s*', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Telefon temizleme — regex yerine str.translate tabloları
+class _KeepDigitsTable(dict):
+    """
+    str.translate tablosu: ondalık rakamları (regex \\d ile aynı küme) ve
+    `keep` karakterlerini korur, diğer karakterleri siler.
+
+    Tüm Unicode aralığı önceden kurulmaz; her karakterin kararı ilk
+    görüldüğünde hesaplanıp tabloya yazılır.
+    """
+
+    def __init__(self, keep: str = ''):
+        super().__init__()
+        self._keep = frozenset(map(ord, keep))
+
+    def __missing__(self, code: int) -> Optional[int]:
+        value = code if chr(code).isdecimal() or code in self._keep else None
+        self[code] = value
+        return value
+
+
+_DIGITS_TABLE = _KeepDigitsTable()            # re.sub(r'\D', '', s) ile aynı
+_PHONE_CHARS_TABLE = _KeepDigitsTable('+')    # re.sub(r'[^\d+]', '', s) ile aynı
+
+# Numara tipi önekleri (rakamlar üzerinde, _select_best_phone)
+_LANDLINE_PREFIXES = ('902', '02')
+_MOBILE_PREFIXES = ('905', '05')
+
+# Adres aramasında atlanacak metinleri işaret eden kelimeler (küçük harfli
+# metinde tek regex taraması)
+_ADDRESS_EXCLUDE_RE = re.compile('|'.join(map(re.escape, (
+    # Gizlilik/yasal
+    'cookie', 'çerez', 'kişisel veri', 'gizlilik', 'privacy',
+    'politika', 'policy', 'kabul', 'accept', 'depolama',
+    'kvkk', 'gdpr', 'sözleşme', 'kullanım koşulları',
+    # Anlamsız fragmanlar
+    'gerekmektedir', 'gereklidir', 'yapılmalıdır', 'edilmelidir',
+    'tıklayınız', 'tıklayın', 'click', 'button',
+    # Navigasyon/menü
+    'satış bölge', 'bölge müdür', 'yetkili servis', 'bayi listesi',
+    'harita', 'yol tarifi', 'map', 'direction',
+    # Diğer alakasız
+    'haber', 'duyuru', 'blog', 'makale', 'tweet', 'facebook',
+    'instagram', 'linkedin', 'youtube', 'sosyal medya',
+    'sepet', 'ödeme', 'kargo', 'teslimat', 'fatura',
+))))
+
+# Adres pattern'leri (_find_address_in_text) — öncelik sırasına göre. İkisi de
+# "Mah"/"Mahallesi" içermek zorunda; küçük harfli metinde 'mah' yoksa çalıştırılmaz.
+_ADDRESS_RES = (
+    # Tam adres formatı (en güvenilir)
+    re.compile(r'([A-ZÇĞİÖŞÜa-zçğıöşü\s]+(?:Mah\.?|Mahallesi)\s*,?\s*[A-ZÇĞİÖŞÜa-zçğıöşü\s]+(?:Cad\.?|Caddesi|Sok\.?|Sokak|Blv\.?|Bulvar)\s*(?:No\.?\s*:?\s*\d+)?[^.]*?\d{5}[^.]*?(?:İstanbul|Ankara|İzmir|Bursa|Antalya|Konya|Adana|Gaziantep|Kocaeli|Mersin|Kayseri|Eskişehir|Denizli|Manisa|Sakarya|Samsun|Trabzon)[^.]*)', re.IGNORECASE),
+    # Mahalle + Cadde/Sokak + Şehir
+    re.compile(r'([A-ZÇĞİÖŞÜa-zçğıöşü\s]+(?:Mah\.?|Mahallesi)[^.]*?(?:Cad\.?|Caddesi|Sok\.?|Sokak|Blv\.?|Bulvar)[^.]*?(?:İstanbul|Ankara|İzmir|Bursa|Antalya|Konya|Adana|Gaziantep|Kocaeli|Mersin|Türkiye))', re.IGNORECASE),
+)
+# Fallback: basit adres göstergeleri
+_ADDRESS_INDICATOR_RES = (
+    re.compile(r'\b(?:Mah|Mahallesi|Sok|Sokak|Cad|Caddesi|Bulvar|Blv)\b', re.IGNORECASE),
+    re.compile(r'\b(?:No|No\.)\s*[:\s]*\d+[^.]*?(?:Kat|Daire)\s*[:\s]*\d+', re.IGNORECASE),
+)
+_ADDRESS_CITY_RE = re.compile(
+    r'(?:İstanbul|Ankara|İzmir|Bursa|Antalya|Konya|Adana|Gaziantep|Kocaeli|Mersin|Türkiye)',
+    re.IGNORECASE
+)
+
+# Adres doğrulama (_is_valid_address) — küçük harfli metin üzerinde
+_STREET_COMPONENT_RES = (
+    re.compile(r'\b(?:mah\.?|mahallesi)\b'),  # Mahalle
+    re.compile(r'\b(?:sok\.?|sokak|sokağı)\b'),  # Sokak
+    re.compile(r'\b(?:cad\.?|caddesi|cadde)\b'),  # Cadde
+    re.compile(r'\b(?:bulvar|blv\.?)\b'),  # Bulvar
+)
+_HOUSE_NUMBER_RE = re.compile(r'\bno\.?\s*[:\s]*\d+')
+_POSTAL_CODE_RE = re.compile(r'\b\d{5}\b')
+
+
+# =============================================================================
+# İLETİŞİM DEĞERİ DOĞRULAMA / NORMALİZASYON
+# =============================================================================
+# Aynı email/telefon sayfa içinde birden çok stratejiden (mailto, footer,
+# etiketli pattern, tam metin) tekrar tekrar geçer — saf fonksiyonlar,
+# sonuçlar önbellekli. GenericScraper._is_valid_email / _format_phone bunları çağırır.
+@lru_cache(maxsize=2048)
+def _valid_email(email: str) -> bool:
+    if not email:
+        return False
+
+    email_lower = email.lower().strip()
+
+    # Minimum uzunluk kontrolü (x@y.zz = en az 6 karakter)
+    if len(email_lower) < 6:
+        return False
+
+    # @ işareti kontrolü
+    if '@' not in email_lower or email_lower.count('@') != 1:
+        return False
+
+    # Hariç tutulan uzantıları kontrol et (görsel dosyaları)
+    if email_lower.endswith(EMAIL_EXCLUDE_EXTENSIONS_TUPLE):
+        return False
+
+    # Hariç tutulan domain'leri kontrol et
+    for domain in EMAIL_EXCLUDE_DOMAINS:
+        if domain in email_lower:
+            return False
+
+    # Placeholder email'leri reddet
+    placeholder_patterns = [
+        'example.com', 'test.com', 'sample.com', 'demo.com', 'dummy.com',
+        'email@email', 'your@email', 'name@email', 'user@email',
+        'xxx@', 'abc@abc', 'info@info.', 'admin@admin.',
+        '@localhost', '@domain.com', '@yoursite', '@yourdomain',
+        'placeholder', 'noreply@example', 'no-reply@example'
+    ]
+    if any(ph in email_lower for ph in placeholder_patterns):
+        return False
+
+    # Tam eşleşme gereken placeholder'lar
+    exact_placeholders = [
+        'info@info.com', 'test@test.com', 'admin@admin.com',
+        'email@email.com', 'mail@mail.com', 'user@user.com'
+    ]
+    if email_lower in exact_placeholders:
+        return False
+
+    # Domain kısmını kontrol et
+    parts = email_lower.split('@')
+    if len(parts) != 2:
+        return False
+
+    local_part, domain = parts
+
+    # Local part kontrolü
+    if not local_part or len(local_part) < 1:
+        return False
+
+    # Domain kontrolü
+    if not domain or '.' not in domain:
+        return False
+
+    # Domain TLD kontrolü
+    domain_parts = domain.split('.')
+    tld = domain_parts[-1]
+    if len(tld) < 2 or len(tld) > 10:
+        return False
+
+    # Sadece rakamlardan oluşan domain'leri reddet
+    if domain.replace('.', '').isdigit():
+        return False
+
+    # Temel format kontrolü
+    if not EMAIL_RE.match(email):
+        return False
+
+    return True
+
+
+def _has_invalid_phone_start(digits: str) -> bool:
+    """Numara (veya son 10 hanesi) geçersiz bir önekle başlıyor mu?"""
+    return (digits.startswith(INVALID_PHONE_STARTS_TUPLE)
+            or digits[-10:].startswith(INVALID_PHONE_STARTS_TUPLE))
+
+
+@lru_cache(maxsize=2048)
+def _formatted_phone(phone: str) -> str:
+    if not phone:
+        return ''
+
+    # Sadece rakam ve + işaretini koru
+    cleaned = phone.translate(_PHONE_CHARS_TABLE)
+
+    # Çok kısa numaraları reddet
+    if len(cleaned) < 10:
+        return ''
+
+    # Çok uzun numaraları kırp (extension olabilir)
+    if len(cleaned) > 15:
+        cleaned = cleaned[:13]  # +90 + 10 hane
+
+    # Farklı formatları normalize et
+    # 0090 -> +90
+    if cleaned.startswith('0090'):
+        cleaned = '+9' + cleaned[2:]
+    # 90 (+ olmadan) -> +90
+    elif cleaned.startswith('90') and len(cleaned) == 12:
+        cleaned = '+' + cleaned
+    # 0 ile başlıyor ve 11 hane -> +90 ekle
+    elif cleaned.startswith('0') and len(cleaned) == 11:
+        cleaned = '+9' + cleaned
+    # 10 hane (alan kodu dahil, başında 0 yok)
+    elif len(cleaned) == 10 and not cleaned.startswith('+'):
+        cleaned = '+90' + cleaned
+
+    # Formatlama: +90 XXX XXX XX XX
+    if cleaned.startswith('+90') and len(cleaned) == 13:
+        return f"+90 {cleaned[3:6]} {cleaned[6:9]} {cleaned[9:11]} {cleaned[11:13]}"
+    # +90 ile başlıyor ama 13 haneden uzun (extension var)
+    elif cleaned.startswith('+90') and len(cleaned) > 13:
+        base = f"+90 {cleaned[3:6]} {cleaned[6:9]} {cleaned[9:11]} {cleaned[11:13]}"
+        ext = cleaned[13:]
+        if ext:
+            return f"{base} (Dahili: {ext})"
+        return base
+    # Diğer formatlar için orijinal temizlenmiş hali döndür
+    elif len(cleaned) >= 10:
+        return cleaned
+
+    return ''
+
+
+# =============================================================================
+# KATALOG ALT SAYFALARI İÇİN KISMİ PARSE
+# =============================================================================
+# Alt katalog sayfalarında yalnızca extract_catalog_links / find_pages_by_keywords
+# kullanılır; bu etiketler dışındaki DOM hiç oluşturulmaz. Eşleşen etiketin
+# tüm alt ağacı korunur, bu yüzden link metinleri tam parse ile aynıdır.
+_CATALOG_LINK_TAGS = frozenset(('a', 'embed', 'object', 'iframe', 'script'))
+_CATALOG_ONCLICK_TAGS = frozenset(('button', 'div', 'span'))
+_CATALOG_DATA_ATTRS = ('data-pdf', 'data-file-url')
+
+
+def _is_catalog_link_tag(name: str, attrs: Dict) -> bool:
+    """extract_catalog_links'in bakacağı bir etiket mi?"""
+    if name in _CATALOG_LINK_TAGS:
+        return True
+    if not attrs:
+        return False
+    if name in _CATALOG_ONCLICK_TAGS and 'onclick' in attrs:
+        return True
+    return any(attr in attrs for attr in _CATALOG_DATA_ATTRS)
+
+
+class _CatalogLinkStrainer(SoupStrainer):
+    """
+    Etiket adı ve attribute'larına birlikte bakan SoupStrainer.
+
+    Standart SoupStrainer ad ve attribute koşullarını VE ile bağlar;
+    burada "onclick'li buton VEYA data-pdf'li herhangi bir etiket" gerekir.
+    """
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        # bs4 >= 4.13
+        return _is_catalog_link_tag(name, attrs)
+
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        # bs4 < 4.13
+        return markup_name if _is_catalog_link_tag(markup_name, markup_attrs) else None
+
+
+_CATALOG_LINK_STRAINER = _CatalogLinkStrainer()
+
+# Sitemap'lerden yalnızca <loc> değerleri okunur; diğer etiketler
+# (lastmod, image:image, ...) için ağaç nesnesi oluşturulmaz
+_SITEMAP_LOC_STRAINER = SoupStrainer('loc')
+
+
+# =============================================================================
+# SAYFA METNİ
+# =============================================================================
+
+def _page_strings(soup: BeautifulSoup) -> List[str]:
+    """
+    Sayfanın metin düğümlerini döndürür; sonuç soup üzerinde saklanır.
+
+    Aynı soup hem içerik uzunluğu kontrolünde hem de iletişim çıkarımında
+    kullanıldığı için ağaç yalnızca bir kez gezilir. ''.join(sonuç)
+    soup.get_text() ile aynıdır. Soup sonradan değiştirilmemelidir.
+    """
+    # getattr kullanılmaz: Tag.__getattr__ bilinmeyen adı etiket olarak arar
+    strings = soup.__dict__.get('_page_strings')
+    if strings is None:
+        strings = list(soup.strings)
+        soup._page_strings = strings
+    return strings
+
 
 class GenericScraper(BaseScraper):
     """
@@ -103,7 +591,9 @@ class GenericScraper(BaseScraper):
             use_multi_strategy: Multi-strateji sistemini kullan (varsayılan: True)
         """
         super().__init__()
-        self.downloader = FileDownloader(base_dir=catalogs_dir)
+        # İndirici scraper'ın session'ını paylaşır: sitenin sayfaları için
+        # açılan keep-alive bağlantılar katalog indirmelerinde de kullanılır
+        self.downloader = FileDownloader(base_dir=catalogs_dir, session=self.session)
         self.visited_urls: Set[str] = set()
         self.max_depth = max_depth
         self.use_multi_strategy = use_multi_strategy
@@ -171,6 +661,10 @@ class GenericScraper(BaseScraper):
 
             base_url = self.get_base_url(website)
             self.visited_urls.clear()
+            self._missing_urls.clear()
+            # Aynı scraper birden fazla firmada kullanılıyor — driver'ı
+            # yeniden başlatmak yerine önceki sitenin durumunu temizle
+            self.reset_browser_state()
 
             logger.info(f"Scraping başladı: {company_name}")
 
@@ -185,7 +679,7 @@ class GenericScraper(BaseScraper):
                 # Önce requests dene (hızlı)
                 main_soup = self.fetch_page(website)
                 # İçerik yetersizse Selenium'a geç
-                if not main_soup or len(main_soup.get_text().strip()) < 500:
+                if not main_soup or len(''.join(_page_strings(main_soup)).strip()) < 500:
                     logger.debug(f"Requests yetersiz, Selenium deneniyor: {website}")
                     main_soup = self.fetch_page_with_js(website)
 
@@ -214,6 +708,9 @@ class GenericScraper(BaseScraper):
             # =================================================================
             contact_info = self._find_contact_info(main_soup, base_url)
 
+            # Bu sitede 404/410 dönen yollar sonraki çalıştırmalarda denenmez
+            self._remember_missing_urls()
+
             result['phone'] = contact_info.get('phone', '')
             result['email'] = contact_info.get('email', '')
             result['address'] = contact_info.get('address', '')
@@ -250,6 +747,26 @@ class GenericScraper(BaseScraper):
 
         return result
 
+    def _drop_known_missing(self, urls: List[str]) -> List[str]:
+        """
+        Önceki çalıştırmalarda 404/410 döndüğü bilinen URL'leri listeden çıkarır.
+
+        Sadece tahmin edilen adreslere (yaygın yollar, sitemap) uygulanır;
+        sayfadaki linklerden bulunan URL'ler her zaman denenir.
+        """
+        if MISSING_URL_TTL_DAYS <= 0:
+            return urls
+        missing = get_http_cache().missing_urls(urls, MISSING_URL_TTL_DAYS * 86400)
+        if missing:
+            logger.debug(f"Önceden 404 dönen {len(missing)} yol atlandı")
+            return [url for url in urls if url not in missing]
+        return urls
+
+    def _remember_missing_urls(self) -> None:
+        """Bu taramada 404/410 dönen URL'leri kalıcı önbelleğe yazar."""
+        if MISSING_URL_TTL_DAYS > 0 and self._missing_urls:
+            get_http_cache().mark_missing(self._missing_urls)
+
     def _is_js_heavy(self, url: str) -> bool:
         """URL'nin bilinen JS-heavy domain listesinde olup olmadığını kontrol eder."""
         try:
@@ -281,30 +798,31 @@ class GenericScraper(BaseScraper):
         """
         all_catalogs: Set[str] = set()
 
+        def enough() -> bool:
+            # Yeterli katalog bulunduysa kalan sayfalar için istek atılmaz
+            return 0 < MAX_CATALOGS_PER_SITE <= len(all_catalogs)
+
         # 1. Ana sayfadan katalog linkleri (ana sayfa katalog sayfası sayılmaz)
         main_catalogs = self.extract_catalog_links(main_soup, base_url, from_catalog_page=False)
         all_catalogs.update(main_catalogs)
         logger.debug(f"Ana sayfada {len(main_catalogs)} katalog bulundu")
+        if enough():
+            return list(all_catalogs)
 
         # 2. Genişletilmiş katalog sayfa anahtar kelimeleri
-        extended_page_keywords = CATALOG_PAGE_KEYWORDS + [
-            'urunler', 'ürünler', 'products', 'product',
-            'dosyalar', 'dosya', 'files', 'file',
-            'belgeler', 'belge', 'documents',
-            'medya', 'media', 'basin', 'press',
-            'teknik', 'technical', 'spec', 'specification',
-            'bilgi', 'info', 'kaynak', 'resource'
-        ]
-
         catalog_pages = self.find_pages_by_keywords(
-            main_soup, base_url, extended_page_keywords
+            main_soup, base_url, EXTENDED_PAGE_KEYWORDS
         )
+        # Üyelik kontrolleri için listeyle birlikte tutulur (liste sırası korunur)
+        catalog_pages_set: Set[str] = set(catalog_pages)
 
         # 3. Sitemap kontrolü
         sitemap_catalogs = self._check_sitemap_for_catalogs(base_url)
         if sitemap_catalogs:
             logger.debug(f"Sitemap'te {len(sitemap_catalogs)} potansiyel katalog sayfası bulundu")
-            catalog_pages.extend(sitemap_catalogs)
+            for url in sitemap_catalogs:
+                catalog_pages.append(url)
+                catalog_pages_set.add(url)
 
         # 4. Yaygın katalog URL'lerini dene - /tr/ prefix'li olanlar önce
         common_catalog_paths = [
@@ -330,61 +848,73 @@ class GenericScraper(BaseScraper):
             '/kurumsal/katalog', '/kurumsal/dokuman',
         ]
 
-        for path in common_catalog_paths:
-            potential_url = base_url.rstrip('/') + path
-            if potential_url not in catalog_pages and potential_url not in self.visited_urls:
+        common_urls = self._drop_known_missing(
+            [base_url.rstrip('/') + path for path in common_catalog_paths]
+        )
+        for potential_url in common_urls:
+            if potential_url not in catalog_pages_set and potential_url not in self.visited_urls:
                 catalog_pages.append(potential_url)
+                catalog_pages_set.add(potential_url)
 
         # 5. Alt sayfaları tara (maksimum 15 sayfa)
         max_pages = 15
         pages_checked = 0
+        index = 0
+
+        while pages_checked < max_pages and index < len(catalog_pages) and not enough():
+            # Sıradaki ziyaret edilmemiş sayfaları grup halinde seç — requests
+            # istekleri paralel atılır, sonuçlar yine liste sırasıyla işlenir
+            batch: List[str] = []
+            while (index < len(catalog_pages) and len(batch) < CRAWL_WORKERS
+                   and pages_checked + len(batch) < max_pages):
+                page_url = catalog_pages[index]
+                index += 1
+                if page_url not in self.visited_urls and page_url not in batch:
+                    batch.append(page_url)
+
+            self.visited_urls.update(batch)
+            # Alt sayfalar yalnızca link taraması için kullanılır — kısmi parse
+            prefetched = self.fetch_pages(batch, strainer=_CATALOG_LINK_STRAINER)
+
+            for page_url in batch:
+                pages_checked += 1
+                logger.debug(f"Katalog sayfası taranıyor ({pages_checked}/{max_pages}): {page_url}")
+
+                # requests sonucu boşsa veya SPA ise Selenium (sıralı, driver thread-safe değil)
+                page_soup = prefetched[page_url]
+                if not page_soup:
+                    page_soup = self.fetch_page_with_js(page_url)
+                else:
+                    link_count = len(page_soup.find_all('a', href=True))
+                    if link_count < 5:
+                        # Sayfa yüklendi ama link çok az → SPA shell olabilir → Selenium dene
+                        selenium_soup = self.fetch_page_with_js(page_url)
+                        if selenium_soup and len(selenium_soup.find_all('a', href=True)) > link_count:
+                            page_soup = selenium_soup
 
-        for page_url in catalog_pages:
-            if pages_checked >= max_pages:
-                break
-
-            if page_url in self.visited_urls:
-                continue
-
-            self.visited_urls.add(page_url)
-            pages_checked += 1
-            logger.debug(f"Katalog sayfası taranıyor ({pages_checked}/{max_pages}): {page_url}")
-
-            # Önce requests ile dene (daha hızlı), başarısız olursa veya SPA ise Selenium
-            page_soup = self.fetch_page(page_url)
-
-            if not page_soup:
-                page_soup = self.fetch_page_with_js(page_url)
-            elif page_soup and len(page_soup.find_all('a', href=True)) < 5:
-                # Sayfa yüklendi ama link çok az → SPA shell olabilir → Selenium dene
-                selenium_soup = self.fetch_page_with_js(page_url)
-                if selenium_soup and len(selenium_soup.find_all('a', href=True)) > len(page_soup.find_all('a', href=True)):
-                    page_soup = selenium_soup
-
-            if page_soup:
-                # URL'de katalog/download kelimesi geçiyorsa katalog sayfası say
-                page_url_lower = page_url.lower()
-                is_catalog_page = any(
-                    kw in page_url_lower
-                    for kw in ['katalog', 'catalog', 'download', 'indir',
-                               'urunler', 'urun', 'products', 'dosya', 'brosur', 'brochure']
-                )
-                page_catalogs = self.extract_catalog_links(
-                    page_soup, base_url, from_catalog_page=is_catalog_page
-                )
-                all_catalogs.update(page_catalogs)
-
-                if page_catalogs:
-                    logger.debug(f"Alt sayfada {len(page_catalogs)} katalog bulundu: {page_url}")
-
-                # Alt sayfalarda da katalog sayfası linkleri ara (depth=2)
-                if pages_checked < max_pages // 2:
-                    sub_pages = self.find_pages_by_keywords(
-                        page_soup, base_url, CATALOG_PAGE_KEYWORDS[:5]
+                if page_soup:
+                    # URL'de katalog/download kelimesi geçiyorsa katalog sayfası say
+                    is_catalog_page = _CATALOG_PAGE_URL_RE.search(page_url.lower()) is not None
+                    page_catalogs = self.extract_catalog_links(
+                        page_soup, base_url, from_catalog_page=is_catalog_page
                     )
-                    for sub_url in sub_pages[:3]:
-                        if sub_url not in catalog_pages:
-                            catalog_pages.append(sub_url)
+                    all_catalogs.update(page_catalogs)
+
+                    if page_catalogs:
+                        logger.debug(f"Alt sayfada {len(page_catalogs)} katalog bulundu: {page_url}")
+                        if enough():
+                            logger.debug(f"Katalog sınırına ulaşıldı ({MAX_CATALOGS_PER_SITE}), tarama durduruldu")
+                            break
+
+                    # Alt sayfalarda da katalog sayfası linkleri ara (depth=2)
+                    if pages_checked < max_pages // 2:
+                        sub_pages = self.find_pages_by_keywords(
+                            page_soup, base_url, CATALOG_PAGE_KEYWORDS_LOWER[:5]
+                        )
+                        for sub_url in sub_pages[:3]:
+                            if sub_url not in catalog_pages_set:
+                                catalog_pages.append(sub_url)
+                                catalog_pages_set.add(sub_url)
 
         return list(all_catalogs)
 
@@ -442,30 +972,33 @@ class GenericScraper(BaseScraper):
             List[str]: Potansiyel katalog sayfası URL'leri
         """
         potential_pages = []
+        max_pages = 10
         sitemap_urls = [
             base_url.rstrip('/') + '/sitemap.xml',
             base_url.rstrip('/') + '/sitemap_index.xml',
             base_url.rstrip('/') + '/sitemap-index.xml',
         ]
 
+        # Üç aday birlikte çekilir (gecikmeler üst üste biner); sonuçlar yine
+        # sırayla işlenir, ilk katalog içeren sitemap kazanır
+        sitemap_urls = self._drop_known_missing(sitemap_urls)
+        prefetched = self.fetch_pages(sitemap_urls, strainer=_SITEMAP_LOC_STRAINER)
+
         for sitemap_url in sitemap_urls:
             try:
-                soup = self.fetch_page(sitemap_url)
+                soup = prefetched[sitemap_url]
                 if not soup:
                     continue
 
                 # URL'leri bul
                 for loc in soup.find_all('loc'):
                     url = loc.get_text().strip()
-                    url_lower = url.lower()
 
-                    # Katalog ile ilgili URL'leri filtrele
-                    catalog_indicators = [
-                        'katalog', 'catalog', 'download', 'indir',
-                        'dokuman', 'document', 'pdf', 'brosur', 'brochure'
-                    ]
-                    if any(ind in url_lower for ind in catalog_indicators):
+                    # Katalog ile ilgili URL'leri filtrele (tüm kelimeler tek taramada)
+                    if _SITEMAP_CATALOG_URL_RE.search(url.lower()):
                         potential_pages.append(url)
+                        if len(potential_pages) >= max_pages:
+                            break
 
                 if potential_pages:
                     break  # Sitemap bulunduysa diğerlerini deneme
@@ -474,7 +1007,7 @@ class GenericScraper(BaseScraper):
                 logger.debug(f"Sitemap kontrol hatası: {sitemap_url} - {e}")
                 continue
 
-        return potential_pages[:10]  # Maksimum 10 URL
+        return potential_pages  # Maksimum max_pages URL
 
     def extract_catalog_links(self, soup: BeautifulSoup, base_url: str,
                               from_catalog_page: bool = False) -> List[str]:
@@ -502,6 +1035,10 @@ class GenericScraper(BaseScraper):
 
         # (url, score, link_text) tuple'ları
         catalog_candidates: List[Tuple[str, int, str]] = []
+        # Aynı dosya sayfada çoğu zaman birkaç kez geçer (link, embed, script).
+        # Filtre ve skor yalnızca URL ve link metnine bağlı olduğundan aynı
+        # çift ikinci kez değerlendirilmez; sonuç listesi değişmez.
+        evaluated: Set[Tuple[str, str]] = set()
 
         def add_candidate(url: str, link_text: str = ''):
             """URL'yi candidate listesine ekle (filtreleme ile)"""
@@ -512,6 +1049,11 @@ class GenericScraper(BaseScraper):
             if not full_url:
                 return
 
+            key = (full_url, link_text)
+            if key in evaluated:
+                return
+            evaluated.add(key)
+
             should_download, reason = self.downloader.should_download_url(
                 full_url, link_text, from_catalog_page
             )
@@ -525,66 +1067,92 @@ class GenericScraper(BaseScraper):
         def has_valid_extension(url: str) -> bool:
             """URL'nin geçerli dosya uzantısı var mı"""
             url_lower = url.lower().split('?')[0]  # Query string'i kaldır
-            return any(url_lower.endswith(ext) for ext in VALID_EXTENSIONS)
+            return url_lower.endswith(VALID_EXTENSIONS_TUPLE)
+
+        # Link metni (get_text tüm alt ağacı dolaşır) yalnızca aday çıkan
+        # elementler için hesaplanır; attribute'lar doğrudan attrs dict'inden okunur.
+
+        # Ağaç tek geçişte gezilip elementler gruplara ayrılır; gruplar eskiden
+        # ayrı find_all çağrılarıyla yapılan sırayla işlenir (aday sırası aynı)
+        links, clickables, data_pdfs, data_files, embeds, scripts = [], [], [], [], [], []
+        for elem in soup.descendants:
+            if not isinstance(elem, Tag):
+                continue
+            name = elem.name
+            attrs = elem.attrs
+            if name == 'a':
+                if attrs.get('href') is not None:
+                    links.append(elem)
+            elif name == 'script':
+                scripts.append(elem)
+            elif name in ('embed', 'object', 'iframe'):
+                embeds.append(elem)
+            elif name in ('button', 'div', 'span'):
+                if attrs.get('onclick') is not None:
+                    clickables.append(elem)
+            if attrs.get('data-pdf') is not None:
+                data_pdfs.append(elem)
+            if attrs.get('data-file-url') is not None:
+                data_files.append(elem)
 
         # 1. Standart <a> linkleri
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            link_text = link.get_text().strip()
+        for link in links:
+            attrs = link.attrs
+            link_text = None
 
+            href = attrs['href']
             if has_valid_extension(href):
+                link_text = link.get_text().strip()
                 add_candidate(href, link_text)
 
             # data-* attribute'ları da kontrol et
-            for attr in ['data-href', 'data-url', 'data-file', 'data-download', 'data-src']:
-                data_url = link.get(attr)
+            for attr in _LINK_DATA_ATTRS:
+                data_url = attrs.get(attr)
                 if data_url and has_valid_extension(data_url):
+                    if link_text is None:
+                        link_text = link.get_text().strip()
                     add_candidate(data_url, link_text)
 
         # 2. Butonlar ve diğer tıklanabilir elementler
-        for elem in soup.find_all(['button', 'div', 'span'], attrs={'onclick': True}):
-            onclick = elem.get('onclick', '')
-            link_text = elem.get_text().strip()
+        for elem in clickables:
+            onclick = elem.attrs['onclick']
+            link_text = None
 
             # JavaScript'teki URL'leri çıkar
-            url_patterns = [
-                r"window\.open\(['\"]([^'\"]+)['\"]",
-                r"location\.href\s*=\s*['\"]([^'\"]+)['\"]",
-                r"window\.location\s*=\s*['\"]([^'\"]+)['\"]",
-                r"download\(['\"]([^'\"]+)['\"]",
-            ]
-            for pattern in url_patterns:
-                matches = re.findall(pattern, onclick)
+            for pattern in _ONCLICK_URL_RES:
+                matches = pattern.findall(onclick)
                 for url in matches:
                     if has_valid_extension(url):
+                        if link_text is None:
+                            link_text = elem.get_text().strip()
                         add_candidate(url, link_text)
 
         # 3. data-* attribute'lu tüm elementler
-        for elem in soup.find_all(attrs={'data-pdf': True}):
-            add_candidate(elem.get('data-pdf'), elem.get_text().strip())
-
-        for elem in soup.find_all(attrs={'data-file-url': True}):
-            add_candidate(elem.get('data-file-url'), elem.get_text().strip())
+        for attr, elems in (('data-pdf', data_pdfs), ('data-file-url', data_files)):
+            for elem in elems:
+                data_url = elem.attrs[attr]
+                if data_url:
+                    add_candidate(data_url, elem.get_text().strip())
 
         # 4. Embed edilmiş PDF'ler
-        for embed in soup.find_all(['embed', 'object', 'iframe']):
-            src = embed.get('src') or embed.get('data')
+        for embed in embeds:
+            attrs = embed.attrs
+            src = attrs.get('src') or attrs.get('data')
             if src and has_valid_extension(src):
                 add_candidate(src, '')
 
         # 5. Sayfadaki tüm script'lerde PDF URL'leri ara
-        for script in soup.find_all('script'):
+        for script in scripts:
             script_text = script.string or ''
             if script_text:
+                script_folded = _fold_label_text(script_text)
+                if '.pdf' not in script_folded:
+                    continue
                 # PDF URL pattern'leri
-                pdf_patterns = [
-                    r'["\']([^"\']*\.pdf)["\']',
-                    r'url:\s*["\']([^"\']*\.pdf)["\']',
-                    r'href:\s*["\']([^"\']*\.pdf)["\']',
-                    r'file:\s*["\']([^"\']*\.pdf)["\']',
-                ]
-                for pattern in pdf_patterns:
-                    matches = re.findall(pattern, script_text, re.IGNORECASE)
+                for required, pattern in _SCRIPT_PDF_RES:
+                    if required not in script_folded:
+                        continue
+                    matches = pattern.findall(script_text)
                     for url in matches:
                         if has_valid_extension(url) and len(url) > 10:
                             add_candidate(url, '')
@@ -655,65 +1223,83 @@ class GenericScraper(BaseScraper):
         ]
 
         # 3. Sayfadaki linklerden iletişim sayfalarını bul (navigasyondan gelenler önce)
-        found_pages = self.find_pages_by_keywords(main_soup, base_url, CONTACT_KEYWORDS)
+        found_pages = self.find_pages_by_keywords(main_soup, base_url, CONTACT_KEYWORDS_LOWER)
         contact_pages = list(dict.fromkeys(found_pages))  # navigasyon linkleri önce
 
-        for path in common_contact_paths:
-            url = base_url.rstrip('/') + path
-            if url not in contact_pages:
+        contact_pages_set: Set[str] = set(contact_pages)
+        common_urls = self._drop_known_missing(
+            [base_url.rstrip('/') + path for path in common_contact_paths]
+        )
+        for url in common_urls:
+            if url not in contact_pages_set:
                 contact_pages.append(url)
+                contact_pages_set.add(url)
 
         # 4. Her sayfayı dene (maksimum 12 sayfa)
         max_contact_pages = 12
         pages_tried = 0
-
-        for page_url in contact_pages:
-            if pages_tried >= max_contact_pages:
-                break
-
-            if page_url in self.visited_urls:
-                continue
-
-            self.visited_urls.add(page_url)
-            pages_tried += 1
-
-            logger.debug(f"İletişim sayfası taranıyor ({pages_tried}/{max_contact_pages}): {page_url}")
-
-            # Önce hızlı requests ile dene
-            page_soup = self.fetch_page(page_url)
-
-            # Selenium fallback: sayfa yüklenmediyse, çok kısaysa veya içerik
-            # yeterli ama hiç iletişim bilgisi bulunamadıysa (JS-rendered sayfalar)
-            if not page_soup:
-                page_soup = self.fetch_page_with_js(page_url)
-            else:
-                page_text = page_soup.get_text()
-                if len(page_text) < 500:
+        index = 0
+        found = False
+
+        while not found and pages_tried < max_contact_pages and index < len(contact_pages):
+            # Sıradaki ziyaret edilmemiş sayfalar grup halinde paralel çekilir;
+            # sonuçlar yine liste sırasıyla işlenir ve bilgiler tamamlanınca durulur
+            batch: List[str] = []
+            while (index < len(contact_pages) and len(batch) < CRAWL_WORKERS
+                   and pages_tried + len(batch) < max_contact_pages):
+                page_url = contact_pages[index]
+                index += 1
+                if page_url not in self.visited_urls and page_url not in batch:
+                    batch.append(page_url)
+
+            self.visited_urls.update(batch)
+            prefetched = self.fetch_pages(batch)
+
+            for page_url in batch:
+                pages_tried += 1
+
+                logger.debug(f"İletişim sayfası taranıyor ({pages_tried}/{max_contact_pages}): {page_url}")
+
+                # Önce hızlı requests ile dene (batch halinde önceden çekildi)
+                page_soup = prefetched[page_url]
+
+                # Selenium fallback: sayfa yüklenmediyse, çok kısaysa veya içerik
+                # yeterli ama hiç iletişim bilgisi bulunamadıysa (JS-rendered sayfalar)
+                quick = None
+                if not page_soup:
                     page_soup = self.fetch_page_with_js(page_url)
                 else:
-                    # Sayfa yüklendi ama iletişim bilgisi var mı kontrol et
-                    quick = self.extract_contact_info(page_soup)
-                    if not quick['phone'] and not quick['email']:
-                        logger.debug(f"Requests'te iletişim yok, Selenium deneniyor: {page_url}")
-                        selenium_soup = self.fetch_page_with_js(page_url)
-                        if selenium_soup:
-                            page_soup = selenium_soup
-
-            if page_soup:
-                page_contact = self.extract_contact_info(page_soup)
-
-                # Eksik bilgileri doldur
-                if not contact_info['phone'] and page_contact['phone']:
-                    contact_info['phone'] = page_contact['phone']
-                if not contact_info['email'] and page_contact['email']:
-                    contact_info['email'] = page_contact['email']
-                if not contact_info['address'] and page_contact['address']:
-                    contact_info['address'] = page_contact['address']
-
-                # Tüm bilgiler tamamlandıysa dur
-                if contact_info['phone'] and contact_info['email']:
-                    logger.debug(f"İletişim bilgileri bulundu: {page_url}")
-                    break
+                    page_text = ''.join(_page_strings(page_soup))
+                    if len(page_text) < 500:
+                        page_soup = self.fetch_page_with_js(page_url)
+                    else:
+                        # Sayfa yüklendi ama iletişim bilgisi var mı kontrol et
+                        quick = self.extract_contact_info(page_soup)
+                        if not quick['phone'] and not quick['email']:
+                            logger.debug(f"Requests'te iletişim yok, Selenium deneniyor: {page_url}")
+                            selenium_soup = self.fetch_page_with_js(page_url)
+                            if selenium_soup:
+                                page_soup = selenium_soup
+                                quick = None
+
+                if page_soup:
+                    # Sayfa değişmediyse hızlı kontrolün sonucu aynen geçerli —
+                    # aynı DOM ikinci kez taranmaz
+                    page_contact = quick if quick is not None else self.extract_contact_info(page_soup)
+
+                    # Eksik bilgileri doldur
+                    if not contact_info['phone'] and page_contact['phone']:
+                        contact_info['phone'] = page_contact['phone']
+                    if not contact_info['email'] and page_contact['email']:
+                        contact_info['email'] = page_contact['email']
+                    if not contact_info['address'] and page_contact['address']:
+                        contact_info['address'] = page_contact['address']
+
+                    # Tüm bilgiler tamamlandıysa dur
+                    if contact_info['phone'] and contact_info['email']:
+                        logger.debug(f"İletişim bilgileri bulundu: {page_url}")
+                        found = True
+                        break
 
         return contact_info
 
@@ -779,17 +1365,20 @@ class GenericScraper(BaseScraper):
         if not contact['phone'] or not contact['email']:
             contact = self._extract_from_semantic_elements(soup, contact)
 
+        # Strateji 4 ve 5 aynı sayfa metnini farklı ayraçlarla kullanır;
+        # DOM metin düğümleri soup başına yalnızca bir kez toplanır.
+
         # =================================================================
         # STRATEGY 4: Etiketli Pattern'ler
         # =================================================================
         if not contact['phone'] or not contact['email']:
-            contact = self._extract_from_labeled_patterns(soup, contact)
+            contact = self._extract_from_labeled_patterns('\n'.join(_page_strings(soup)), contact)
 
         # =================================================================
         # STRATEGY 5: Full-page regex (fallback)
         # =================================================================
         if not contact['phone'] or not contact['email']:
-            contact = self._extract_from_page_text(soup, contact)
+            contact = self._extract_from_page_text(' '.join(_page_strings(soup)), contact)
 
         # =================================================================
         # STRATEGY 6: <script> etiket içeriği — React/Angular inline data
@@ -1131,21 +1720,29 @@ class GenericScraper(BaseScraper):
             'established', 'manufacture', 'industry', 'product',
         }
 
-        # Gürültülü alanları soup'tan çıkar (kopya üzerinde çalış)
-        soup_copy = BeautifulSoup(str(soup), 'lxml')
-        for tag in soup_copy.find_all(['nav', 'header', 'footer', 'script',
-                                        'style', 'noscript', 'aside']):
-            tag.decompose()
+        # Gürültülü alanlar (nav, footer, script, ...) yok sayılır. Sayfanın
+        # tamamı kopyalanıp yeniden parse edilmez; gürültü içindeki elementler
+        # atlanır, yalnızca içinde gürültü etiketi olan paragraf kopyalanır.
+        def in_noise(elem) -> bool:
+            if elem.name in _DESCRIPTION_NOISE_TAGS:
+                return True
+            return any(parent.name in _DESCRIPTION_NOISE_TAGS for parent in elem.parents)
 
         # Tercihli içerik bölgeleri
         candidates = []
-        for selector in ['main', 'article', '[class*="about"]', '[class*="hakkimizda"]',
-                          '[class*="kurumsal"]', '[class*="content"]', '[id*="about"]',
-                          '[id*="content"]', 'section', '.container', 'body']:
-            container = soup_copy.select_one(selector)
+        for selector in _DESCRIPTION_CONTAINER_SELECTORS:
+            container = next(
+                (elem for elem in selector.iselect(soup) if not in_noise(elem)), None
+            )
             if not container:
                 continue
             for p in container.find_all('p'):
+                if any(parent.name in _DESCRIPTION_NOISE_TAGS for parent in p.parents):
+                    continue
+                if p.find(_DESCRIPTION_NOISE_TAGS):
+                    p = copy.copy(p)
+                    for tag in p.find_all(_DESCRIPTION_NOISE_TAGS):
+                        tag.decompose()
                 text = p.get_text(separator=' ', strip=True)
                 # Uzunluk kontrolü
                 if len(text) < 80 or len(text) > 2000:
@@ -1210,16 +1807,20 @@ class GenericScraper(BaseScraper):
                         contact['emails'].extend(emails)
 
                     # mailto: linklerinden email
-                    for mailto in footer.find_all('a', href=re.compile(r'^mailto:', re.I)):
+                    known_emails = set(contact['emails'])
+                    for mailto in footer.find_all('a', href=_MAILTO_HREF_RE):
                         email = mailto['href'].replace('mailto:', '').split('?')[0].strip()
-                        if self._is_valid_email(email) and email not in contact['emails']:
+                        if self._is_valid_email(email) and email not in known_emails:
+                            known_emails.add(email)
                             contact['emails'].append(email)
 
                     # tel: linklerinden telefon
-                    for tel in footer.find_all('a', href=re.compile(r'^tel:', re.I)):
+                    known_phones = set(contact['phones'])
+                    for tel in footer.find_all('a', href=_TEL_HREF_RE):
                         phone = tel['href'].replace('tel:', '').strip()
                         formatted = self._format_phone(phone)
-                        if formatted and formatted not in contact['phones']:
+                        if formatted and formatted not in known_phones:
+                            known_phones.add(formatted)
                             contact['phones'].append(formatted)
 
             except Exception:
@@ -1230,21 +1831,15 @@ class GenericScraper(BaseScraper):
     def _extract_from_semantic_elements(self, soup: BeautifulSoup,
                                          contact: Dict) -> Dict:
         """Semantik HTML etiketlerinden iletişim bilgisi çıkarır."""
-        contact_selectors = [
-            'address',
-            '[class*="contact"]',
-            '[class*="iletisim"]',
-            '[id*="contact"]',
-            '[id*="iletisim"]',
-            'footer [class*="info"]',
-            '[class*="footer"] [class*="contact"]',
-            '[itemtype*="Organization"]',
-            '[itemtype*="LocalBusiness"]',
-        ]
+        try:
+            candidates = _SEMANTIC_CONTACT_ANY.select(soup)
+        except Exception:
+            return contact
 
-        for selector in contact_selectors:
+        # Selector sırası korunur: önce tüm <address>'ler, sonra contact class'ları...
+        for pattern in _SEMANTIC_CONTACT_PATTERNS:
             try:
-                elements = soup.select(selector)
+                elements = [el for el in candidates if pattern.match(el)]
                 for element in elements:
                     element_text = element.get_text(separator=' ', strip=True)
 
@@ -1259,7 +1854,7 @@ class GenericScraper(BaseScraper):
                         contact['emails'].extend(emails)
 
                         # mailto: linklerini de kontrol et
-                        for mailto in element.find_all('a', href=re.compile(r'^mailto:', re.I)):
+                        for mailto in element.find_all('a', href=_MAILTO_HREF_RE):
                             email = mailto['href'].replace('mailto:', '').split('?')[0].strip()
                             if self._is_valid_email(email):
                                 contact['emails'].append(email)
@@ -1274,70 +1869,50 @@ class GenericScraper(BaseScraper):
 
         return contact
 
-    def _extract_from_labeled_patterns(self, soup: BeautifulSoup,
+    def _extract_from_labeled_patterns(self, page_text: str,
                                         contact: Dict) -> Dict:
         """
         Etiketli pattern'lerden iletişim bilgisi çıkarır (geliştirilmiş versiyon).
 
         Telefon etiketleri etrafındaki numaraları daha geniş bir alanda arar.
-        """
-        page_text = soup.get_text(separator='\n')
-
-        # Genişletilmiş telefon label'ları
-        extended_phone_labels = PHONE_LABELS + [
-            'tel.', 'tel:', 'telefon:', 'phone:', 'gsm:', 'cep:', 'mobil:',
-            't.', 'fon', 'numarası', 'numarasi', 'no:', 'santral', 'pbx'
-        ]
 
-        # Telefon label'ları ile ara - daha geniş pattern
-        for label in extended_phone_labels:
-            # Label'dan sonra gelen numarayı bul (daha esnek pattern)
-            patterns = [
-                rf'(?:{re.escape(label)})[\s:]*([+\d\s\-\(\)\/\.]{10,25})',
-                rf'(?:{re.escape(label)})\s*[:=]?\s*([+\d\s\-\(\)\/\.]{10,25})',
-            ]
-
-            for pattern in patterns:
-                matches = re.findall(pattern, page_text, re.IGNORECASE)
-                for match in matches:
-                    formatted = self._format_phone(match)
-                    if formatted and formatted not in contact['phones']:
-                        # Fax olmadığından emin ol
-                        match_pos = page_text.lower().find(match.lower())
-                        if match_pos >= 0:
-                            context_start = max(0, match_pos - 30)
-                            context_end = min(len(page_text), match_pos + len(match) + 10)
-                            context = page_text[context_start:context_end].lower()
-                            if not any(fax in context for fax in FAX_LABELS):
-                                contact['phones'].append(formatted)
-
-        # Genişletilmiş email label'ları
-        extended_email_labels = EMAIL_LABELS + [
-            'e-mail:', 'email:', 'e-posta:', 'mail:', 'iletişim:',
-            'contact:', '@', 'adres:', 'electronic mail'
-        ]
+        Args:
+            page_text: Metin düğümleri satır sonuyla birleştirilmiş sayfa metni
+            contact: Doldurulan iletişim sözlüğü
+        """
+        page_folded = _fold_label_text(page_text)
 
-        # Email label'ları ile ara
-        for label in extended_email_labels:
-            if label == '@':
-                continue  # @ tek başına çok geniş, atla
+        # Telefon label'ları ile ara - label'dan sonra gelen numara (esnek pattern)
+        known_phones = set(contact['phones'])
+        for label, label_re, value_res in _PHONE_LABEL_RES:
+            if label not in page_folded:
+                continue
+            # Label konumları iki value pattern'i için bir kez bulunur
+            spans = _label_spans(label_re, page_text)
+            for value_re in value_res:
+                for value_match in _iter_labeled(label_re, value_re, page_text, spans):
+                    formatted = self._validated_phone(page_text, *value_match.span(1))
+                    if formatted and formatted not in known_phones:
+                        known_phones.add(formatted)
+                        contact['phones'].append(formatted)
 
-            pattern = rf'(?:{re.escape(label)})[\s:]*({EMAIL_PATTERN})'
-            matches = re.findall(pattern, page_text, re.IGNORECASE)
-            for match in matches:
-                if self._is_valid_email(match) and match.lower() not in [e.lower() for e in contact['emails']]:
+        # Email label'ları ile ara (büyük/küçük harf duyarsız tekrar kontrolü)
+        known_emails = {e.lower() for e in contact['emails']}
+        for label, label_re, value_re in _EMAIL_LABEL_RES:
+            if label not in page_folded:
+                continue
+            for value_match in _iter_labeled(label_re, value_re, page_text):
+                match = value_match.group(1)
+                if self._is_valid_email(match) and match.lower() not in known_emails:
+                    known_emails.add(match.lower())
                     contact['emails'].append(match)
 
         # Adres label'ları ile ara
         if not contact['address']:
-            extended_address_labels = ADDRESS_LABELS + [
-                'adres:', 'address:', 'merkez:', 'fabrika:', 'lokasyon:',
-                'konum:', 'location:', 'genel müdürlük:', 'headquarters:'
-            ]
-
-            for label in extended_address_labels:
-                pattern = rf'(?:{re.escape(label)})[\s:]*([^\n]{{20,250}})'
-                match = re.search(pattern, page_text, re.IGNORECASE)
+            for label, label_re, value_re in _ADDRESS_LABEL_RES:
+                if label not in page_folded:
+                    continue
+                match = next(_iter_labeled(label_re, value_re, page_text), None)
                 if match:
                     address = self.clean_text(match.group(1))
                     # Adres doğrulama fonksiyonunu kullan
@@ -1353,6 +1928,8 @@ class GenericScraper(BaseScraper):
         React/Angular SPA'lar iletişim verisini JS bundle veya
         window.__data__ gibi değişkenlere gömer; get_text() bunları atlar.
         """
+        known_phones = set(contact['phones'])
+        known_emails = set(contact['emails'])
         for script in soup.find_all('script'):
             script_text = script.string
             if not script_text:
@@ -1364,13 +1941,15 @@ class GenericScraper(BaseScraper):
             if not contact['phone']:
                 phones = self._find_phones_in_text(script_text)
                 for p in phones:
-                    if p not in contact['phones']:
+                    if p not in known_phones:
+                        known_phones.add(p)
                         contact['phones'].append(p)
 
             if not contact['email']:
                 emails = self._find_emails_in_text(script_text)
                 for e in emails:
-                    if self._is_valid_email(e) and e not in contact['emails']:
+                    if self._is_valid_email(e) and e not in known_emails:
+                        known_emails.add(e)
                         contact['emails'].append(e)
 
             if contact['phone'] and contact['email']:
@@ -1380,25 +1959,30 @@ class GenericScraper(BaseScraper):
 
     def _extract_from_links(self, soup: BeautifulSoup, contact: Dict) -> Dict:
         """mailto: ve tel: linklerinden bilgi çıkarır."""
-        # mailto: linkleri
-        for link in soup.find_all('a', href=re.compile(r'^mailto:', re.I)):
-            email = link['href'].replace('mailto:', '').split('?')[0].strip()
-            if self._is_valid_email(email) and email not in contact['emails']:
-                contact['emails'].append(email)
-
-        # tel: linkleri
-        for link in soup.find_all('a', href=re.compile(r'^tel:', re.I)):
-            phone = link['href'].replace('tel:', '').strip()
-            formatted = self._format_phone(phone)
-            if formatted and formatted not in contact['phones']:
-                contact['phones'].append(formatted)
+        # mailto: ve tel: linkleri tek ağaç taramasında ayrılır
+        known_phones = set(contact['phones'])
+        known_emails = set(contact['emails'])
+        for link in soup.find_all('a', href=True):
+            href = link['href']
+            scheme = href[:7].lower()
+
+            if scheme == 'mailto:':
+                email = href.replace('mailto:', '').split('?')[0].strip()
+                if self._is_valid_email(email) and email not in known_emails:
+                    known_emails.add(email)
+                    contact['emails'].append(email)
+
+            elif scheme[:4] == 'tel:':
+                phone = href.replace('tel:', '').strip()
+                formatted = self._format_phone(phone)
+                if formatted and formatted not in known_phones:
+                    known_phones.add(formatted)
+                    contact['phones'].append(formatted)
 
         return contact
 
-    def _extract_from_page_text(self, soup: BeautifulSoup, contact: Dict) -> Dict:
+    def _extract_from_page_text(self, page_text: str, contact: Dict) -> Dict:
         """Tam sayfa metin taraması ile iletişim bilgisi çıkarır (fallback)."""
-        page_text = soup.get_text(separator=' ')
-
         # Tüm telefonları bul
         if not contact['phone']:
             phones = self._find_phones_in_text(page_text)
@@ -1411,81 +1995,82 @@ class GenericScraper(BaseScraper):
 
         return contact
 
-    def _find_phones_in_text(self, text: str) -> List[str]:
+    def _validated_phone(self, text: str, match_pos: int, match_end: int) -> str:
         """
-        Metinden tüm telefon numaralarını bulur (geliştirilmiş versiyon).
+        Metindeki `text[match_pos:match_end]` aralığını telefon olarak doğrular.
 
-        Özellikler:
-        - Birden fazla regex pattern kullanır
-        - Geçersiz numaraları filtreler (0000, 1234 vb.)
-        - Alan kodu doğrulaması yapar
-        - Fax numaralarını hariç tutar
+        Uzunluk, geçersiz başlangıç, alan kodu ve fax bağlamı kontrollerinden
+        geçen numaranın formatlanmış halini, geçmezse '' döndürür.
         """
-        phones = []
-        seen_digits = set()  # Tekrarları önle
+        # Temizle ve formatla
+        formatted = self._format_phone(text[match_pos:match_end])
+        if not formatted:
+            return ''
 
-        # Tüm patternleri dene
-        all_patterns = PHONE_PATTERNS + [PHONE_PATTERN]
+        # Sadece rakamları al
+        digits = formatted.translate(_DIGITS_TABLE)
 
-        for pattern in all_patterns:
-            matches = re.findall(pattern, text)
+        # En az 10 rakam olmalı, çok uzunsa muhtemelen başka bir şey
+        if len(digits) < 10 or len(digits) > 14:
+            return ''
 
-            for match in matches:
-                # Temizle ve formatla
-                formatted = self._format_phone(match)
-                if not formatted:
-                    continue
+        # Geçersiz başlangıç kontrolü
+        if _has_invalid_phone_start(digits):
+            return ''
 
-                # Sadece rakamları al
-                digits = re.sub(r'\D', '', formatted)
+        # Alan kodu doğrulaması
+        area_code = None
+        if digits.startswith('90') and len(digits) >= 12:
+            area_code = digits[2:5]  # +90 XXX
+        elif digits.startswith('0') and len(digits) >= 11:
+            area_code = digits[1:4]  # 0XXX
+        elif len(digits) == 10:
+            area_code = digits[0:3]  # XXX (alan kodu dahil 10 hane)
+
+        # Alan kodu bilinmiyor ama uzunluk doğru ise kabul et
+        if area_code and area_code not in VALID_AREA_CODES:
+            # Çok yaygın olmayan alan kodları için yine de kabul et
+            # ama sadece uzunluk doğruysa
+            if not (len(digits) == 10 or len(digits) == 11 or len(digits) == 12):
+                return ''
 
-                # En az 10 rakam olmalı
-                if len(digits) < 10:
-                    continue
+        # Fax kontrolü - context'e bak
+        context_start = max(0, match_pos - 30)
+        context_end = min(len(text), match_end + 10)
+        context = text[context_start:context_end].lower()
 
-                # Çok uzun numaraları atla (muhtemelen başka bir şey)
-                if len(digits) > 14:
-                    continue
+        if any(fax in context for fax in FAX_LABELS):
+            return ''
 
-                # Tekrar kontrolü (aynı numaranın farklı formatları)
-                # Son 10 haneyi karşılaştır
-                last_10 = digits[-10:]
-                if last_10 in seen_digits:
-                    continue
+        return formatted
 
-                # Geçersiz başlangıç kontrolü
-                if any(digits.startswith(inv) or last_10.startswith(inv)
-                       for inv in INVALID_PHONE_STARTS):
-                    continue
+    def _find_phones_in_text(self, text: str) -> List[str]:
+        """
+        Metinden tüm telefon numaralarını bulur (geliştirilmiş versiyon).
 
-                # Alan kodu doğrulaması
-                area_code = None
-                if digits.startswith('90') and len(digits) >= 12:
-                    area_code = digits[2:5]  # +90 XXX
-                elif digits.startswith('0') and len(digits) >= 11:
-                    area_code = digits[1:4]  # 0XXX
-                elif len(digits) == 10:
-                    area_code = digits[0:3]  # XXX (alan kodu dahil 10 hane)
-
-                # Alan kodu bilinmiyor ama uzunluk doğru ise kabul et
-                if area_code and area_code not in VALID_AREA_CODES:
-                    # Çok yaygın olmayan alan kodları için yine de kabul et
-                    # ama sadece uzunluk doğruysa
-                    if not (len(digits) == 10 or len(digits) == 11 or len(digits) == 12):
-                        continue
+        Özellikler:
+        - Birden fazla regex pattern kullanır
+        - Geçersiz numaraları filtreler (0000, 1234 vb.)
+        - Alan kodu doğrulaması yapar
+        - Fax numaralarını hariç tutar
+        """
+        phones = []
+        seen_digits = set()  # Tekrarları önle
 
-                # Fax kontrolü - context'e bak
-                match_pos = text.find(match)
-                if match_pos >= 0:
-                    context_start = max(0, match_pos - 30)
-                    context_end = min(len(text), match_pos + len(match) + 10)
-                    context = text[context_start:context_end].lower()
+        # Tüm patternlerin eşleşme aralıkları (pattern sırasıyla)
+        for match_pos, match_end in scan_phones(text):
+            formatted = self._validated_phone(text, match_pos, match_end)
+            if not formatted:
+                continue
 
-                    if any(fax in context for fax in FAX_LABELS):
-                        continue
+            # Tekrar kontrolü (aynı numaranın farklı formatları)
+            # Son 10 haneyi karşılaştır
+            last_10 = formatted.translate(_DIGITS_TABLE)[-10:]
+            if last_10 in seen_digits:
+                continue
 
-                seen_digits.add(last_10)
-                phones.append(formatted)
+            seen_digits.add(last_10)
+            phones.append(formatted)
 
         return phones
 
@@ -1501,22 +2086,20 @@ class GenericScraper(BaseScraper):
         emails = []
         seen_emails = set()
 
-        # Ana pattern
-        matches = re.findall(EMAIL_PATTERN, text, re.IGNORECASE)
+        text_lower = text.lower()
 
-        # Ek patternler - farklı formatlar için
-        extra_patterns = [
-            r'[\w.+-]+\s*@\s*[\w.-]+\.\w{2,}',  # Boşluklu format
-            r'[\w.+-]+\s*\[at\]\s*[\w.-]+\.\w{2,}',  # [at] formatı
-            r'[\w.+-]+\s*\(at\)\s*[\w.-]+\.\w{2,}',  # (at) formatı
-        ]
+        # Ana pattern ('@' yoksa regex'i hiç çalıştırma)
+        matches = EMAIL_RE.findall(text) if '@' in text else []
 
-        for pattern in extra_patterns:
-            extra_matches = re.findall(pattern, text, re.IGNORECASE)
+        # Ek patternler - farklı formatlar için (ayırıcısı metinde yoksa atlanır)
+        for separator, pattern in _EXTRA_EMAIL_RES:
+            if separator not in text_lower:
+                continue
+            extra_matches = pattern.findall(text)
             # [at] ve (at) formatlarını @ ile değiştir
             for match in extra_matches:
-                normalized = re.sub(r'\s*\[at\]\s*|\s*\(at\)\s*', '@', match, flags=re.IGNORECASE)
-                normalized = re.sub(r'\s+', '', normalized)  # Boşlukları kaldır
+                normalized = _AT_WORD_RE.sub('@', match)
+                normalized = _WHITESPACE_RE.sub('', normalized)  # Boşlukları kaldır
                 matches.append(normalized)
 
         for email in matches:
@@ -1531,7 +2114,7 @@ class GenericScraper(BaseScraper):
                 continue
 
             # Context kontrolü - JavaScript/CSS içinde mi?
-            email_pos = text.lower().find(email)
+            email_pos = text_lower.find(email)
             if email_pos >= 0:
                 context_start = max(0, email_pos - 50)
                 context = text[context_start:email_pos].lower()
@@ -1550,36 +2133,13 @@ class GenericScraper(BaseScraper):
     def _find_address_in_text(self, text: str) -> Optional[str]:
         """Metinden adres çıkarmaya çalışır."""
         # Alakasız içerik kontrolü - bunları içeren metinleri atla
-        exclude_keywords = [
-            # Gizlilik/yasal
-            'cookie', 'çerez', 'kişisel veri', 'gizlilik', 'privacy',
-            'politika', 'policy', 'kabul', 'accept', 'depolama',
-            'kvkk', 'gdpr', 'sözleşme', 'kullanım koşulları',
-            # Anlamsız fragmanlar
-            'gerekmektedir', 'gereklidir', 'yapılmalıdır', 'edilmelidir',
-            'tıklayınız', 'tıklayın', 'click', 'button',
-            # Navigasyon/menü
-            'satış bölge', 'bölge müdür', 'yetkili servis', 'bayi listesi',
-            'harita', 'yol tarifi', 'map', 'direction',
-            # Diğer alakasız
-            'haber', 'duyuru', 'blog', 'makale', 'tweet', 'facebook',
-            'instagram', 'linkedin', 'youtube', 'sosyal medya',
-            'sepet', 'ödeme', 'kargo', 'teslimat', 'fatura',
-        ]
         text_lower = text.lower()
-        if any(kw in text_lower for kw in exclude_keywords):
+        if _ADDRESS_EXCLUDE_RE.search(text_lower):
             return None
 
         # Türkçe adres göstergeleri - öncelik sırasına göre
-        address_patterns = [
-            # Tam adres formatı (en güvenilir)
-            r'([A-ZÇĞİÖŞÜa-zçğıöşü\s]+(?:Mah\.?|Mahallesi)\s*,?\s*[A-ZÇĞİÖŞÜa-zçğıöşü\s]+(?:Cad\.?|Caddesi|Sok\.?|Sokak|Blv\.?|Bulvar)\s*(?:No\.?\s*:?\s*\d+)?[^.]*?\d{5}[^.]*?(?:İstanbul|Ankara|İzmir|Bursa|Antalya|Konya|Adana|Gaziantep|Kocaeli|Mersin|Kayseri|Eskişehir|Denizli|Manisa|Sakarya|Samsun|Trabzon)[^.]*)',
-            # Mahalle + Cadde/Sokak + Şehir
-            r'([A-ZÇĞİÖŞÜa-zçğıöşü\s]+(?:Mah\.?|Mahallesi)[^.]*?(?:Cad\.?|Caddesi|Sok\.?|Sokak|Blv\.?|Bulvar)[^.]*?(?:İstanbul|Ankara|İzmir|Bursa|Antalya|Konya|Adana|Gaziantep|Kocaeli|Mersin|Türkiye))',
-        ]
-
-        for pattern in address_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in (_ADDRESS_RES if 'mah' in text_lower else ()):
+            match = pattern.search(text)
             if match:
                 potential_address = match.group(1) if match.groups() else match.group(0)
                 cleaned = self.clean_text(potential_address)
@@ -1589,13 +2149,8 @@ class GenericScraper(BaseScraper):
                     return cleaned
 
         # Fallback: Basit adres göstergeleri ile
-        simple_indicators = [
-            r'\b(?:Mah|Mahallesi|Sok|Sokak|Cad|Caddesi|Bulvar|Blv)\b',
-            r'\b(?:No|No\.)\s*[:\s]*\d+[^.]*?(?:Kat|Daire)\s*[:\s]*\d+',
-        ]
-
-        for pattern in simple_indicators:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _ADDRESS_INDICATOR_RES:
+            match = pattern.search(text)
             if match:
                 # Cümle sınırlarını bul (nokta, virgül dizisi ile ayrılmış)
                 # Geriye doğru git, ilk büyük harfli kelimeyi bul
@@ -1605,12 +2160,9 @@ class GenericScraper(BaseScraper):
 
                 # İleriye doğru git, cümle sonuna veya şehir adına kadar
                 end = match.end()
-                city_match = re.search(
-                    r'(?:İstanbul|Ankara|İzmir|Bursa|Antalya|Konya|Adana|Gaziantep|Kocaeli|Mersin|Türkiye)',
-                    text[end:end+100], re.IGNORECASE
-                )
+                city_match = _ADDRESS_CITY_RE.search(text, end, end + 100)
                 if city_match:
-                    end = end + city_match.end()
+                    end = city_match.end()
                 else:
                     # Cümle sonuna kadar git
                     while end < len(text) and text[end] not in '.!?\n':
@@ -1666,21 +2218,15 @@ class GenericScraper(BaseScraper):
         if address.count('.') > 3:  # Çok fazla cümle sonu
             return False
 
-        # En az bir kesin adres bileşeni içermeli (ZORUNLU)
-        mandatory_components = [
-            r'\b(?:mah\.?|mahallesi)\b',  # Mahalle
-            r'\b(?:sok\.?|sokak|sokağı)\b',  # Sokak
-            r'\b(?:cad\.?|caddesi|cadde)\b',  # Cadde
-            r'\b(?:bulvar|blv\.?)\b',  # Bulvar
-        ]
-        has_street_component = any(re.search(p, address_lower) for p in mandatory_components)
+        # En az bir kesin adres bileşeni içermeli (ZORUNLU): mahalle, sokak, cadde, bulvar
+        has_street_component = any(p.search(address_lower) for p in _STREET_COMPONENT_RES)
 
         if not has_street_component:
             return False
 
         # Numara veya posta kodu varsa bonus
-        has_number = bool(re.search(r'\bno\.?\s*[:\s]*\d+', address_lower))
-        has_postal = bool(re.search(r'\b\d{5}\b', address_lower))
+        has_number = bool(_HOUSE_NUMBER_RE.search(address_lower))
+        has_postal = bool(_POSTAL_CODE_RE.search(address_lower))
 
         # Şehir adı kontrolü
         cities = [
@@ -1705,78 +2251,7 @@ class GenericScraper(BaseScraper):
         - Placeholder email'leri reddetme
         - Minimum uzunluk kontrolü
         """
-        if not email:
-            return False
-
-        email_lower = email.lower().strip()
-
-        # Minimum uzunluk kontrolü (x@y.zz = en az 6 karakter)
-        if len(email_lower) < 6:
-            return False
-
-        # @ işareti kontrolü
-        if '@' not in email_lower or email_lower.count('@') != 1:
-            return False
-
-        # Hariç tutulan uzantıları kontrol et (görsel dosyaları)
-        for ext in EMAIL_EXCLUDE_EXTENSIONS:
-            if email_lower.endswith(ext):
-                return False
-
-        # Hariç tutulan domain'leri kontrol et
-        for domain in EMAIL_EXCLUDE_DOMAINS:
-            if domain in email_lower:
-                return False
-
-        # Placeholder email'leri reddet
-        placeholder_patterns = [
-            'example.com', 'test.com', 'sample.com', 'demo.com', 'dummy.com',
-            'email@email', 'your@email', 'name@email', 'user@email',
-            'xxx@', 'abc@abc', 'info@info.', 'admin@admin.',
-            '@localhost', '@domain.com', '@yoursite', '@yourdomain',
-            'placeholder', 'noreply@example', 'no-reply@example'
-        ]
-        if any(ph in email_lower for ph in placeholder_patterns):
-            return False
-
-        # Tam eşleşme gereken placeholder'lar
-        exact_placeholders = [
-            'info@info.com', 'test@test.com', 'admin@admin.com',
-            'email@email.com', 'mail@mail.com', 'user@user.com'
-        ]
-        if email_lower in exact_placeholders:
-            return False
-
-        # Domain kısmını kontrol et
-        parts = email_lower.split('@')
-        if len(parts) != 2:
-            return False
-
-        local_part, domain = parts
-
-        # Local part kontrolü
-        if not local_part or len(local_part) < 1:
-            return False
-
-        # Domain kontrolü
-        if not domain or '.' not in domain:
-            return False
-
-        # Domain TLD kontrolü
-        domain_parts = domain.split('.')
-        tld = domain_parts[-1]
-        if len(tld) < 2 or len(tld) > 10:
-            return False
-
-        # Sadece rakamlardan oluşan domain'leri reddet
-        if domain.replace('.', '').isdigit():
-            return False
-
-        # Temel format kontrolü
-        if not re.match(EMAIL_PATTERN, email, re.IGNORECASE):
-            return False
-
-        return True
+        return _valid_email(email)
 
     def _select_best_phone(self, phones: List[str]) -> str:
         """
@@ -1791,19 +2266,18 @@ class GenericScraper(BaseScraper):
         if not phones:
             return ''
 
-        # 1. Sabit hat (02xx — şehre göre değişir, İstanbul'a özgü değil)
+        # Tek geçiş: ilk sabit hat hemen döner, ilk mobil hat yedekte tutulur
+        first_mobile = None
         for phone in phones:
-            digits = re.sub(r'\D', '', phone)
-            if digits.startswith('902') or digits.startswith('02'):
+            digits = phone.translate(_DIGITS_TABLE)
+            # 1. Sabit hat (02xx — şehre göre değişir, İstanbul'a özgü değil)
+            if digits.startswith(_LANDLINE_PREFIXES):
                 return phone
+            # 2. Mobil hat (05xx)
+            if first_mobile is None and digits.startswith(_MOBILE_PREFIXES):
+                first_mobile = phone
 
-        # 2. Mobil hat (05xx)
-        for phone in phones:
-            digits = re.sub(r'\D', '', phone)
-            if digits.startswith('905') or digits.startswith('05'):
-                return phone
-
-        return phones[0]
+        return first_mobile if first_mobile is not None else phones[0]
 
     def _select_best_email(self, emails: List[str]) -> str:
         """En iyi email'i seçer (info@, contact@ öncelikli)."""
@@ -1836,49 +2310,7 @@ class GenericScraper(BaseScraper):
         - 0XXX XXX XX XX
         - (0XXX) XXX XX XX
         """
-        if not phone:
-            return ''
-
-        # Sadece rakam ve + işaretini koru
-        cleaned = re.sub(r'[^\d+]', '', phone)
-
-        # Çok kısa numaraları reddet
-        if len(cleaned) < 10:
-            return ''
-
-        # Çok uzun numaraları kırp (extension olabilir)
-        if len(cleaned) > 15:
-            cleaned = cleaned[:13]  # +90 + 10 hane
-
-        # Farklı formatları normalize et
-        # 0090 -> +90
-        if cleaned.startswith('0090'):
-            cleaned = '+9' + cleaned[2:]
-        # 90 (+ olmadan) -> +90
-        elif cleaned.startswith('90') and len(cleaned) == 12:
-            cleaned = '+' + cleaned
-        # 0 ile başlıyor ve 11 hane -> +90 ekle
-        elif cleaned.startswith('0') and len(cleaned) == 11:
-            cleaned = '+9' + cleaned
-        # 10 hane (alan kodu dahil, başında 0 yok)
-        elif len(cleaned) == 10 and not cleaned.startswith('+'):
-            cleaned = '+90' + cleaned
-
-        # Formatlama: +90 XXX XXX XX XX
-        if cleaned.startswith('+90') and len(cleaned) == 13:
-            return f"+90 {cleaned[3:6]} {cleaned[6:9]} {cleaned[9:11]} {cleaned[11:13]}"
-        # +90 ile başlıyor ama 13 haneden uzun (extension var)
-        elif cleaned.startswith('+90') and len(cleaned) > 13:
-            base = f"+90 {cleaned[3:6]} {cleaned[6:9]} {cleaned[9:11]} {cleaned[11:13]}"
-            ext = cleaned[13:]
-            if ext:
-                return f"{base} (Dahili: {ext})"
-            return base
-        # Diğer formatlar için orijinal temizlenmiş hali döndür
-        elif len(cleaned) >= 10:
-            return cleaned
-
-        return ''
+        return _formatted_phone(phone)
 
     def _download_catalogs(self, catalog_urls: List[str],
                            company_name: str,
@@ -1886,6 +2318,10 @@ class GenericScraper(BaseScraper):
         """
         Katalog dosyalarını indirir.
 
+        İndirmeler DOWNLOAD_WORKERS thread'e dağıtılır; toplam süre dosyaların
+        gecikme toplamı yerine en yavaş dosyaya yaklaşır. Sonuç sırası
+        catalog_urls sırasıyla aynıdır.
+
         Args:
             catalog_urls: İndirilecek katalog URL'leri
             company_name: Firma adı (klasör için)
@@ -1894,15 +2330,17 @@ class GenericScraper(BaseScraper):
         Returns:
             List[str]: İndirilen dosya yolları
         """
-        downloaded = []
-
-        for url in catalog_urls:
+        def download(url: str) -> Dict[str, Any]:
             # trusted=True: URL'ler catalog discovery tarafından zaten vetting edildi
-            result = self.downloader.download(url, company_name, referer=base_url, trusted=True)
-            if result['success']:
-                downloaded.append(result['file_path'])
+            return self.downloader.download(url, company_name, referer=base_url, trusted=True)
+
+        if len(catalog_urls) <= 1 or DOWNLOAD_WORKERS <= 1:
+            results = [download(url) for url in catalog_urls]
+        else:
+            with ThreadPoolExecutor(max_workers=min(DOWNLOAD_WORKERS, len(catalog_urls))) as executor:
+                results = list(executor.map(download, catalog_urls))
 
-        return downloaded
+        return [result['file_path'] for result in results if result['success']]
 
     def extract_company_info(self, website: str, company_name: str,
                              sector: str = '') -> Dict[str, Any]:
@@ -1928,6 +2366,9 @@ class GenericScraper(BaseScraper):
         # Parent class'ın close'unu çağır
         super().close()
 
+        # İndirici bağlantı havuzunu kapat
+        self.downloader.close()
+
         # Strateji yöneticisini kapat
         if self._strategy_manager:
             try:
@@ -7,6 +7,8 @@ Yardımcı fonksiyonlar ve sınıflar.
 from .file_downloader import FileDownloader
 from .excel_writer import ExcelWriter
 from .json_writer import JSONWriter
+from .http_cache import HttpCache, get_http_cache
+from .host_slots import host_slot
 from .logger import get_logger
 from .validators import validate_catalog_exists, validate_company_data
 from .location_extractor import extract_city_district
@@ -15,6 +17,9 @@ __all__ = [
     'FileDownloader',
     'ExcelWriter',
     'JSONWriter',
+    'HttpCache',
+    'get_http_cache',
+    'host_slot',
     'get_logger',
     'validate_catalog_exists',
     'validate_company_data',
@@ -15,7 +15,8 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional
 
 import pandas as pd
-from openpyxl import load_workbook
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
 from openpyxl.utils.dataframe import dataframe_to_rows
 
@@ -25,6 +26,7 @@ try:
         EXCEL_FILE,
         EXCEL_COLUMNS,
         EXCEL_HEADERS,
+        EXCEL_HEADER_ROW,
         OUTPUT_DIR
     )
 except ImportError:
@@ -46,12 +48,40 @@ except ImportError:
         'status': 'Durum',
         'scrape_date': 'Tarih'
     }
+    EXCEL_HEADER_ROW = tuple(EXCEL_HEADERS[col] for col in EXCEL_COLUMNS)
 
 from utils.logger import get_logger
 from utils.validators import validate_company_data
 
 logger = get_logger(__name__)
 
+# Hücre stilleri (yeni dosya yazımı ve mevcut dosya formatlaması ortak)
+HEADER_FONT = Font(bold=True, color='FFFFFF')
+HEADER_FILL = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
+HEADER_ALIGNMENT = Alignment(horizontal='center', vertical='center')
+CELL_ALIGNMENT = Alignment(vertical='center')
+THIN_BORDER = Border(
+    left=Side(style='thin'),
+    right=Side(style='thin'),
+    top=Side(style='thin'),
+    bottom=Side(style='thin')
+)
+ROW_HEIGHT = 20
+
+# Kolon genişlikleri
+COLUMN_WIDTHS = {
+    'A': 25,  # Firma Adı
+    'B': 35,  # Web Sitesi
+    'C': 15,  # Sektör
+    'D': 18,  # Telefon
+    'E': 30,  # E-posta
+    'F': 40,  # Adres
+    'G': 12,  # Katalog Sayısı
+    'H': 50,  # Katalog Dosyaları
+    'I': 12,  # Durum
+    'J': 16   # Tarih
+}
+
 
 class ExcelWriter:
     """
@@ -67,6 +97,7 @@ class ExcelWriter:
         file_path: Excel dosya yolu
         columns: Kolon listesi
         headers: Kolon başlıkları (Türkçe)
+        header_row: columns sırasıyla Türkçe başlık satırı
 
     Example:
         >>> writer = ExcelWriter()
@@ -84,6 +115,7 @@ class ExcelWriter:
         self.file_path = file_path or EXCEL_FILE
         self.columns = EXCEL_COLUMNS
         self.headers = EXCEL_HEADERS
+        self.header_row = EXCEL_HEADER_ROW
         self.pending_data: List[Dict[str, Any]] = []
 
         # Output dizinini oluştur
@@ -167,17 +199,20 @@ class ExcelWriter:
             return False
 
         try:
-            # DataFrame oluştur
-            df = pd.DataFrame(self.pending_data)
-
-            # Kolon sıralaması
-            df = self._reorder_columns(df)
-
             # Mevcut dosya varsa ekle, yoksa yeni oluştur
             if os.path.exists(self.file_path):
+                # DataFrame oluştur
+                df = pd.DataFrame(self.pending_data)
+
+                # Kolon sıralaması
+                df = self._reorder_columns(df)
+
                 self._append_to_existing(df)
             else:
-                self._create_new_file(df)
+                # _prepare_data her satırı self.columns anahtarlarıyla üretir
+                self._create_new_file(
+                    [[row[col] for col in self.columns] for row in self.pending_data]
+                )
 
             logger.info(f"Excel kaydedildi: {self.file_path} ({len(self.pending_data)} kayıt)")
 
@@ -241,23 +276,45 @@ class ExcelWriter:
             if col not in df.columns:
                 df[col] = ''
 
-        return df[self.columns]
+        return df[list(self.columns)]
 
-    def _create_new_file(self, df: pd.DataFrame) -> None:
+    def _create_new_file(self, rows: List[List[Any]]) -> None:
         """
         Yeni Excel dosyası oluşturur.
 
+        openpyxl write-only modunda satırlar biçimlendirilmiş olarak tek
+        geçişte diske akıtılır; dosyayı yazıp formatlamak için tekrar
+        açıp kaydetmeye gerek kalmaz.
+
         Args:
-            df: Kaydedilecek DataFrame
+            rows: EXCEL_COLUMNS sırasında hücre değerleri
         """
-        # Türkçe başlıkları uygula
-        df_renamed = df.rename(columns=self.headers)
-
-        # Excel'e kaydet
-        df_renamed.to_excel(self.file_path, index=False, engine='openpyxl')
-
-        # Formatlama uygula
-        self._apply_formatting()
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet('Sheet1')
+
+        for col, width in COLUMN_WIDTHS.items():
+            ws.column_dimensions[col].width = width
+        ws.sheet_format.defaultRowHeight = ROW_HEIGHT
+        ws.sheet_format.customHeight = True
+
+        ws.append([self._styled_cell(ws, header, is_header=True) for header in self.header_row])
+        for values in rows:
+            ws.append([self._styled_cell(ws, value) for value in values])
+
+        wb.save(self.file_path)
+
+    @staticmethod
+    def _styled_cell(ws, value: Any, is_header: bool = False) -> WriteOnlyCell:
+        """Write-only sayfa için stil uygulanmış hücre oluşturur."""
+        cell = WriteOnlyCell(ws, value=value)
+        cell.border = THIN_BORDER
+        if is_header:
+            cell.font = HEADER_FONT
+            cell.fill = HEADER_FILL
+            cell.alignment = HEADER_ALIGNMENT
+        else:
+            cell.alignment = CELL_ALIGNMENT
+        return cell
 
     def _append_to_existing(self, df: pd.DataFrame) -> None:
         """
@@ -287,7 +344,7 @@ class ExcelWriter:
         except Exception as e:
             logger.error(f"Mevcut dosyaya ekleme hatası: {str(e)}")
             # Hata durumunda yeni dosya oluştur
-            self._create_new_file(df)
+            self._create_new_file(df.values.tolist())
 
     def _apply_formatting(self) -> None:
         """Excel dosyasına formatlama uygular."""
@@ -295,52 +352,26 @@ class ExcelWriter:
             wb = load_workbook(self.file_path)
             ws = wb.active
 
-            # Başlık stili
-            header_font = Font(bold=True, color='FFFFFF')
-            header_fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
-            header_alignment = Alignment(horizontal='center', vertical='center')
-
-            # Border stili
-            thin_border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-
             # Başlık satırını formatla
             for cell in ws[1]:
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = header_alignment
-                cell.border = thin_border
+                cell.font = HEADER_FONT
+                cell.fill = HEADER_FILL
+                cell.alignment = HEADER_ALIGNMENT
+                cell.border = THIN_BORDER
 
             # Veri hücrelerine border ekle
             for row in ws.iter_rows(min_row=2, max_row=ws.max_row):
                 for cell in row:
-                    cell.border = thin_border
-                    cell.alignment = Alignment(vertical='center')
+                    cell.border = THIN_BORDER
+                    cell.alignment = CELL_ALIGNMENT
 
             # Kolon genişliklerini ayarla
-            column_widths = {
-                'A': 25,  # Firma Adı
-                'B': 35,  # Web Sitesi
-                'C': 15,  # Sektör
-                'D': 18,  # Telefon
-                'E': 30,  # E-posta
-                'F': 40,  # Adres
-                'G': 12,  # Katalog Sayısı
-                'H': 50,  # Katalog Dosyaları
-                'I': 12,  # Durum
-                'J': 16   # Tarih
-            }
-
-            for col, width in column_widths.items():
+            for col, width in COLUMN_WIDTHS.items():
                 ws.column_dimensions[col].width = width
 
             # Satır yüksekliği
             for row in range(1, ws.max_row + 1):
-                ws.row_dimensions[row].height = 20
+                ws.row_dimensions[row].height = ROW_HEIGHT
 
             # Kaydet
             wb.save(self.file_path)
@@ -3,6 +3,8 @@
 import os
 import re
 import hashlib
+import tempfile
+import threading
 import requests
 from typing import Optional, Tuple, List, Dict
 from urllib.parse import urlparse, unquote
@@ -13,43 +15,68 @@ try:
     from config.settings import (
         CATALOGS_DIR,
         DOWNLOAD_TIMEOUT,
+        DOWNLOAD_WORKERS,
         MAX_RETRIES,
         USER_AGENT,
-        VALID_EXTENSIONS,
+        VALID_EXTENSIONS_TUPLE,
         PDF_POSITIVE_KEYWORDS,
         PDF_NEGATIVE_KEYWORDS,
+        PDF_NEGATIVE_RE,
+        PDF_POSITIVE_RE,
+        norm,
         PDF_MIN_SIZE,
         PDF_MAX_SIZE,
         CERT_BODY_FILENAME_PREFIXES,
+        CERT_BODY_FILENAME_PREFIXES_TUPLE,
         CERT_FILENAME_PATTERNS,
+        CERT_FILENAME_RE,
+        keyword_re,
     )
 except ImportError:
     CATALOGS_DIR = r'D:\Sanayi Marketi Output\catalogs'
     DOWNLOAD_TIMEOUT = 30
+    DOWNLOAD_WORKERS = 4
     MAX_RETRIES = 3
     USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    VALID_EXTENSIONS = ['.pdf', '.doc', '.docx', '.xls', '.xlsx']
+    VALID_EXTENSIONS_TUPLE = ('.doc', '.docx', '.pdf', '.xls', '.xlsx')
     PDF_POSITIVE_KEYWORDS = ['katalog', 'catalog', 'product', 'urun', 'fiyat', 'price']
     PDF_NEGATIVE_KEYWORDS = ['privacy', 'policy', 'terms', 'legal', 'kvkk', 'gizlilik']
+    PDF_NEGATIVE_RE = re.compile('|'.join(map(re.escape, PDF_NEGATIVE_KEYWORDS)))
+    PDF_POSITIVE_RE = re.compile('|'.join(map(re.escape, PDF_POSITIVE_KEYWORDS)))
     PDF_MIN_SIZE = 10000
     PDF_MAX_SIZE = 100000000
     CERT_BODY_FILENAME_PREFIXES = []
+    CERT_BODY_FILENAME_PREFIXES_TUPLE = ()
     CERT_FILENAME_PATTERNS = []
+    CERT_FILENAME_RE = re.compile(r'(?!)')  # hiçbir şeyle eşleşmez
 
+    def keyword_re(words) -> 're.Pattern':
+        return re.compile('|'.join(map(re.escape, words)))
+
+    def norm(text: str) -> str:
+        return text.lower()
+
+from utils.host_slots import host_slot
 from utils.logger import get_logger
 from utils.validators import sanitize_filename
 
 logger = get_logger(__name__)
 
+# Hash'ten oluşan dosya adları (buton görselleri vb.)
+_HASH_FILENAME_RE = re.compile(r'^[a-f0-9]{20,}$')
 
 class FileDownloader:
     """Katalog dosyalarını indiren sınıf."""
 
-    def __init__(self, base_dir: Optional[str] = None):
+    def __init__(self, base_dir: Optional[str] = None,
+                 session: Optional[requests.Session] = None):
         self.base_dir = base_dir or CATALOGS_DIR
         self.timeout = DOWNLOAD_TIMEOUT
         self.max_retries = MAX_RETRIES
         self.downloaded_hashes: Dict[str, str] = {}  # hash -> file_path
+        # Paralel indirmelerde hash kontrolü + kayıt tek adımda yapılır
+        # (aynı içerik iki kez veya aynı dosya adına iki dosya yazılmasın)
+        self._save_lock = threading.Lock()
 
         # Headers
         self.headers = {
@@ -59,9 +86,21 @@ class FileDownloader:
             'Accept-Encoding': 'gzip, deflate, br'
         }
 
+        # Kalıcı session: aynı sitedeki ardışık katalog indirmeleri TCP/TLS
+        # bağlantısını yeniden kullanır (keep-alive connection pool). Scraper
+        # kendi session'ını verirse sayfa istekleriyle aynı havuz kullanılır;
+        # o durumda session'ı kapatmak sahibine kalır.
+        self.session = session or requests.Session()
+        self._owns_session = session is None
+
         # Ana dizini oluştur
         os.makedirs(self.base_dir, exist_ok=True)
 
+    def close(self) -> None:
+        """Bağlantı havuzunu kapatır (session dışarıdan verildiyse dokunmaz)."""
+        if self._owns_session:
+            self.session.close()
+
     def _normalize_turkish(self, text: str) -> str:
         """
         Türkçe karakterleri normalize eder (case-insensitive karşılaştırma için).
@@ -69,16 +108,7 @@ class FileDownloader:
         Türkçe İ/i ve I/ı harfleri Python'ın standart lower() fonksiyonu ile
         düzgün dönüşmez. Bu fonksiyon Türkçe karakterleri ASCII'ye çevirir.
         """
-        # Türkçe karakter dönüşüm tablosu
-        tr_map = str.maketrans({
-            'İ': 'i', 'I': 'i', 'ı': 'i',
-            'Ğ': 'g', 'ğ': 'g',
-            'Ü': 'u', 'ü': 'u',
-            'Ş': 's', 'ş': 's',
-            'Ö': 'o', 'ö': 'o',
-            'Ç': 'c', 'ç': 'c',
-        })
-        return text.translate(tr_map).lower()
+        return norm(text)
 
     # URL path'inde katalog olduğunu gösteren segmentler
     CATALOG_PATH_INDICATORS = [
@@ -88,6 +118,8 @@ class FileDownloader:
         '/dosya', '/dosyalar', '/brosur', '/brochure',
         '/fiyat', '/pricelist',
     ]
+    # Tüm göstergeler tek taramada (trie regex)
+    CATALOG_PATH_RE = keyword_re(CATALOG_PATH_INDICATORS)
 
     def should_download_url(self, url: str, link_text: str = '',
                             from_catalog_page: bool = False) -> Tuple[bool, str]:
@@ -106,8 +138,6 @@ class FileDownloader:
             link_text: Link metni (opsiyonel)
             from_catalog_page: Bu PDF bir katalog/download sayfasından mı bulundu?
         """
-        import re
-
         decoded_url = self._normalize_turkish(unquote(url))
         text_lower = self._normalize_turkish(link_text) if link_text else ''
 
@@ -116,29 +146,33 @@ class FileDownloader:
 
         # Hash'li dosya adı kontrolü — sadece /buttons/ dizininde atla
         name_without_ext = os.path.splitext(filename)[0]
-        if re.match(r'^[a-f0-9]{20,}$', name_without_ext.lower()):
+        if _HASH_FILENAME_RE.match(name_without_ext.lower()):
             if '/buttons/' in url.lower() or '/button/' in url.lower():
                 return False, "Hash-based filename in buttons directory"
 
         # 0. Sertifika kuruluşu dosya adı kontrolü
         # from_catalog_page=True olsa bile çalışır — gerçek katalog sayfalarında
         # sertifika belgeleri ürün kataloglarıyla aynı dizinde bulunabilir.
-        for cert_prefix in CERT_BODY_FILENAME_PREFIXES:
-            if filename_normalized.startswith(cert_prefix):
-                return False, f"Certification body filename prefix: {cert_prefix}"
-        for cert_pattern in CERT_FILENAME_PATTERNS:
-            if cert_pattern in filename_normalized:
-                return False, f"Certification filename pattern: {cert_pattern}"
+        # Dosyaların çoğu eşleşmez: tek çağrılık kontrol, sebep için liste
+        # yalnızca eşleşme olduğunda taranır.
+        if filename_normalized.startswith(CERT_BODY_FILENAME_PREFIXES_TUPLE):
+            for cert_prefix in CERT_BODY_FILENAME_PREFIXES:
+                if filename_normalized.startswith(cert_prefix):
+                    return False, f"Certification body filename prefix: {cert_prefix}"
+        if CERT_FILENAME_RE.search(filename_normalized):
+            for cert_pattern in CERT_FILENAME_PATTERNS:
+                if cert_pattern in filename_normalized:
+                    return False, f"Certification filename pattern: {cert_pattern}"
 
         combined = f"{decoded_url} {text_lower} {filename_normalized}"
 
         # 1. Negatif keyword varsa indir ME
-        for neg_kw in PDF_NEGATIVE_KEYWORDS:
-            if neg_kw in combined:
-                return False, f"Negative keyword: {neg_kw}"
+        neg_match = PDF_NEGATIVE_RE.search(combined)
+        if neg_match:
+            return False, f"Negative keyword: {neg_match.group(0)}"
 
         # 2. Pozitif keyword varsa İNDİR
-        if any(pos_kw in combined for pos_kw in PDF_POSITIVE_KEYWORDS):
+        if PDF_POSITIVE_RE.search(combined):
             return True, "Has positive keyword"
 
         # 3-4. PDF için ek kontrol
@@ -147,7 +181,7 @@ class FileDownloader:
                 return True, "PDF from catalog page"
 
             url_path = urlparse(url).path.lower()
-            if any(ind in url_path for ind in self.CATALOG_PATH_INDICATORS):
+            if self.CATALOG_PATH_RE.search(url_path):
                 return True, "PDF in catalog path"
 
             return False, "No catalog indicator found"
@@ -172,15 +206,17 @@ class FileDownloader:
         text_lower = link_text.lower() if link_text else ''
         combined = f"{url_lower} {text_lower}"
 
-        # Negatif keyword'ler skoru ciddi düşürür
-        for neg_kw in PDF_NEGATIVE_KEYWORDS:
-            if neg_kw in combined:
-                score -= 60
-                break
+        # Negatif keyword'ler skoru ciddi düşürür (keyword'ler Türkçe katlanmış)
+        folded = self._normalize_turkish(combined)
+        if PDF_NEGATIVE_RE.search(folded):
+            score -= 60
 
-        # Pozitif keyword'ler skoru artırır
-        positive_matches = sum(1 for pos_kw in PDF_POSITIVE_KEYWORDS if pos_kw in combined)
-        score += positive_matches * 15
+        # Pozitif keyword'ler skoru artırır. Her eşleşen keyword ayrı sayıldığı
+        # için liste taraması gerekir; ama URL'lerin çoğunda hiç pozitif keyword
+        # yoktur — tek regex taraması bunları liste döngüsüne girmeden eler.
+        if PDF_POSITIVE_RE.search(folded):
+            positive_matches = sum(1 for pos_kw in PDF_POSITIVE_KEYWORDS if pos_kw in combined)
+            score += positive_matches * 15
 
         # URL path analizi
         if '/catalog' in url_lower or '/katalog' in url_lower:
@@ -207,8 +243,10 @@ class FileDownloader:
         Returns:
             Tuple[bool, str]: (Geçerli mi, Sebep)
         """
-        content_size = len(content)
+        return self._check_pdf(len(content), content[:4])
 
+    def _check_pdf(self, content_size: int, header: bytes) -> Tuple[bool, str]:
+        """Boyutu ve ilk 4 byte'ı bilinen (diske stream edilmiş) PDF'i doğrular."""
         # Boyut kontrolü
         if content_size < PDF_MIN_SIZE:
             return False, f"Dosya çok küçük: {content_size} bytes (min: {PDF_MIN_SIZE})"
@@ -217,11 +255,63 @@ class FileDownloader:
             return False, f"Dosya çok büyük: {content_size} bytes (max: {PDF_MAX_SIZE})"
 
         # PDF header kontrolü
-        if content[:4] != b'%PDF':
+        if header != b'%PDF':
             return False, "Geçersiz PDF header"
 
         return True, "Valid PDF"
 
+    def precheck_size(self, response: requests.Response) -> Optional[str]:
+        """
+        Stream edilen yanıtın Content-Length başlığını PDF sınırlarıyla karşılaştırır.
+
+        Gövde henüz okunmamışken çağrılır; sınır dışındaysa sebep döner,
+        başlık yoksa veya geçersizse None (karar içerik doğrulamasına kalır).
+        Sıkıştırılmış yanıtlarda başlık sıkıştırılmış boyutu verdiği için
+        sadece üst sınır uygulanır.
+        """
+        try:
+            content_size = int(response.headers.get('Content-Length', ''))
+        except ValueError:
+            return None
+
+        if content_size > PDF_MAX_SIZE:
+            return f"Dosya çok büyük: {content_size} bytes (max: {PDF_MAX_SIZE})"
+
+        if content_size < PDF_MIN_SIZE and not response.headers.get('Content-Encoding'):
+            return f"Dosya çok küçük: {content_size} bytes (min: {PDF_MIN_SIZE})"
+
+        return None
+
+    def _stream_to_file(self, response: requests.Response, file,
+                        limit: Optional[int] = None) -> Tuple[int, bytes, str]:
+        """
+        Stream edilen yanıtı parça parça dosyaya yazar ve bağlantıyı bırakır.
+
+        Gövde hiçbir zaman bütünüyle bellekte tutulmaz; doğrulama ve duplicate
+        kontrolü için gereken boyut, ilk 4 byte ve MD5 yazarken hesaplanır.
+        `limit` verilirse en az o kadar byte okununca durulur.
+
+        Returns:
+            Tuple[int, bytes, str]: (okunan byte, ilk 4 byte, MD5 hash)
+        """
+        digest = hashlib.md5()
+        size = 0
+        header = b''
+        try:
+            for chunk in response.iter_content(chunk_size=65536):
+                if not chunk:
+                    continue
+                if len(header) < 4:
+                    header += chunk[:4 - len(header)]
+                digest.update(chunk)
+                file.write(chunk)
+                size += len(chunk)
+                if limit is not None and size >= limit:
+                    break
+        finally:
+            response.close()
+        return size, header, digest.hexdigest()
+
     def download(self, url: str, company_name: str,
                  custom_filename: Optional[str] = None,
                  link_text: str = '',
@@ -305,75 +395,98 @@ class FileDownloader:
             if referer:
                 req_headers['Referer'] = referer
 
-            for attempt in range(1, self.max_retries + 1):
-                try:
-                    logger.debug(f"İndiriliyor (deneme {attempt}): {url}")
-
+            # Host başına eşzamanlı indirme sınırı. Bir firmanın paralel
+            # indirmeleri ve aynı dosya sunucusuna (ortak CDN vb.) düşen farklı
+            # firma worker'ları birlikte en fazla DOWNLOAD_WORKERS bağlantı açar.
+            with host_slot(url, DOWNLOAD_WORKERS, pool='download'):
+                for attempt in range(1, self.max_retries + 1):
                     try:
-                        response = requests.get(
-                            url,
-                            headers=req_headers,
-                            timeout=self.timeout,
-                            stream=True,
-                            allow_redirects=True
-                        )
-                    except requests.exceptions.SSLError:
-                        # Geçersiz/kendinden imzalı SSL sertifikası — verify=False ile tekrar dene
-                        import urllib3
-                        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-                        logger.debug(f"SSL hatası, verify=False ile tekrar: {url}")
-                        response = requests.get(
-                            url,
-                            headers=req_headers,
-                            timeout=self.timeout,
-                            stream=True,
-                            allow_redirects=True,
-                            verify=False
-                        )
-                    response.raise_for_status()
-
-                    # İçeriği oku
-                    content = response.content
-
-                    # =================================================================
-                    # CONTENT VALIDATION (Yeni!)
-                    # =================================================================
-                    if filename.lower().endswith('.pdf'):
-                        is_valid, validation_msg = self.validate_pdf_content(content, url)
-                        if not is_valid:
-                            logger.debug(f"PDF doğrulama başarısız: {url} - {validation_msg}")
-                            result['skipped'] = True
-                            result['skip_reason'] = validation_msg
-                            return result
-
-                    # Hash kontrolü (içerik bazlı duplicate)
-                    content_hash = self._calculate_hash(content)
-
-                    if content_hash in self.downloaded_hashes:
-                        existing_file = self.downloaded_hashes[content_hash]
-                        logger.debug(f"Aynı içerik zaten mevcut: {existing_file}")
+                        logger.debug(f"İndiriliyor (deneme {attempt}): {url}")
+
+                        try:
+                            response = self.session.get(
+                                url,
+                                headers=req_headers,
+                                timeout=self.timeout,
+                                stream=True,
+                                allow_redirects=True
+                            )
+                        except requests.exceptions.SSLError:
+                            # Geçersiz/kendinden imzalı SSL sertifikası — verify=False ile tekrar dene
+                            import urllib3
+                            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+                            logger.debug(f"SSL hatası, verify=False ile tekrar: {url}")
+                            response = self.session.get(
+                                url,
+                                headers=req_headers,
+                                timeout=self.timeout,
+                                stream=True,
+                                allow_redirects=True,
+                                verify=False
+                            )
+                        response.raise_for_status()
+
+                        is_pdf = filename.lower().endswith('.pdf')
+                        if is_pdf:
+                            # Boyut sınırı dışındaki PDF'leri gövdeyi indirmeden ele
+                            size_msg = self.precheck_size(response)
+                            if size_msg:
+                                response.close()
+                                logger.debug(f"PDF boyut ön kontrolü: {url} - {size_msg}")
+                                result['skipped'] = True
+                                result['skip_reason'] = size_msg
+                                return result
+                        # Gövde geçici dosyaya stream edilir; doğrulanıp duplicate
+                        # değilse yerine taşınır, aksi halde silinir.
+                        # Content-Length yoksa da PDF_MAX_SIZE'ı aşan kısım okunmaz.
+                        fd, temp_path = tempfile.mkstemp(dir=company_dir, suffix='.part')
+                        try:
+                            with os.fdopen(fd, 'wb') as temp_file:
+                                content_size, header, content_hash = self._stream_to_file(
+                                    response, temp_file, PDF_MAX_SIZE + 1 if is_pdf else None
+                                )
+
+                            # =================================================================
+                            # CONTENT VALIDATION (Yeni!)
+                            # =================================================================
+                            if is_pdf:
+                                is_valid, validation_msg = self._check_pdf(content_size, header)
+                                if not is_valid:
+                                    logger.debug(f"PDF doğrulama başarısız: {url} - {validation_msg}")
+                                    result['skipped'] = True
+                                    result['skip_reason'] = validation_msg
+                                    return result
+
+                            # Hash kontrolü (içerik bazlı duplicate)
+                            with self._save_lock:
+                                if content_hash in self.downloaded_hashes:
+                                    existing_file = self.downloaded_hashes[content_hash]
+                                    logger.debug(f"Aynı içerik zaten mevcut: {existing_file}")
+                                    result['success'] = True
+                                    result['file_path'] = existing_file
+                                    result['skipped'] = True
+                                    result['skip_reason'] = "Duplicate content"
+                                    return result
+
+                                # Dosyayı yerine taşı
+                                file_path = self._store_file(temp_path, company_dir, filename)
+
+                                # Hash'leri kaydet
+                                self.downloaded_hashes[content_hash] = file_path
+                                self.downloaded_hashes[url_hash] = file_path
+                        finally:
+                            if os.path.exists(temp_path):
+                                os.remove(temp_path)
+
+                        logger.info(f"İndirildi: {filename}")
                         result['success'] = True
-                        result['file_path'] = existing_file
-                        result['skipped'] = True
-                        result['skip_reason'] = "Duplicate content"
+                        result['file_path'] = file_path
                         return result
 
-                    # Dosyayı kaydet
-                    file_path = self._save_file(content, company_dir, filename)
-
-                    # Hash'leri kaydet
-                    self.downloaded_hashes[content_hash] = file_path
-                    self.downloaded_hashes[url_hash] = file_path
-
-                    logger.info(f"İndirildi: {filename}")
-                    result['success'] = True
-                    result['file_path'] = file_path
-                    return result
-
-                except requests.RequestException as e:
-                    logger.debug(f"İndirme hatası (deneme {attempt}): {str(e)}")
-                    if attempt == self.max_retries:
-                        raise
+                    except requests.RequestException as e:
+                        logger.debug(f"İndirme hatası (deneme {attempt}): {str(e)}")
+                        if attempt == self.max_retries:
+                            raise
 
         except requests.RequestException as e:
             result['error'] = f"İndirme hatası: {str(e)}"
@@ -474,28 +587,16 @@ class FileDownloader:
             bool: Uzantı geçerliyse True
         """
         lower_name = filename.lower()
-        return any(lower_name.endswith(ext) for ext in VALID_EXTENSIONS)
-
-    def _calculate_hash(self, content: bytes) -> str:
-        """
-        İçeriğin MD5 hash'ini hesaplar.
-
-        Args:
-            content: Dosya içeriği (bytes)
-
-        Returns:
-            str: MD5 hash
-        """
-        return hashlib.md5(content).hexdigest()
+        return lower_name.endswith(VALID_EXTENSIONS_TUPLE)
 
-    def _save_file(self, content: bytes, directory: str, filename: str) -> str:
+    def _store_file(self, temp_path: str, directory: str, filename: str) -> str:
         """
-        Dosyayı diske kaydeder.
+        İndirilmiş geçici dosyayı hedef adına taşır.
 
         Aynı isimde dosya varsa numaralandırır.
 
         Args:
-            content: Dosya içeriği
+            temp_path: Gövdenin yazıldığı geçici dosya
             directory: Hedef dizin
             filename: Dosya adı
 
@@ -514,9 +615,8 @@ class FileDownloader:
                 file_path = os.path.join(directory, new_filename)
                 counter += 1
 
-        # Dosyayı kaydet
-        with open(file_path, 'wb') as f:
-            f.write(content)
+        # Dosyayı taşı (aynı dizinde — kopyalama yok)
+        os.replace(temp_path, file_path)
 
         return file_path
 
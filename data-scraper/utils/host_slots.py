@@ -0,0 +1,46 @@
+"""
+Host Slots Module
+=================
+Host başına eşzamanlı bağlantı sınırı.
+
+Sayfa taramaları (catalog_strategies) ve katalog indirmeleri (file_downloader)
+aynı yardımcıyı kullanır. Her kullanım kendi havuz adıyla (pool) ayrı
+semaforlar alır; böylece tarama ve indirme sınırları birbirini etkilemez.
+"""
+
+import threading
+from functools import lru_cache
+from typing import Dict, Tuple
+from urllib.parse import urlparse
+
+# Aynı URL'ler (site adresi, alt sayfalar, her istekte host slot'u) defalarca
+# parse ediliyor; ParseResult değişmez olduğundan sonuç önbellekli paylaşılır.
+_urlparse = lru_cache(maxsize=16384)(urlparse)
+
+# (havuz, host) -> semafor
+_HOST_SLOTS: Dict[Tuple[str, str], threading.BoundedSemaphore] = {}
+_HOST_SLOTS_LOCK = threading.Lock()
+
+
+def host_slot(url: str, limit: int, pool: str = 'default') -> threading.BoundedSemaphore:
+    """
+    URL'nin host'una ait semaforu döndürür.
+
+    Semafor havuz ve host için ilk istekte `limit` (en az 1) ile oluşturulur;
+    `with host_slot(url, limit):` bloğu o host'a en fazla `limit` eşzamanlı
+    bağlantı açılmasını sağlar.
+
+    Args:
+        url: İstek atılacak URL
+        limit: Host başına eşzamanlı bağlantı sayısı
+        pool: Sınırın paylaşıldığı havuz adı (ör. 'crawl', 'download')
+
+    Returns:
+        threading.BoundedSemaphore
+    """
+    key = (pool, _urlparse(url).netloc)
+    with _HOST_SLOTS_LOCK:
+        slot = _HOST_SLOTS.get(key)
+        if slot is None:
+            slot = _HOST_SLOTS[key] = threading.BoundedSemaphore(max(1, limit))
+    return slot
@@ -0,0 +1,225 @@
+"""
+HTTP Cache Module
+=================
+Sayfa yanıtlarını çalıştırmalar arasında saklayan kalıcı önbellek.
+
+ETag / Last-Modified doğrulayıcısı olan HTML yanıtları SQLite'ta tutulur.
+Aynı URL tekrar istendiğinde If-None-Match / If-Modified-Since başlıklarıyla
+koşullu istek atılır; sunucu 304 dönerse gövde ağdan tekrar indirilmez,
+önbellekteki içerikle bir Response oluşturulur.
+
+Her istek sunucuda doğrulandığı için önbellek hiçbir zaman bayat içerik
+döndürmez; süre dolumu (expire) takibine gerek yoktur.
+
+Ayrıca 404/410 dönen URL'ler ayrı bir tabloda tutulur; tahmin edilen yaygın
+yollar (/katalog, /iletisim, ...) sonraki çalıştırmalarda belirli bir süre
+tekrar istenmez.
+"""
+
+import os
+import json
+import sqlite3
+import threading
+import time
+from typing import Callable, Iterable, Optional, Set, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from utils.logger import get_logger
+
+# Config'den ayarları al
+try:
+    from config.settings import HTTP_CACHE_FILE
+except ImportError:
+    HTTP_CACHE_FILE = os.path.join(r'D:\Sanayi Marketi Output', 'http_cache.sqlite')
+
+logger = get_logger(__name__)
+
+
+class HttpCache:
+    """
+    Koşullu GET ile çalışan SQLite tabanlı HTTP önbelleği.
+
+    Bağlantı ilk kullanımda açılır ve thread'ler arasında bir kilitle
+    paylaşılır (strateji alt sayfaları paralel çekilir).
+
+    Example:
+        >>> cache = HttpCache('/path/to/http_cache.sqlite')
+        >>> response = cache.get(session, 'https://example.com', timeout=10)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        """SQLite bağlantısını (gerekirse tabloyu oluşturarak) döndürür. Kilit altında çağrılır."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS pages ('
+                'url TEXT PRIMARY KEY, final_url TEXT, etag TEXT, last_modified TEXT, '
+                'headers TEXT, content BLOB, fetched_at REAL)'
+            )
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS missing (url TEXT PRIMARY KEY, checked_at REAL)'
+            )
+            self._conn = conn
+        return self._conn
+
+    def _load(self, url: str) -> Optional[Tuple]:
+        with self._lock:
+            return self._connection().execute(
+                'SELECT final_url, etag, last_modified, headers, content FROM pages WHERE url = ?',
+                (url,)
+            ).fetchone()
+
+    def _store(self, url: str, response: requests.Response) -> None:
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        content_type = response.headers.get('Content-Type', '')
+
+        # Doğrulayıcısı olmayan veya HTML olmayan yanıtlar saklanmaz
+        if not (etag or last_modified) or 'html' not in content_type.lower():
+            return
+
+        headers = json.dumps({'Content-Type': content_type})
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                'INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (url, response.url, etag, last_modified, headers, response.content, time.time())
+            )
+            conn.commit()
+
+    def get(self, session: requests.Session, url: str,
+            on_response: Optional[Callable[[requests.Response], None]] = None,
+            **kwargs) -> requests.Response:
+        """
+        Koşullu GET isteği atar.
+
+        Args:
+            session: İsteği atacak requests session'ı
+            url: İstenen URL
+            on_response: Sunucudan gelen (304 olmayan) yanıt önbelleğe
+                yazılmadan önce çağrılır (ör. stream edilen gövdeyi sınırlı okumak için)
+            **kwargs: session.get'e iletilen parametreler (headers, timeout, ...)
+
+        Returns:
+            requests.Response: 304 durumunda önbellekteki gövdeyle 200 yanıtı,
+            aksi halde sunucunun yanıtı
+        """
+        try:
+            entry = self._load(url)
+        except sqlite3.Error as e:
+            logger.debug(f"HTTP cache okunamadı: {e}")
+            entry = None
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if entry:
+            _, etag, last_modified, _, _ = entry
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        response = session.get(url, headers=headers, **kwargs)
+
+        if response.status_code == 304 and entry:
+            response.close()
+            return self._build_response(entry, response)
+
+        if on_response is not None:
+            on_response(response)
+
+        if response.status_code == 200:
+            try:
+                self._store(url, response)
+            except sqlite3.Error as e:
+                logger.debug(f"HTTP cache yazılamadı: {e}")
+
+        return response
+
+    def missing_urls(self, urls: Iterable[str], max_age: float) -> Set[str]:
+        """
+        Son `max_age` saniye içinde 404/410 döndüğü kaydedilmiş URL'leri döndürür.
+
+        Args:
+            urls: Sorgulanacak URL'ler
+            max_age: Kaydın geçerli sayılacağı en uzun süre (saniye)
+
+        Returns:
+            Set[str]: Verilen URL'lerden bilinen eksik olanlar
+        """
+        urls = list(urls)
+        if not urls:
+            return set()
+        placeholders = ','.join('?' * len(urls))
+        try:
+            with self._lock:
+                rows = self._connection().execute(
+                    f'SELECT url FROM missing WHERE checked_at >= ? AND url IN ({placeholders})',
+                    [time.time() - max_age, *urls]
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.debug(f"HTTP cache okunamadı: {e}")
+            return set()
+        return {row[0] for row in rows}
+
+    def mark_missing(self, urls: Iterable[str]) -> None:
+        """404/410 dönen URL'leri şimdiki zamanla kaydeder."""
+        now = time.time()
+        rows = [(url, now) for url in urls]
+        if not rows:
+            return
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.executemany('INSERT OR REPLACE INTO missing VALUES (?, ?)', rows)
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"HTTP cache yazılamadı: {e}")
+
+    @staticmethod
+    def _build_response(entry: Tuple, not_modified: requests.Response) -> requests.Response:
+        """Önbellek kaydından 200 yanıtı oluşturur."""
+        final_url, _, _, headers, content = entry
+
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.url = final_url
+        response.headers = CaseInsensitiveDict(json.loads(headers))
+        response._content = content
+        response.request = not_modified.request
+        response.elapsed = not_modified.elapsed
+        return response
+
+    def close(self) -> None:
+        """SQLite bağlantısını kapatır."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Süreç genelinde paylaşılan önbellek (strateji sayfaları ve 404 hafızası)
+_SHARED_CACHE: Optional[HttpCache] = None
+_SHARED_CACHE_LOCK = threading.Lock()
+
+
+def get_http_cache() -> HttpCache:
+    """
+    HTTP_CACHE_FILE üzerindeki paylaşılan HttpCache örneğini döndürür.
+
+    Örnek ilk çağrıda oluşturulur; SQLite bağlantısı ise ilk sorguda açılır.
+    """
+    global _SHARED_CACHE
+    if _SHARED_CACHE is None:
+        with _SHARED_CACHE_LOCK:
+            if _SHARED_CACHE is None:
+                _SHARED_CACHE = HttpCache(HTTP_CACHE_FILE)
+    return _SHARED_CACHE
@@ -11,7 +11,8 @@ Kullanım:
 """
 
 import re
-from typing import Tuple
+from functools import lru_cache
+from typing import List, Tuple
 
 from utils.logger import get_logger
 
@@ -47,24 +48,49 @@ def _normalize_tr(text: str) -> str:
     return text.translate(_TR_NORMALIZE_TABLE).lower()
 
 
-def _match_city(text: str) -> str:
+# Sabit pattern'lar (modül yüklenirken bir kez derlenir)
+_ZIP_PREFIX_RE = re.compile(r'^\s*\d{5}\s*')
+_ZIP_SUFFIX_RE = re.compile(r'\s*\d{5}\s*$')
+_WS_RE = re.compile(r'\s+')
+_DIGITS_ONLY_RE = re.compile(r'^\d+$')
+_DOOR_NO_RE = re.compile(r'\bno\b\s*[:.]\s*\d')
+_NON_ALPHA_RE = re.compile(r'[^a-z]')
+
+
+def _city_word_re(normalized_city: str) -> 're.Pattern':
+    return re.compile(r'\b' + re.escape(normalized_city) + r'\b')
+
+
+@lru_cache(maxsize=1)
+def _city_patterns() -> List[Tuple[str, 're.Pattern']]:
     """
-    Metinde 81 Türk ilinden birini arar.
+    (canonical şehir adı, derlenmiş kelime-sınırı pattern'ı) listesi.
 
-    Uzun isimler önce kontrol edilir (Kahramanmaraş > Maraş çakışmasını önler).
-    Eşleşme varsa canonical şehir adını (settings.py'deki yazımla) döndürür.
+    Uzun isimler önce gelir (Kahramanmaraş > Maraş çakışmasını önler). Liste
+    ilk kullanımda bir kez kurulur; her çağrıda 81 ili sıralayıp normalize
+    etmeye gerek kalmaz.
     """
     try:
         from config.settings import TURKISH_CITIES
     except ImportError:
         logger.warning("TURKISH_CITIES settings'den yüklenemedi")
-        return ''
+        return []
+
+    return [(city, _city_word_re(_normalize_tr(city)))
+            for city in sorted(TURKISH_CITIES, key=len, reverse=True)]
 
+
+def _match_city(text: str) -> str:
+    """
+    Metinde 81 Türk ilinden birini arar.
+
+    Uzun isimler önce kontrol edilir (Kahramanmaraş > Maraş çakışmasını önler).
+    Eşleşme varsa canonical şehir adını (settings.py'deki yazımla) döndürür.
+    """
     normalized = _normalize_tr(text)
 
-    for city in sorted(TURKISH_CITIES, key=len, reverse=True):
-        normalized_city = _normalize_tr(city)
-        if re.search(r'\b' + re.escape(normalized_city) + r'\b', normalized):
+    for city, pattern in _city_patterns():
+        if pattern.search(normalized):
             return city
 
     return ''
@@ -73,11 +99,11 @@ def _match_city(text: str) -> str:
 def _clean_component(text: str) -> str:
     """İlçe/şehir bileşenini temizler: ZIP kodu, noktalama, fazla boşluk."""
     # Baştaki ve sondaki 5 haneli ZIP kodunu kaldır
-    text = re.sub(r'^\s*\d{5}\s*', '', text)
-    text = re.sub(r'\s*\d{5}\s*$', '', text)
+    text = _ZIP_PREFIX_RE.sub('', text)
+    text = _ZIP_SUFFIX_RE.sub('', text)
     # Tire, em-dash, en-dash ve standart noktalama temizle
     text = text.strip(',./-\\;–—–— \t\n')
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _WS_RE.sub(' ', text).strip()
     return text
 
 
@@ -87,13 +113,13 @@ def _is_district_candidate(text: str, city_normalized: str) -> bool:
         return False
     normalized = _normalize_tr(text)
     # Sadece rakamlar → ZIP kodu, değil
-    if re.match(r'^\d+$', text):
+    if _DIGITS_ONLY_RE.match(text):
         return False
     # Rakamla başlıyorsa → posta kodu veya bina numarası (örn. "34522 Esenyurt")
-    if re.match(r'^\d', text.strip()):
+    if text.strip()[:1].isdigit():
         return False
     # "No:" veya "No." kalıbı → bina/kapı numarası (örn. "No:15", "No.7")
-    if re.search(r'\bno\b\s*[:.]\s*\d', normalized):
+    if _DOOR_NO_RE.search(normalized):
         return False
     # Şehir adıyla aynı → değil
     if normalized == city_normalized:
@@ -108,16 +134,16 @@ def _is_district_candidate(text: str, city_normalized: str) -> bool:
     if len(words) == 1:
         # Tek kelime: başı rakam veya street keyword → değil
         # (örn. "Sk." → "sk" normalize → keyword)
-        word_stem = re.split(r'[^a-z]', words[0])[0]  # "sk." → "sk", "no:15" → "no"
+        word_stem = _NON_ALPHA_RE.split(words[0])[0]  # "sk." → "sk", "no:15" → "no"
         if word_stem in _STREET_KEYWORDS:
             return False
     else:
         # Çok kelime: HERHANGİ biri street keyword veya rakamla başlıyorsa → değil
         for w in words:
-            stem = re.split(r'[^a-z]', w)[0]
+            stem = _NON_ALPHA_RE.split(w)[0]
             if stem in _STREET_KEYWORDS:
                 return False
-            if re.match(r'^\d', w):
+            if w[:1].isdigit():
                 return False
     return True
 
@@ -133,7 +159,7 @@ def _parse_from_address(address: str) -> Tuple[str, str]:
 
     # Şehrin POZİSYONUNU BUL — son oluşumu al
     # (şehir adı "Ankara Cad." gibi sokak adında da geçebilir — asıl yer genellikle sonda)
-    all_matches = list(re.finditer(r'\b' + re.escape(normalized_city) + r'\b', normalized_address))
+    all_matches = list(_city_word_re(normalized_city).finditer(normalized_address))
     if not all_matches:
         return city, ''
 
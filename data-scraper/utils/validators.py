@@ -14,22 +14,26 @@ from urllib.parse import urlparse
 # Config'den ayarları al
 try:
     from config.settings import (
-        VALID_EXTENSIONS,
+        VALID_EXTENSIONS_TUPLE,
         STATUS_SUCCESS,
         STATUS_PARTIAL,
         STATUS_FAILED,
         STATUS_ERROR,
         EMAIL_PATTERN,
+        EMAIL_RE,
         PHONE_PATTERN
     )
 except ImportError:
-    VALID_EXTENSIONS = ['.pdf', '.doc', '.docx', '.xls', '.xlsx']
+    VALID_EXTENSIONS_TUPLE = ('.doc', '.docx', '.pdf', '.xls', '.xlsx')
     STATUS_SUCCESS = 'SUCCESS'
     STATUS_PARTIAL = 'PARTIAL'
     STATUS_FAILED = 'FAILED'
     STATUS_ERROR = 'ERROR'
     EMAIL_PATTERN = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
     PHONE_PATTERN = r'(?:\+90|0)?[\s.-]?(?:\(?\d{3}\)?[\s.-]?)?\d{3}[\s.-]?\d{2}[\s.-]?\d{2}'
+    EMAIL_RE = re.compile(EMAIL_PATTERN)
+
+_NON_DIGIT_RE = re.compile(r'\D')
 
 
 def validate_catalog_exists(company_data: Dict[str, Any]) -> bool:
@@ -151,8 +155,7 @@ def validate_email(email: str) -> bool:
     if not email:
         return False
 
-    pattern = re.compile(EMAIL_PATTERN)
-    return bool(pattern.match(email.strip()))
+    return bool(EMAIL_RE.match(email.strip()))
 
 
 def validate_phone(phone: str) -> bool:
@@ -181,7 +184,7 @@ def validate_phone(phone: str) -> bool:
         return False
 
     # Sadece rakamları say
-    digits = re.sub(r'\D', '', phone)
+    digits = _NON_DIGIT_RE.sub('', phone)
 
     # Türkiye telefon numarası 10-12 haneli olmalı
     if len(digits) < 10 or len(digits) > 12:
@@ -218,11 +221,7 @@ def validate_catalog_url(url: str) -> bool:
         return False
 
     # Uzantı kontrolü
-    for ext in VALID_EXTENSIONS:
-        if path.endswith(ext.lower()):
-            return True
-
-    return False
+    return path.endswith(VALID_EXTENSIONS_TUPLE)
 
 
 def sanitize_filename(filename: str) -> str: